@@ -0,0 +1,292 @@
+"""
+Orderbook snapshot storage shared by the Deribit streaming examples.
+
+SimpleDataWriter appends snapshots to output.jsonl and to a hive-partitioned
+output.parquet/ dataset in a given data directory. JSONL lines are written
+on a background thread and parquet row groups in a worker process, so the
+streaming event loop never blocks on disk.
+"""
+
+import asyncio
+import json
+import shutil
+import signal
+import time
+import uuid
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from datetime import datetime
+from typing import List, Dict, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Fall back to the stdlib json encoder
+
+from src.data.ccxt_collector.ccxt_collector import OrderbookSnapshot
+from src.logging.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+# Arrow schema matching OrderbookSnapshot.to_dict() (10 levels per side)
+SNAPSHOT_SCHEMA = pa.schema(
+    [
+        ('symbol', pa.string()),
+        ('timestamp', pa.timestamp('us', tz='UTC')),
+        ('exchange', pa.string()),
+    ]
+    + [
+        (f'{column}{level}', pa.float64())
+        for level in range(1, 11)
+        for column in ('bid', 'bidamt', 'ask', 'askamt')
+    ]
+)
+
+# Parquet dataset is hive-partitioned by UTC date and symbol; those columns live in the path
+PARTITION_FILE_SCHEMA = SNAPSHOT_SCHEMA.remove(SNAPSHOT_SCHEMA.get_field_index('symbol'))
+
+# bid1, bidamt1, ask1, askamt1, bid2, ... in the order of a flattened (10, 4) level block
+LEVEL_FIELDS = PARTITION_FILE_SCHEMA.names[2:]
+
+# Low-level zstd: smaller files than snappy and faster reads, at similar write cost;
+# dictionary encoding (pyarrow's default) stays on for the repetitive columns
+PARQUET_COMPRESSION = 'zstd'
+PARQUET_COMPRESSION_LEVEL = 1
+
+# Open parquet writers by (dataset dir, file name, date, symbol); populated inside the
+# parquet worker process, so each partition's path is built once per session
+_parquet_writers: Dict[tuple, pq.ParquetWriter] = {}
+
+
+def _ignore_sigint():
+    """Leave Ctrl+C to the parent so in-flight parquet flushes can finish."""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+def append_parquet(
+    timestamps: List[datetime],
+    symbols: List[str],
+    exchanges: List[str],
+    levels: np.ndarray,
+    dataset_dir: Path,
+    file_name: str
+):
+    """
+    Append buffered snapshot columns to a hive-partitioned parquet dataset.
+    
+    Rows are grouped into date=YYYY-MM-DD/symbol=SYMBOL partitions, and
+    each partition keeps one ParquetWriter open, so every flush adds a row
+    group instead of rewriting existing data. Module-level so it can be
+    pickled and run in a worker process; files are finalized by
+    close_parquet().
+    
+    Args:
+        timestamps: Snapshot times, one per row
+        symbols: Snapshot symbols, one per row
+        exchanges: Snapshot exchanges, one per row
+        levels: (rows, 40) level block in LEVEL_FIELDS column order
+        dataset_dir: Root directory of the parquet dataset
+        file_name: Name of this session's file inside each partition
+    """
+    partitions: Dict[tuple, List[int]] = {}
+    for row, (timestamp, symbol) in enumerate(zip(timestamps, symbols)):
+        partitions.setdefault((timestamp.date(), symbol), []).append(row)
+    
+    for (date, symbol), rows in partitions.items():
+        key = (dataset_dir, file_name, date, symbol)
+        writer = _parquet_writers.get(key)
+        if writer is None:
+            path = dataset_dir / f"date={date.isoformat()}" / f"symbol={symbol}" / file_name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            writer = pq.ParquetWriter(
+                path,
+                PARTITION_FILE_SCHEMA,
+                compression=PARQUET_COMPRESSION,
+                compression_level=PARQUET_COMPRESSION_LEVEL
+            )
+            _parquet_writers[key] = writer
+        
+        # Fixed schema, level columns taken straight from the numeric block
+        block = levels[rows]
+        table = pa.Table.from_arrays(
+            [
+                pa.array([timestamps[i] for i in rows], type=pa.timestamp('us', tz='UTC')),
+                pa.array([exchanges[i] for i in rows], type=pa.string()),
+            ]
+            + [block[:, j] for j in range(block.shape[1])],
+            schema=PARTITION_FILE_SCHEMA
+        )
+        writer.write_table(table)
+
+
+def close_parquet():
+    """Write the parquet footers and close every open partition writer."""
+    while _parquet_writers:
+        _, writer = _parquet_writers.popitem()
+        writer.close()
+
+
+class SimpleDataWriter:
+    """
+    Simple data writer for streaming data.
+    Writes to output.jsonl and a date/symbol-partitioned output.parquet/
+    dataset in data_dir without timestamps in filenames.
+    """
+    
+    def __init__(self, data_dir: Path):
+        self.jsonl_path = data_dir / "output.jsonl"
+        self.parquet_path = data_dir / "output.parquet"  # Dataset directory
+        self._parquet_file = f"part-{uuid.uuid4().hex}.parquet"
+        self.buffer_size = 2048  # Snapshots per parquet row group
+        
+        # Parquet rows buffered column-wise: levels go straight into a
+        # preallocated float block, so no per-snapshot dict is pickled
+        self._timestamps: List[datetime] = []
+        self._symbols: List[str] = []
+        self._exchanges: List[str] = []
+        self._levels = self._new_level_block()
+        
+        # Serialized JSONL lines awaiting a write, flushed by size or age
+        self.jsonl_buffer = bytearray()
+        self.jsonl_flush_bytes = 64 * 1024
+        self.jsonl_flush_interval = 0.25  # Seconds
+        self._last_jsonl_flush = time.monotonic()
+        
+        # Parquet compression runs in a single worker process (keeps write order)
+        self._pool = ProcessPoolExecutor(max_workers=1, initializer=_ignore_sigint)
+        
+        # Clear existing files
+        if self.jsonl_path.exists():
+            self.jsonl_path.unlink()
+        if self.parquet_path.is_dir():
+            shutil.rmtree(self.parquet_path)
+        elif self.parquet_path.exists():
+            self.parquet_path.unlink()
+        
+        # Held open for the session instead of reopening on every flush
+        self._jsonl_fp = self.jsonl_path.open('ab')
+        # JSONL appends run on a single thread (keeps write order) so the
+        # event loop never blocks on disk
+        self._jsonl_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='jsonl-writer')
+            
+        logger.info("📝 Data will be written to %s and %s", self.jsonl_path, self.parquet_path)
+
+    def _new_level_block(self) -> np.ndarray:
+        """NaN-filled (buffer_size, 10, 4) block; missing levels stay NaN (null in parquet)."""
+        return np.full((self.buffer_size, 10, 4), np.nan)
+    
+    async def write(self, snapshot: OrderbookSnapshot):
+        """Write snapshot to storage."""
+        await self.write_batch([snapshot])
+
+    async def write_batch(self, snapshots: List[OrderbookSnapshot]):
+        """Write a batch of snapshots to storage, buffering JSONL output."""
+        for snapshot in snapshots:
+            data = snapshot.to_dict()
+            if orjson is not None:
+                # orjson encodes datetime natively (same ISO-8601 text as isoformat())
+                self.jsonl_buffer += orjson.dumps(data, option=orjson.OPT_APPEND_NEWLINE)
+            else:
+                line = json.dumps(data, default=datetime.isoformat)
+                self.jsonl_buffer += line.encode('utf-8') + b'\n'
+            
+            # Parquet row: same timestamp as the JSONL line, levels from the arrays
+            row = len(self._symbols)
+            bids = snapshot.bids[:10]
+            asks = snapshot.asks[:10]
+            self._levels[row, :len(bids), 0:2] = bids
+            self._levels[row, :len(asks), 2:4] = asks
+            self._timestamps.append(data['timestamp'])
+            self._symbols.append(snapshot.symbol)
+            self._exchanges.append(snapshot.exchange)
+            
+            if row + 1 == self.buffer_size:
+                await self.flush_parquet_async()
+        
+        if (
+            len(self.jsonl_buffer) >= self.jsonl_flush_bytes
+            or time.monotonic() - self._last_jsonl_flush >= self.jsonl_flush_interval
+        ):
+            await self.flush_jsonl_async()
+    
+    def _write_jsonl(self, data: bytearray):
+        """Append serialized lines to the JSONL file (runs on the writer thread)."""
+        self._jsonl_fp.write(data)
+        self._jsonl_fp.flush()
+    
+    def _take_jsonl_buffer(self) -> Optional[bytearray]:
+        """Hand off the buffered JSONL lines and start a fresh buffer."""
+        self._last_jsonl_flush = time.monotonic()
+        if not self.jsonl_buffer:
+            return None
+        
+        data = self.jsonl_buffer
+        self.jsonl_buffer = bytearray()
+        return data
+    
+    async def flush_jsonl_async(self):
+        """Append buffered JSONL lines to disk on the writer thread."""
+        data = self._take_jsonl_buffer()
+        if data is None:
+            return
+        
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._jsonl_pool, self._write_jsonl, data)
+    
+    def flush_jsonl(self):
+        """Append buffered JSONL lines to disk, blocking until written."""
+        data = self._take_jsonl_buffer()
+        if data is None:
+            return
+        
+        self._jsonl_pool.submit(self._write_jsonl, data).result()
+    
+    async def flush(self):
+        """Flush all buffered data to JSONL and parquet."""
+        await self.flush_jsonl_async()
+        await self.flush_parquet_async()
+    
+    def _take_parquet_columns(self) -> tuple:
+        """Hand off the buffered columns and start fresh ones (the worker pickles them later)."""
+        n = len(self._symbols)
+        columns = (
+            self._timestamps, self._symbols, self._exchanges,
+            self._levels[:n].reshape(n, -1)
+        )
+        self._timestamps, self._symbols, self._exchanges = [], [], []
+        self._levels = self._new_level_block()
+        return columns
+    
+    async def flush_parquet_async(self):
+        """Flush buffer to parquet file in the worker process."""
+        if not self._symbols:
+            return
+        
+        columns = self._take_parquet_columns()
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            self._pool, append_parquet, *columns, self.parquet_path, self._parquet_file
+        )
+            
+    def flush_parquet(self):
+        """Flush buffer to parquet file, blocking until the worker is done."""
+        if not self._symbols:
+            return
+        
+        columns = self._take_parquet_columns()
+        self._pool.submit(
+            append_parquet, *columns, self.parquet_path, self._parquet_file
+        ).result()
+    
+    def close(self):
+        """Write any buffered data, finalize both files and stop the parquet worker."""
+        self.flush_jsonl()
+        self._jsonl_pool.shutdown(wait=True)
+        self._jsonl_fp.close()
+        self.flush_parquet()
+        self._pool.submit(close_parquet).result()
+        self._pool.shutdown(wait=True)
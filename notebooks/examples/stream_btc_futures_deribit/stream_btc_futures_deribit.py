@@ -27,12 +27,19 @@ Examples:
 
 import asyncio
 import argparse
+import logging
+import signal
 import sys
-import json
-import pandas as pd
+import re
+import time
 from pathlib import Path
-from datetime import datetime
-from typing import List, Dict, Optional, Any
+from dataclasses import dataclass
+from typing import List, Dict, Optional
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None  # Fall back to the default asyncio event loop
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
@@ -43,6 +50,7 @@ from src.data.ccxt_collector.ccxt_collector import (
     OrderbookSnapshot
 )
 from src.logging.logger import setup_logging, get_logger
+from notebooks.examples.snapshot_writer import SimpleDataWriter
 
 
 # Define data directory
@@ -56,67 +64,35 @@ setup_logging(
     level="INFO",
     log_file=log_file,
     console=True,
-    colored=True
+    colored=True,
+    use_queue=True  # Format and write log records off the event loop
 )
 
 logger = get_logger(__name__)
 
+# Snapshot queue between the websocket callback and the monitor/writer consumer
+QUEUE_MAXSIZE = 10000
+BATCH_SIZE = 100
 
-class SimpleDataWriter:
-    """
-    Simple data writer for streaming data.
-    Writes to output.jsonl and output.parquet without timestamps in filenames.
-    """
-    
-    def __init__(self):
-        self.jsonl_path = DATA_DIR / "output.jsonl"
-        self.parquet_path = DATA_DIR / "output.parquet"
-        self.buffer: List[Dict[str, Any]] = []
-        self.buffer_size = 100  # Flush to parquet every 100 snapshots
-        
-        # Clear existing files
-        if self.jsonl_path.exists():
-            self.jsonl_path.unlink()
-        if self.parquet_path.exists():
-            self.parquet_path.unlink()
-            
-        logger.info(f"📝 Data will be written to {self.jsonl_path} and {self.parquet_path}")
 
-    async def write(self, snapshot: OrderbookSnapshot):
-        """Write snapshot to storage."""
-        data = snapshot.to_dict()
-        data['timestamp'] = snapshot.timestamp.isoformat()
-        
-        # Write to JSONL immediately
-        with self.jsonl_path.open('a') as f:
-            json.dump(data, f)
-            f.write('\n')
-            
-        # Add to buffer for Parquet
-        # For parquet, we need datetime objects for timestamp, not strings if we want proper types
-        parquet_data = snapshot.to_dict()
-        parquet_data['timestamp'] = snapshot.timestamp
-        self.buffer.append(parquet_data)
-        
-        if len(self.buffer) >= self.buffer_size:
-            self.flush_parquet()
-            
-    def flush_parquet(self):
-        """Flush buffer to parquet file."""
-        if not self.buffer:
-            return
-            
-        df = pd.DataFrame(self.buffer)
-        
-        # Append to parquet if exists, otherwise create
-        if self.parquet_path.exists():
-            existing_df = pd.read_parquet(self.parquet_path)
-            combined_df = pd.concat([existing_df, df], ignore_index=True)
-            combined_df.to_parquet(self.parquet_path, engine='pyarrow', compression='snappy', index=False)
-        else:
-            df.to_parquet(self.parquet_path, engine='pyarrow', compression='snappy', index=False)
-            
-        self.buffer.clear()
+@dataclass
+class SymbolState:
+    """Per-contract streaming statistics, updated in place on every snapshot."""
+    
+    __slots__ = ('count', 'ref_price', 'spread_n', 'spread_mean', 'spread_m2')
+    
+    count: int
+    ref_price: float  # Mid price at the last reported move (0.0 until first quote)
+    spread_n: int
+    spread_mean: float  # Running mean of bid/ask spread
+    spread_m2: float  # Sum of squared deviations from the mean (Welford)
+    
+    @property
+    def spread_std(self) -> float:
+        """Sample standard deviation of the spread."""
+        if self.spread_n < 2:
+            return 0.0
+        return (self.spread_m2 / (self.spread_n - 1)) ** 0.5
 
 
 class BTCFuturesMonitor:
@@ -127,12 +103,54 @@ class BTCFuturesMonitor:
     market activity across all expiries.
     """
     
-    def __init__(self):
-        self.update_count: Dict[str, int] = {}
-        self.start_time = datetime.now()
+    UP = "📈"
+    DOWN = "📉"
+    
+    def __init__(
+        self,
+        stop_event: Optional[asyncio.Event] = None,
+        max_errors: int = 10,
+        move_threshold: float = 0.001
+    ):
+        """
+        Args:
+            stop_event: Event set once max_errors stream errors have been seen
+            max_errors: Number of stream errors that ends the session early
+            move_threshold: Fractional mid-price move that triggers a log line
+                (0.001 = 0.1%), measured from the last reported price
+        """
+        # |delta| >= threshold * ref  <=>  |delta| * (1 / threshold) >= ref
+        self._move_scale = 1.0 / move_threshold
+        self.stop_event = stop_event
+        self.max_errors = max_errors
+        self.error_count = 0
+        self.state: Dict[str, SymbolState] = {}
+        self.start_time = time.monotonic()  # Monotonic clock for rate math
         self.total_updates = 0
+        
+        # Sorted symbol list, rebuilt only after a new symbol appears
+        self._sorted_symbols: List[str] = []
+        self._sorted_dirty = False
+    
+    @staticmethod
+    def _new_state() -> SymbolState:
+        """Empty statistics for a contract with no updates yet."""
+        return SymbolState(count=0, ref_price=0.0, spread_n=0, spread_mean=0.0, spread_m2=0.0)
     
-    async def on_orderbook_update(self, snapshot: OrderbookSnapshot):
+    def prealloc(self, symbols: List[str]):
+        """
+        Create state for all subscribed contracts up front.
+        
+        Builds the dict at its final size once instead of growing it
+        during the initial subscription burst.
+        
+        Args:
+            symbols: Contracts about to be subscribed
+        """
+        self.state = {symbol: self._new_state() for symbol in symbols}
+        self._sorted_dirty = True
+    
+    def on_orderbook_update(self, snapshot: OrderbookSnapshot):
         """
         Callback for orderbook updates with comprehensive logging.
         
@@ -141,23 +159,53 @@ class BTCFuturesMonitor:
         """
         symbol = snapshot.symbol
         
-        # Initialize tracking for new symbols
-        if symbol not in self.update_count:
-            self.update_count[symbol] = 0
-            logger.info(f"🎯 Started streaming {symbol}")
+        # Single lookup per update; initialize tracking for new symbols
+        state = self.state.get(symbol)
+        if state is None:
+            state = self.state[symbol] = self._new_state()
+            self._sorted_dirty = True
         
-        self.update_count[symbol] += 1
+        state.count += 1
         self.total_updates += 1
+        if state.count == 1:
+            logger.info("🎯 Started streaming %s", symbol)
+        
+        # Report significant mid-price moves; the percentage is only
+        # computed when the division-free threshold check fires
+        mid_price = snapshot.mid_price
+        if mid_price is not None:
+            ref = state.ref_price
+            if ref == 0.0:
+                state.ref_price = mid_price
+            else:
+                delta = mid_price - ref
+                if (delta if delta >= 0 else -delta) * self._move_scale >= ref:
+                    state.ref_price = mid_price
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info(
+                            "%s %s: $%.2f (%+.2f%%) | Spread: $%.2f",
+                            self.UP if delta > 0 else self.DOWN,
+                            symbol, mid_price, delta / ref * 100.0, snapshot.spread
+                        )
+        
+        # Update running spread mean and variance (Welford)
+        spread = snapshot.spread
+        if spread is not None:
+            state.spread_n += 1
+            delta = spread - state.spread_mean
+            state.spread_mean += delta / state.spread_n
+            state.spread_m2 += delta * (spread - state.spread_mean)
         
         # Periodic summary stats (every 100 updates per symbol)
-        count = self.update_count[symbol]
-        if count % 100 == 0:
-            elapsed = (datetime.now() - self.start_time).total_seconds()
+        count = state.count
+        if count % 100 == 0 and logger.isEnabledFor(logging.INFO):
+            elapsed = time.monotonic() - self.start_time
             rate = count / elapsed if elapsed > 0 else 0
+            avg_spread = state.spread_mean
             
             logger.info(
-                f"📊 {symbol}: {count} updates "
-                f"(~{rate:.1f}/sec)"
+                "📊 %s: %d updates (~%.1f/sec) | Avg spread: $%.2f",
+                symbol, count, rate, avg_spread
             )
     
     async def on_error(self, symbol: str, error: Exception):
@@ -168,7 +216,19 @@ class BTCFuturesMonitor:
             symbol: Symbol that encountered an error
             error: Exception that occurred
         """
-        logger.error(f"❌ Error streaming {symbol}: {error}")
+        logger.error("❌ Error streaming %s: %s", symbol, error)
+        
+        self.error_count += 1
+        if self.stop_event is not None and self.error_count >= self.max_errors:
+            logger.error("❌ %d stream errors, stopping session", self.error_count)
+            self.stop_event.set()
+    
+    def sorted_symbols(self) -> List[str]:
+        """Symbols seen so far in sorted order (cached between new symbols)."""
+        if self._sorted_dirty:
+            self._sorted_symbols = sorted(self.state)
+            self._sorted_dirty = False
+        return self._sorted_symbols
     
     def print_summary(self):
         """Print comprehensive summary statistics."""
@@ -176,24 +236,28 @@ class BTCFuturesMonitor:
         logger.info("📈 BTC FUTURES STREAMING SESSION SUMMARY")
         logger.info("=" * 70)
         
-        elapsed = (datetime.now() - self.start_time).total_seconds()
-        logger.info(f"⏱️  Duration: {elapsed:.1f} seconds ({elapsed/60:.1f} minutes)")
-        logger.info(f"🎯 Contracts tracked: {len(self.update_count)}")
-        logger.info(f"📡 Total updates: {self.total_updates:,}")
-        logger.info(f"📊 Avg update rate: {self.total_updates/elapsed:.1f} updates/sec")
+        elapsed = time.monotonic() - self.start_time
+        logger.info("⏱️  Duration: %.1f seconds (%.1f minutes)", elapsed, elapsed / 60)
+        logger.info("🎯 Contracts tracked: %d", len(self.state))
+        logger.info("📡 Total updates: %s", format(self.total_updates, ","))
+        logger.info("📊 Avg update rate: %.1f updates/sec", self.total_updates / elapsed)
         logger.info("")
         logger.info("Per-Contract Statistics:")
         logger.info("-" * 70)
         
         # Sort by expiry (chronologically)
-        sorted_symbols = sorted(self.update_count.keys())
-        
-        for symbol in sorted_symbols:
-            count = self.update_count[symbol]
+        for symbol in self.sorted_symbols():
+            state = self.state[symbol]
+            count = state.count
             rate = count / elapsed if elapsed > 0 else 0
             
-            logger.info(f"  {symbol}:")
-            logger.info(f"    Updates: {count:,} (~{rate:.1f}/sec)")
+            logger.info("  %s:", symbol)
+            logger.info("    Updates: %s (~%.1f/sec)", format(count, ","), rate)
+            if state.spread_n:
+                logger.info(
+                    "    Avg spread: $%.2f (std $%.2f)",
+                    state.spread_mean, state.spread_std
+                )
         
         logger.info("=" * 70)
 
@@ -225,21 +289,53 @@ async def get_btc_futures_with_expiry(
     
     # Apply expiry filters if specified
     if expiry_filters:
-        filtered = []
-        for symbol in futures_with_expiry:
-            for expiry in expiry_filters:
-                if expiry.upper() in symbol.upper():
-                    filtered.append(symbol)
-                    break
-        futures_with_expiry = filtered
-    
-    logger.info(f"✅ Found {len(futures_with_expiry)} BTC futures with expiries")
+        # One compiled alternation, matched case-insensitively in a single pass
+        expiry_pattern = re.compile(
+            '|'.join(re.escape(expiry) for expiry in expiry_filters), re.IGNORECASE
+        )
+        futures_with_expiry = [
+            symbol for symbol in futures_with_expiry
+            if expiry_pattern.search(symbol)
+        ]
+    
+    logger.info("✅ Found %d BTC futures with expiries", len(futures_with_expiry))
     for symbol in sorted(futures_with_expiry):
-        logger.info(f"   - {symbol}")
+        logger.info("   - %s", symbol)
     
     return futures_with_expiry
 
 
+async def consume_snapshots(
+    queue: asyncio.Queue,
+    monitor: BTCFuturesMonitor,
+    writer: SimpleDataWriter,
+    batch_size: int = BATCH_SIZE
+):
+    """
+    Drain queued snapshots in batches and hand them to the monitor and writer.
+    
+    Args:
+        queue: Queue filled by the orderbook callback
+        monitor: Monitor receiving every snapshot
+        writer: Writer receiving each batch in a single call
+        batch_size: Maximum number of snapshots handled per batch
+    """
+    while True:
+        batch = [await queue.get()]
+        while len(batch) < batch_size and not queue.empty():
+            batch.append(queue.get_nowait())
+        
+        try:
+            for snapshot in batch:
+                monitor.on_orderbook_update(snapshot)
+            await writer.write_batch(batch)
+        except Exception as e:
+            logger.error("❌ Error processing snapshot batch: %s", e, exc_info=True)
+        finally:
+            for _ in batch:
+                queue.task_done()
+
+
 async def stream_btc_futures(
     duration: int = 60,
     expiry_filters: Optional[List[str]] = None
@@ -254,33 +350,55 @@ async def stream_btc_futures(
     logger.info("=" * 70)
     logger.info("🚀 BTC FUTURES STREAMING - DERIBIT")
     logger.info("=" * 70)
-    logger.info(f"⏱️  Duration: {duration} seconds ({duration/60:.1f} minutes)")
+    logger.info("⏱️  Duration: %s seconds (%.1f minutes)", duration, duration / 60)
     if expiry_filters:
-        logger.info(f"🔍 Filtering expiries: {', '.join(expiry_filters)}")
+        logger.info("🔍 Filtering expiries: %s", ', '.join(expiry_filters))
     logger.info("-" * 70)
     
     # Create monitor and writer
-    monitor = BTCFuturesMonitor()
-    writer = SimpleDataWriter()
+    stop_event = asyncio.Event()
+    monitor = BTCFuturesMonitor(stop_event=stop_event)
+    writer = SimpleDataWriter(DATA_DIR)
+    
+    # Hand snapshots off to a single consumer task instead of awaiting
+    # the monitor and writer inline for every websocket message
+    queue: asyncio.Queue = asyncio.Queue(maxsize=QUEUE_MAXSIZE)
+    consumer_task = asyncio.create_task(consume_snapshots(queue, monitor, writer))
     
-    # Combined callback for monitoring and recording
-    async def combined_callback(snapshot: OrderbookSnapshot):
-        """Combined callback for monitoring and recording."""
-        await monitor.on_orderbook_update(snapshot)
-        await writer.write(snapshot)
+    dropped = 0
+    
+    def enqueue_snapshot(snapshot: OrderbookSnapshot):
+        """Queue snapshot for monitoring and recording without blocking the stream."""
+        nonlocal dropped
+        try:
+            queue.put_nowait(snapshot)
+        except asyncio.QueueFull:
+            dropped += 1
+            if dropped == 1 or dropped % 1000 == 0:
+                logger.warning("⚠️  Snapshot queue full, dropped %d snapshots so far", dropped)
     
     # Configure collector
     config = StreamConfig(
         exchange_id='deribit',
         testnet=False,  # Production
         orderbook_limit=10,
-        on_orderbook_update=combined_callback,
+        on_orderbook_update=enqueue_snapshot,
         on_error=monitor.on_error
     )
     
     # Create and start collector
     collector = CCXTProCollector(config)
     
+    # Ctrl+C / SIGTERM end the session through the stop event
+    loop = asyncio.get_running_loop()
+    handled_signals = []
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop_event.set)
+            handled_signals.append(sig)
+        except (NotImplementedError, RuntimeError):
+            pass  # Not supported on this platform; KeyboardInterrupt still applies
+    
     try:
         # Initialize connection
         await collector.start()
@@ -295,31 +413,49 @@ async def stream_btc_futures(
             logger.warning("⚠️  No BTC futures found matching criteria")
             return
         
+        monitor.prealloc(futures_symbols)
+        
         # Subscribe to futures
-        logger.info(f"📡 Subscribing to {len(futures_symbols)} futures contracts...")
+        logger.info("📡 Subscribing to %d futures contracts...", len(futures_symbols))
         await collector.subscribe_futures(futures_symbols)
         
         # Stream for specified duration
-        logger.info(f"⏱️  Streaming started... (Press Ctrl+C to stop early)")
+        logger.info("⏱️  Streaming started... (Press Ctrl+C to stop early)")
         logger.info("-" * 70)
-        await asyncio.sleep(duration)
+        try:
+            await asyncio.wait_for(stop_event.wait(), timeout=duration)
+            logger.info("⚠️  Stop requested, ending stream early")
+        except asyncio.TimeoutError:
+            pass  # Ran for the full duration
         
     except KeyboardInterrupt:
         logger.info("\n⚠️  Stream interrupted by user")
     except Exception as e:
-        logger.error(f"❌ Unexpected error: {e}", exc_info=True)
+        logger.error("❌ Unexpected error: %s", e, exc_info=True)
     finally:
+        for sig in handled_signals:
+            loop.remove_signal_handler(sig)
+        
         # Stop collector
         logger.info("\n🛑 Stopping data stream...")
         await collector.stop()
         
+        # Drain queued snapshots before stopping the consumer
+        if not consumer_task.done():
+            await queue.join()
+        consumer_task.cancel()
+        await asyncio.gather(consumer_task, return_exceptions=True)
+        if dropped:
+            logger.warning("⚠️  Dropped %d snapshots because the queue was full", dropped)
+        
         # Flush remaining data
-        writer.flush_parquet()
+        await writer.flush()
+        writer.close()
         
         # Print summary
         monitor.print_summary()
         
-        logger.info(f"\n📝 Session log: {log_file}")
+        logger.info("\n📝 Session log: %s", log_file)
         logger.info("=" * 70)
 
 
@@ -368,8 +504,11 @@ async def main():
 
 
 if __name__ == '__main__':
+    # libuv-backed loop cuts per-message scheduling overhead for many concurrent streams
+    run = uvloop.run if uvloop is not None else asyncio.run
+    
     try:
-        asyncio.run(main())
+        run(main())
     except KeyboardInterrupt:
         print("\n👋 Goodbye!")
         sys.exit(0)
@@ -19,12 +19,17 @@ Examples:
 
 import asyncio
 import argparse
+import logging
+import signal
 import sys
-import json
-import pandas as pd
+import time
 from pathlib import Path
-from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Optional
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None  # Fall back to the default asyncio event loop
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
@@ -35,6 +40,7 @@ from src.data.ccxt_collector.ccxt_collector import (
     OrderbookSnapshot
 )
 from src.logging.logger import setup_logging, get_logger
+from notebooks.examples.snapshot_writer import SimpleDataWriter
 
 
 # Define data directory
@@ -48,100 +54,81 @@ setup_logging(
     level="INFO",
     log_file=log_file,
     console=True,
-    colored=True
+    colored=True,
+    use_queue=True  # Format and write log records off the event loop
 )
 
 logger = get_logger(__name__)
 
-
-class SimpleDataWriter:
-    """
-    Simple data writer for streaming data.
-    Writes to output.jsonl and output.parquet without timestamps in filenames.
-    """
-    
-    def __init__(self):
-        self.jsonl_path = DATA_DIR / "output.jsonl"
-        self.parquet_path = DATA_DIR / "output.parquet"
-        self.buffer: List[Dict[str, Any]] = []
-        self.buffer_size = 100  # Flush to parquet every 100 snapshots
-        
-        # Clear existing files
-        if self.jsonl_path.exists():
-            self.jsonl_path.unlink()
-        if self.parquet_path.exists():
-            self.parquet_path.unlink()
-            
-        logger.info(f"📝 Data will be written to {self.jsonl_path} and {self.parquet_path}")
-
-    async def write(self, snapshot: OrderbookSnapshot):
-        """Write snapshot to storage."""
-        data = snapshot.to_dict()
-        data['timestamp'] = snapshot.timestamp.isoformat()
-        
-        # Write to JSONL immediately
-        with self.jsonl_path.open('a') as f:
-            json.dump(data, f)
-            f.write('\n')
-            
-        # Add to buffer for Parquet
-        # For parquet, we need datetime objects for timestamp, not strings if we want proper types
-        parquet_data = snapshot.to_dict()
-        parquet_data['timestamp'] = snapshot.timestamp
-        self.buffer.append(parquet_data)
-        
-        if len(self.buffer) >= self.buffer_size:
-            self.flush_parquet()
-            
-    def flush_parquet(self):
-        """Flush buffer to parquet file."""
-        if not self.buffer:
-            return
-            
-        df = pd.DataFrame(self.buffer)
-        
-        # Append to parquet if exists, otherwise create
-        if self.parquet_path.exists():
-            existing_df = pd.read_parquet(self.parquet_path)
-            combined_df = pd.concat([existing_df, df], ignore_index=True)
-            combined_df.to_parquet(self.parquet_path, engine='pyarrow', compression='snappy', index=False)
-        else:
-            df.to_parquet(self.parquet_path, engine='pyarrow', compression='snappy', index=False)
-            
-        self.buffer.clear()
+# Snapshot queue between the websocket callback and the monitor/writer consumer
+QUEUE_MAXSIZE = 10000
+BATCH_SIZE = 100
 
 
 class FuturesStreamMonitor:
     """Monitor and display statistics for futures streaming."""
     
-    def __init__(self):
+    def __init__(self, stop_event: Optional[asyncio.Event] = None, max_errors: int = 10):
+        """
+        Args:
+            stop_event: Event set once max_errors stream errors have been seen
+            max_errors: Number of stream errors that ends the session early
+        """
+        self.stop_event = stop_event
+        self.max_errors = max_errors
+        self.error_count = 0
         self.update_count = {}
-        self.start_time = datetime.now()
+        self.start_time = time.monotonic()  # Monotonic clock for rate math
+        
+        # Sorted symbol list, rebuilt only after a new symbol appears
+        self._sorted_symbols: List[str] = []
+        self._sorted_dirty = False
     
-    async def on_orderbook_update(self, snapshot: OrderbookSnapshot):
+    def prealloc(self, symbols: List[str]):
+        """
+        Create counters for all subscribed symbols up front.
+        
+        Args:
+            symbols: Symbols about to be subscribed
+        """
+        self.update_count = dict.fromkeys(symbols, 0)
+        self._sorted_dirty = True
+    
+    def on_orderbook_update(self, snapshot: OrderbookSnapshot):
         """Callback for orderbook updates with logging and monitoring."""
         symbol = snapshot.symbol
         
-        # Update counters
-        if symbol not in self.update_count:
-            self.update_count[symbol] = 0
-            logger.info(f"🎯 Started receiving data for {symbol}")
-        
-        self.update_count[symbol] += 1
+        # Update counters (one lookup, one store)
+        count = self.update_count.get(symbol, 0) + 1
+        self.update_count[symbol] = count
+        if count == 1:
+            self._sorted_dirty = True
+            logger.info("🎯 Started receiving data for %s", symbol)
         
         # Log periodic statistics
-        count = self.update_count[symbol]
-        if count % 50 == 0:
-            elapsed = (datetime.now() - self.start_time).total_seconds()
+        if count % 50 == 0 and logger.isEnabledFor(logging.INFO):
+            elapsed = time.monotonic() - self.start_time
             rate = count / elapsed if elapsed > 0 else 0
             logger.info(
-                f"📊 {symbol}: {count} updates received "
-                f"(~{rate:.1f} updates/sec)"
+                "📊 %s: %d updates received (~%.1f updates/sec)",
+                symbol, count, rate
             )
     
     async def on_error(self, symbol: str, error: Exception):
         """Callback for errors."""
-        logger.error(f"❌ Error streaming {symbol}: {error}")
+        logger.error("❌ Error streaming %s: %s", symbol, error)
+        
+        self.error_count += 1
+        if self.stop_event is not None and self.error_count >= self.max_errors:
+            logger.error("❌ %d stream errors, stopping session", self.error_count)
+            self.stop_event.set()
+    
+    def sorted_symbols(self) -> List[str]:
+        """Symbols seen so far in sorted order (cached between new symbols)."""
+        if self._sorted_dirty:
+            self._sorted_symbols = sorted(self.update_count)
+            self._sorted_dirty = False
+        return self._sorted_symbols
     
     def print_summary(self):
         """Print summary statistics."""
@@ -149,19 +136,49 @@ class FuturesStreamMonitor:
         logger.info("📈 STREAMING SESSION SUMMARY")
         logger.info("=" * 60)
         
-        elapsed = (datetime.now() - self.start_time).total_seconds()
-        logger.info(f"Duration: {elapsed:.1f} seconds")
-        logger.info(f"Symbols tracked: {len(self.update_count)}")
+        elapsed = time.monotonic() - self.start_time
+        logger.info("Duration: %.1f seconds", elapsed)
+        logger.info("Symbols tracked: %d", len(self.update_count))
         
-        for symbol, count in sorted(self.update_count.items()):
+        for symbol in self.sorted_symbols():
+            count = self.update_count[symbol]
             rate = count / elapsed if elapsed > 0 else 0
-            logger.info(
-                f"  {symbol}: {count} updates (~{rate:.1f}/sec)"
-            )
+            logger.info("  %s: %d updates (~%.1f/sec)", symbol, count, rate)
         
         logger.info("=" * 60)
 
 
+async def consume_snapshots(
+    queue: asyncio.Queue,
+    monitor: FuturesStreamMonitor,
+    writer: SimpleDataWriter,
+    batch_size: int = BATCH_SIZE
+):
+    """
+    Drain queued snapshots in batches and hand them to the monitor and writer.
+    
+    Args:
+        queue: Queue filled by the orderbook callback
+        monitor: Monitor receiving every snapshot
+        writer: Writer receiving each batch in a single call
+        batch_size: Maximum number of snapshots handled per batch
+    """
+    while True:
+        batch = [await queue.get()]
+        while len(batch) < batch_size and not queue.empty():
+            batch.append(queue.get_nowait())
+        
+        try:
+            for snapshot in batch:
+                monitor.on_orderbook_update(snapshot)
+            await writer.write_batch(batch)
+        except Exception as e:
+            logger.error("❌ Error processing snapshot batch: %s", e, exc_info=True)
+        finally:
+            for _ in batch:
+                queue.task_done()
+
+
 async def stream_futures(
     symbols: List[str],
     duration: int = 60
@@ -174,60 +191,100 @@ async def stream_futures(
         duration: How long to stream in seconds
     """
     logger.info("🚀 Starting Deribit Futures Data Stream")
-    logger.info(f"Symbols: {', '.join(symbols)}")
-    logger.info(f"Duration: {duration} seconds")
+    logger.info("Symbols: %s", ', '.join(symbols))
+    logger.info("Duration: %s seconds", duration)
     logger.info("-" * 60)
     
     # Create monitor and writer
-    monitor = FuturesStreamMonitor()
-    writer = SimpleDataWriter()
+    stop_event = asyncio.Event()
+    monitor = FuturesStreamMonitor(stop_event=stop_event)
+    writer = SimpleDataWriter(DATA_DIR)
+    
+    # Hand snapshots off to a single consumer task instead of awaiting
+    # the monitor and writer inline for every websocket message
+    queue: asyncio.Queue = asyncio.Queue(maxsize=QUEUE_MAXSIZE)
+    consumer_task = asyncio.create_task(consume_snapshots(queue, monitor, writer))
     
-    # Create combined callback
-    async def combined_callback(snapshot: OrderbookSnapshot):
-        """Combined callback for monitoring and recording."""
-        await monitor.on_orderbook_update(snapshot)
-        await writer.write(snapshot)
+    dropped = 0
+    
+    def enqueue_snapshot(snapshot: OrderbookSnapshot):
+        """Queue snapshot for monitoring and recording without blocking the stream."""
+        nonlocal dropped
+        try:
+            queue.put_nowait(snapshot)
+        except asyncio.QueueFull:
+            dropped += 1
+            if dropped == 1 or dropped % 1000 == 0:
+                logger.warning("⚠️  Snapshot queue full, dropped %d snapshots so far", dropped)
     
     # Configure collector
     config = StreamConfig(
         exchange_id='deribit',
         testnet=False,  # Use production
         orderbook_limit=10,
-        on_orderbook_update=combined_callback,
+        on_orderbook_update=enqueue_snapshot,
         on_error=monitor.on_error
     )
     
     # Create collector
     collector = CCXTProCollector(config)
     
+    # Ctrl+C / SIGTERM end the session through the stop event
+    loop = asyncio.get_running_loop()
+    handled_signals = []
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop_event.set)
+            handled_signals.append(sig)
+        except (NotImplementedError, RuntimeError):
+            pass  # Not supported on this platform; KeyboardInterrupt still applies
+    
     try:
         # Start collector
         await collector.start()
         
+        monitor.prealloc(symbols)
+        
         # Subscribe to futures
-        logger.info(f"📡 Subscribing to {len(symbols)} futures symbols...")
+        logger.info("📡 Subscribing to %d futures symbols...", len(symbols))
         await collector.subscribe_futures(symbols)
         
         # Stream for specified duration
-        logger.info(f"⏱️  Streaming for {duration} seconds... (Press Ctrl+C to stop early)")
-        await asyncio.sleep(duration)
+        logger.info("⏱️  Streaming for %s seconds... (Press Ctrl+C to stop early)", duration)
+        try:
+            await asyncio.wait_for(stop_event.wait(), timeout=duration)
+            logger.info("⚠️  Stop requested, ending stream early")
+        except asyncio.TimeoutError:
+            pass  # Ran for the full duration
         
     except KeyboardInterrupt:
         logger.info("\n⚠️  Stream interrupted by user")
     except Exception as e:
-        logger.error(f"❌ Unexpected error: {e}", exc_info=True)
+        logger.error("❌ Unexpected error: %s", e, exc_info=True)
     finally:
+        for sig in handled_signals:
+            loop.remove_signal_handler(sig)
+        
         # Stop collector
         logger.info("🛑 Stopping data stream...")
         await collector.stop()
         
+        # Drain queued snapshots before stopping the consumer
+        if not consumer_task.done():
+            await queue.join()
+        consumer_task.cancel()
+        await asyncio.gather(consumer_task, return_exceptions=True)
+        if dropped:
+            logger.warning("⚠️  Dropped %d snapshots because the queue was full", dropped)
+        
         # Flush remaining data
-        writer.flush_parquet()
+        await writer.flush()
+        writer.close()
         
         # Print summary
         monitor.print_summary()
         
-        logger.info(f"\n📄 Session log saved to: {log_file}")
+        logger.info("\n📄 Session log saved to: %s", log_file)
 
 
 def parse_args():
@@ -276,8 +333,11 @@ async def main():
 
 
 if __name__ == '__main__':
+    # libuv-backed loop cuts per-message scheduling overhead for many concurrent streams
+    run = uvloop.run if uvloop is not None else asyncio.run
+    
     try:
-        asyncio.run(main())
+        run(main())
     except KeyboardInterrupt:
         logger.info("\n👋 Goodbye!")
         sys.exit(0)
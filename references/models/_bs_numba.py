@@ -0,0 +1,75 @@
+"""
+Numba-compiled Black-Scholes kernels.
+
+Optional accelerators for BlackScholes.price_chain and
+BlackScholes.implied_volatility_vec; importing this module raises
+ImportError when numba is not installed.
+"""
+
+import math
+
+from numba import njit, prange
+
+_SQRT_2 = math.sqrt(2.0)
+_INV_SQRT_2PI = 1.0 / math.sqrt(2.0 * math.pi)
+
+
+@njit(fastmath=True)
+def _norm_cdf(x):
+    return 0.5 * math.erfc(-x / _SQRT_2)
+
+
+@njit(parallel=True, fastmath=True)
+def price_chain(S, K, T, r, sigma, is_call, out):
+    """
+    Price each option in place.
+
+    All inputs are 1-D arrays of equal length; results are written to out.
+    """
+    for i in prange(S.shape[0]):
+        vol_sqrt_T = sigma[i] * math.sqrt(T[i])
+        d1 = (math.log(S[i] / K[i]) + (r[i] + 0.5 * sigma[i] * sigma[i]) * T[i]) / vol_sqrt_T
+        d2 = d1 - vol_sqrt_T
+        discounted_K = K[i] * math.exp(-r[i] * T[i])
+
+        if is_call[i]:
+            out[i] = S[i] * _norm_cdf(d1) - discounted_K * _norm_cdf(d2)
+        else:
+            out[i] = discounted_K * _norm_cdf(-d2) - S[i] * _norm_cdf(-d1)
+
+
+@njit(parallel=True, fastmath=True)
+def iv_newton(prices, S, K, T, r, is_call, out, max_iter, tol):
+    """
+    Solve implied volatility for each option in place.
+
+    All inputs are 1-D arrays of equal length; results are written to out.
+    Uses the same initial guess and stopping rule as the NumPy solver.
+    """
+    for i in prange(prices.shape[0]):
+        sqrt_T = math.sqrt(T[i])
+        log_moneyness = math.log(S[i] / K[i])
+        discounted_K = K[i] * math.exp(-r[i] * T[i])
+
+        # Initial guess using Brenner-Subrahmanyam approximation
+        sigma = math.sqrt(2 * math.pi / T[i]) * (prices[i] / S[i])
+
+        for _ in range(max_iter):
+            vol_sqrt_T = sigma * sqrt_T
+            d1 = (log_moneyness + (r[i] + 0.5 * sigma * sigma) * T[i]) / vol_sqrt_T
+            d2 = d1 - vol_sqrt_T
+
+            if is_call[i]:
+                price_est = S[i] * _norm_cdf(d1) - discounted_K * _norm_cdf(d2)
+            else:
+                price_est = discounted_K * _norm_cdf(-d2) - S[i] * _norm_cdf(-d1)
+            vega = S[i] * _INV_SQRT_2PI * math.exp(-0.5 * d1 * d1) * sqrt_T
+
+            diff = price_est - prices[i]
+            if abs(diff) < tol or vega < 1e-10:
+                break
+
+            # Ensure sigma stays positive
+            sigma = max(sigma - diff / vega, 1e-6)
+
+        out[i] = sigma
@@ -0,0 +1,38 @@
+"""
+Numba-compiled SVI total-variance kernels.
+
+Optional accelerators for SVIModel.predict and SurfaceSVI.predict_grid;
+importing this module raises ImportError when numba is not installed.
+"""
+
+import math
+
+from numba import njit, prange
+
+
+@njit(fastmath=True)
+def svi_total_variance(k, a, b, rho, m, sigma, out):
+    """
+    Evaluate raw SVI total variance for each log-moneyness in k, in place.
+
+    Single fused loop: no temporaries for (k - m), its square or the sqrt.
+    """
+    sigma_sq = sigma * sigma
+    for i in range(k.shape[0]):
+        d = k[i] - m
+        out[i] = a + b * (rho * d + math.sqrt(d * d + sigma_sq))
+
+
+@njit(parallel=True, fastmath=True)
+def svi_total_variance_grid(k, a, b, rho, m, sigma, out):
+    """
+    Evaluate raw SVI total variance on a (log-moneyness x maturity) grid.
+
+    Parameters are per-maturity arrays; out has shape (len(k), len(a)) and
+    each row is written contiguously.
+    """
+    n_slices = a.shape[0]
+    for i in prange(k.shape[0]):
+        for j in range(n_slices):
+            d = k[i] - m[j]
+            out[i, j] = a[j] + b[j] * (rho[j] * d + math.sqrt(d * d + sigma[j] * sigma[j]))
@@ -2,9 +2,104 @@
 Options Greeks calculations.
 """
 
+import json
+
 import numpy as np
-from scipy.stats import norm
-from typing import Dict
+from typing import Dict, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Fall back to the stdlib json encoder
+
+from .pricing import _cdf, _pdf
+
+ArrayLike = Union[float, np.ndarray]
+
+
+def _d1_d2_terms(S: ArrayLike, K: ArrayLike, T: ArrayLike, r: ArrayLike, sigma: ArrayLike):
+    """
+    Shared Black-Scholes terms, computed once per option.
+    
+    Returns:
+        Tuple of (d1, d2, sqrt(T), pdf(d1), cdf(d1), cdf(d2), exp(-rT))
+    """
+    sqrt_T = np.sqrt(T)
+    vol_sqrt_T = sigma * sqrt_T
+    d1 = (np.log(S / K) + (r + 0.5 * sigma**2) * T) / vol_sqrt_T
+    d2 = d1 - vol_sqrt_T
+    return d1, d2, sqrt_T, _pdf(d1), _cdf(d1), _cdf(d2), np.exp(-r * T)
+
+
+def all_greeks(
+    S: ArrayLike,
+    K: ArrayLike,
+    T: ArrayLike,
+    r: ArrayLike,
+    sigma: ArrayLike,
+    is_call: Union[bool, np.ndarray] = True,
+) -> Dict[str, ArrayLike]:
+    """
+    Calculate delta, gamma, vega, theta and rho in one pass.
+    
+    Inputs may be scalars or NumPy arrays (broadcast together), so a whole
+    portfolio can be evaluated at once. d1/d2, the normal pdf/cdf and the
+    discount factor are computed once and shared by every Greek.
+    
+    Args:
+        S: Spot price
+        K: Strike price
+        T: Time to expiration (in years)
+        r: Risk-free rate
+        sigma: Volatility
+        is_call: True for calls, False for puts (bool or boolean array)
+    
+    Returns:
+        Dictionary with delta, gamma, vega (per 1% vol), theta (per day)
+        and rho (per 1% rate)
+    """
+    _, _, sqrt_T, pdf_d1, cdf_d1, cdf_d2, discount = _d1_d2_terms(S, K, T, r, sigma)
+    discounted_K = K * discount
+    
+    # Put legs use N(-x) = 1 - N(x)
+    decay = -S * pdf_d1 * sigma / (2 * sqrt_T)
+    carry_call = discounted_K * cdf_d2
+    carry_put = discounted_K * (1 - cdf_d2)
+    
+    return {
+        'delta': np.where(is_call, cdf_d1, cdf_d1 - 1),
+        'gamma': pdf_d1 / (S * sigma * sqrt_T),
+        'vega': S * pdf_d1 * sqrt_T / 100,
+        'theta': np.where(is_call, decay - r * carry_call, decay + r * carry_put) / 365,
+        'rho': np.where(is_call, T * carry_call, -T * carry_put) / 100,
+    }
+
+
+def dump_greeks(
+    S: ArrayLike,
+    K: ArrayLike,
+    T: ArrayLike,
+    r: ArrayLike,
+    sigma: ArrayLike,
+    is_call: Union[bool, np.ndarray] = True,
+) -> bytes:
+    """
+    Calculate Greeks for a batch of options and serialize them to JSON.
+    
+    Each Greek is emitted as one array (a list per key), so orjson can
+    write whole NumPy arrays instead of boxing every float.
+    
+    Returns:
+        UTF-8 JSON bytes mapping each Greek to a list of values
+    """
+    greeks = {
+        name: np.atleast_1d(value)
+        for name, value in all_greeks(S, K, T, r, sigma, is_call).items()
+    }
+    
+    if orjson is not None:
+        return orjson.dumps(greeks, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps({name: value.tolist() for name, value in greeks.items()}).encode('utf-8')
 
 
 class GreeksCalculator:
@@ -20,9 +115,9 @@ class GreeksCalculator:
         d1 = (np.log(S / K) + (r + 0.5 * sigma**2) * T) / (sigma * np.sqrt(T))
         
         if option_type.lower() == "call":
-            return norm.cdf(d1)
+            return _cdf(d1)
         else:  # put
-            return norm.cdf(d1) - 1
+            return _cdf(d1) - 1
     
     @staticmethod
     def gamma(S: float, K: float, T: float, r: float, sigma: float) -> float:
@@ -32,7 +127,7 @@ class GreeksCalculator:
         Rate of change of delta with respect to underlying price.
         """
         d1 = (np.log(S / K) + (r + 0.5 * sigma**2) * T) / (sigma * np.sqrt(T))
-        return norm.pdf(d1) / (S * sigma * np.sqrt(T))
+        return _pdf(d1) / (S * sigma * np.sqrt(T))
     
     @staticmethod
     def vega(S: float, K: float, T: float, r: float, sigma: float) -> float:
@@ -42,7 +137,7 @@ class GreeksCalculator:
         Sensitivity to volatility (returns vega per 1% change in vol).
         """
         d1 = (np.log(S / K) + (r + 0.5 * sigma**2) * T) / (sigma * np.sqrt(T))
-        return S * norm.pdf(d1) * np.sqrt(T) / 100
+        return S * _pdf(d1) * np.sqrt(T) / 100
     
     @staticmethod
     def theta(S: float, K: float, T: float, r: float, sigma: float, option_type: str = "call") -> float:
@@ -51,19 +146,13 @@ class GreeksCalculator:
         
         Time decay - change in option value per day.
         """
-        d1 = (np.log(S / K) + (r + 0.5 * sigma**2) * T) / (sigma * np.sqrt(T))
-        d2 = d1 - sigma * np.sqrt(T)
+        _, _, sqrt_T, pdf_d1, _, cdf_d2, discount = _d1_d2_terms(S, K, T, r, sigma)
+        decay = -S * pdf_d1 * sigma / (2 * sqrt_T)
         
         if option_type.lower() == "call":
-            theta = (
-                -S * norm.pdf(d1) * sigma / (2 * np.sqrt(T))
-                - r * K * np.exp(-r * T) * norm.cdf(d2)
-            )
+            theta = decay - r * K * discount * cdf_d2
         else:  # put
-            theta = (
-                -S * norm.pdf(d1) * sigma / (2 * np.sqrt(T))
-                + r * K * np.exp(-r * T) * norm.cdf(-d2)
-            )
+            theta = decay + r * K * discount * (1 - cdf_d2)
         
         return theta / 365  # Per day
     
@@ -77,22 +166,19 @@ class GreeksCalculator:
         d2 = (np.log(S / K) + (r - 0.5 * sigma**2) * T) / (sigma * np.sqrt(T))
         
         if option_type.lower() == "call":
-            return K * T * np.exp(-r * T) * norm.cdf(d2) / 100
+            return K * T * np.exp(-r * T) * _cdf(d2) / 100
         else:  # put
-            return -K * T * np.exp(-r * T) * norm.cdf(-d2) / 100
+            return -K * T * np.exp(-r * T) * _cdf(-d2) / 100
     
     @staticmethod
     def all_greeks(S: float, K: float, T: float, r: float, sigma: float, option_type: str = "call") -> Dict[str, float]:
         """
         Calculate all Greeks at once.
         
+        Scalar wrapper around the vectorized module-level all_greeks().
+        
         Returns:
             Dictionary with delta, gamma, vega, theta, rho
         """
-        return {
-            'delta': GreeksCalculator.delta(S, K, T, r, sigma, option_type),
-            'gamma': GreeksCalculator.gamma(S, K, T, r, sigma),
-            'vega': GreeksCalculator.vega(S, K, T, r, sigma),
-            'theta': GreeksCalculator.theta(S, K, T, r, sigma, option_type),
-            'rho': GreeksCalculator.rho(S, K, T, r, sigma, option_type)
-        }
+        greeks = all_greeks(S, K, T, r, sigma, option_type.lower() == "call")
+        return {name: float(value) for name, value in greeks.items()}
@@ -2,10 +2,34 @@
 Options pricing models.
 """
 
+import math
+
 import numpy as np
-from scipy.stats import norm
+from scipy.special import ndtr
 from typing import Union
 
+try:
+    # Aliased: BlackScholes.price_chain would otherwise shadow the kernel's name
+    from ._bs_numba import iv_newton as _iv_newton_kernel
+    from ._bs_numba import price_chain as _price_chain_kernel
+except ImportError:
+    _iv_newton_kernel = None  # Fall back to the NumPy implementations
+    _price_chain_kernel = None
+
+_INV_SQRT_2PI = 1.0 / math.sqrt(2 * math.pi)
+
+# Module-level aliases skip the np attribute lookup on every pricing call
+_log = np.log
+_sqrt = np.sqrt
+_exp = np.exp
+
+# Standard normal CDF/PDF without scipy.stats' rv_continuous dispatch overhead
+_cdf = ndtr
+
+
+def _pdf(x):
+    return _INV_SQRT_2PI * _exp(-0.5 * x * x)
+
 
 class BlackScholes:
     """
@@ -40,18 +64,73 @@ class BlackScholes:
         if T <= 0:
             return max(S - K, 0) if option_type == "call" else max(K - S, 0)
         
-        d1 = (np.log(S / K) + (r + 0.5 * sigma**2) * T) / (sigma * np.sqrt(T))
-        d2 = d1 - sigma * np.sqrt(T)
+        vol_sqrt_T = sigma * _sqrt(T)
+        d1 = (_log(S / K) + (r + 0.5 * sigma**2) * T) / vol_sqrt_T
+        d2 = d1 - vol_sqrt_T
+        discounted_K = K * _exp(-r * T)
         
-        if option_type.lower() == "call":
-            price = S * norm.cdf(d1) - K * np.exp(-r * T) * norm.cdf(d2)
-        elif option_type.lower() == "put":
-            price = K * np.exp(-r * T) * norm.cdf(-d2) - S * norm.cdf(-d1)
+        option_type = option_type.lower()
+        if option_type == "call":
+            price = S * _cdf(d1) - discounted_K * _cdf(d2)
+        elif option_type == "put":
+            price = discounted_K * _cdf(-d2) - S * _cdf(-d1)
         else:
             raise ValueError("option_type must be 'call' or 'put'")
         
         return price
     
+    @staticmethod
+    def price_chain(
+        S: Union[float, np.ndarray],
+        K: Union[float, np.ndarray],
+        T: Union[float, np.ndarray],
+        r: Union[float, np.ndarray],
+        sigma: Union[float, np.ndarray],
+        is_call: Union[bool, np.ndarray] = True
+    ) -> np.ndarray:
+        """
+        Calculate Black-Scholes prices for a whole option chain at once.
+        
+        Inputs are broadcast together; all expiries must be positive. Uses
+        the numba kernel in _bs_numba when numba is installed.
+        
+        Args:
+            S: Spot prices
+            K: Strike prices
+            T: Times to expiry (years)
+            r: Risk-free rates
+            sigma: Volatilities (annualized)
+            is_call: True for calls, False for puts (bool or boolean array)
+            
+        Returns:
+            Array of option prices
+        """
+        S, K, T, r, sigma, is_call = np.broadcast_arrays(S, K, T, r, sigma, is_call)
+        
+        if _price_chain_kernel is not None:
+            out = np.empty(S.size)
+            _price_chain_kernel(
+                np.ascontiguousarray(S, dtype=float).ravel(),
+                np.ascontiguousarray(K, dtype=float).ravel(),
+                np.ascontiguousarray(T, dtype=float).ravel(),
+                np.ascontiguousarray(r, dtype=float).ravel(),
+                np.ascontiguousarray(sigma, dtype=float).ravel(),
+                np.ascontiguousarray(is_call, dtype=bool).ravel(),
+                out,
+            )
+            return out.reshape(S.shape)
+        
+        vol_sqrt_T = sigma * _sqrt(T)
+        d1 = (_log(S / K) + (r + 0.5 * sigma**2) * T) / vol_sqrt_T
+        d2 = d1 - vol_sqrt_T
+        discounted_K = K * _exp(-r * T)
+        
+        return np.where(
+            is_call,
+            S * _cdf(d1) - discounted_K * _cdf(d2),
+            discounted_K * _cdf(-d2) - S * _cdf(-d1),
+        )
+    
     @staticmethod
     def implied_volatility(
         price: float,
@@ -79,30 +158,100 @@ class BlackScholes:
         Returns:
             Implied volatility
         """
+        option_type = option_type.lower()
+        if option_type not in ("call", "put"):
+            raise ValueError("option_type must be 'call' or 'put'")
+        
+        sigma = BlackScholes.implied_volatility_vec(
+            price, S, K, T, r, option_type == "call", max_iterations, tolerance
+        )
+        return float(sigma)
+    
+    @staticmethod
+    def implied_volatility_vec(
+        prices: Union[float, np.ndarray],
+        S: Union[float, np.ndarray],
+        K: Union[float, np.ndarray],
+        T: Union[float, np.ndarray],
+        r: Union[float, np.ndarray],
+        is_call: Union[bool, np.ndarray] = True,
+        max_iterations: int = 100,
+        tolerance: float = 1e-6
+    ) -> np.ndarray:
+        """
+        Calculate implied volatilities for a whole option chain at once.
+        
+        Runs Newton-Raphson on arrays (inputs are broadcast together).
+        Each option stops updating once its price error is below tolerance
+        or its vega vanishes, and the loop exits when none are left. Uses
+        the numba kernel in _bs_numba when numba is installed.
+        
+        Args:
+            prices: Observed option prices
+            S: Spot prices
+            K: Strike prices
+            T: Times to expiry (years)
+            r: Risk-free rates
+            is_call: True for calls, False for puts (bool or boolean array)
+            max_iterations: Maximum iterations for convergence
+            tolerance: Convergence tolerance
+            
+        Returns:
+            Array of implied volatilities
+        """
+        prices, S, K, T, r, is_call = np.broadcast_arrays(
+            np.asarray(prices, dtype=float), S, K, T, r, is_call
+        )
+        
+        if _iv_newton_kernel is not None:
+            out = np.empty(prices.size)
+            _iv_newton_kernel(
+                np.ascontiguousarray(prices).ravel(),
+                np.ascontiguousarray(S, dtype=float).ravel(),
+                np.ascontiguousarray(K, dtype=float).ravel(),
+                np.ascontiguousarray(T, dtype=float).ravel(),
+                np.ascontiguousarray(r, dtype=float).ravel(),
+                np.ascontiguousarray(is_call, dtype=bool).ravel(),
+                out,
+                max_iterations,
+                tolerance,
+            )
+            return out.reshape(prices.shape)
+        
+        sqrt_T = np.sqrt(T)
+        log_moneyness = np.log(S / K)
+        discounted_K = K * np.exp(-r * T)
+        
         # Initial guess using Brenner-Subrahmanyam approximation
-        sigma = np.sqrt(2 * np.pi / T) * (price / S)
+        sigma = np.sqrt(2 * np.pi / T) * (prices / S)
         
         for i in range(max_iterations):
-            price_est = BlackScholes.price(S, K, T, r, sigma, option_type)
-            vega = BlackScholes.vega(S, K, T, r, sigma)
-            
-            diff = price_est - price
+            vol_sqrt_T = sigma * sqrt_T
+            d1 = (log_moneyness + (r + 0.5 * sigma**2) * T) / vol_sqrt_T
+            d2 = d1 - vol_sqrt_T
             
-            if abs(diff) < tolerance:
-                return sigma
+            price_est = np.where(
+                is_call,
+                S * _cdf(d1) - discounted_K * _cdf(d2),
+                discounted_K * _cdf(-d2) - S * _cdf(-d1),
+            )
+            vega = S * _pdf(d1) * sqrt_T
             
-            if vega < 1e-10:
+            diff = price_est - prices
+            active = (np.abs(diff) >= tolerance) & (vega >= 1e-10)
+            if not active.any():
                 break
             
-            sigma = sigma - diff / vega
+            step = np.divide(diff, vega, out=np.zeros_like(diff), where=active)
             
-            # Ensure sigma stays positive
-            sigma = max(sigma, 1e-6)
+            # Ensure sigma stays positive; converged options keep their value
+            sigma = np.where(active, np.maximum(sigma - step, 1e-6), sigma)
         
         return sigma
     
     @staticmethod
     def vega(S: float, K: float, T: float, r: float, sigma: float) -> float:
         """Calculate vega (sensitivity to volatility)."""
-        d1 = (np.log(S / K) + (r + 0.5 * sigma**2) * T) / (sigma * np.sqrt(T))
-        return S * norm.pdf(d1) * np.sqrt(T)
+        sqrt_T = _sqrt(T)
+        d1 = (_log(S / K) + (r + 0.5 * sigma**2) * T) / (sigma * sqrt_T)
+        return S * _pdf(d1) * sqrt_T
@@ -2,10 +2,20 @@
 Volatility surface modeling and construction.
 """
 
+import math
+from itertools import combinations
+
 import numpy as np
 import pandas as pd
-from scipy.interpolate import griddata, RBFInterpolator
-from typing import Tuple, Optional
+from scipy.interpolate import griddata, RBFInterpolator, RegularGridInterpolator
+from scipy.optimize import minimize
+from typing import List, Tuple, Optional
+
+try:
+    from ._svi_numba import svi_total_variance, svi_total_variance_grid
+except ImportError:
+    svi_total_variance = None  # Fall back to the NumPy expression
+    svi_total_variance_grid = None
 
 
 class VolatilitySurface:
@@ -13,8 +23,11 @@ class VolatilitySurface:
     Construct and manage implied volatility surfaces.
     """
     
+    # Storage dtype for fitted strikes, expiries and IVs
+    dtype = np.float32
+    
     def __init__(self):
-        self.surface_data = None
+        self.surface_data = None  # Dict of strike/expiry/iv arrays
         self.interpolator = None
         
     def fit(
@@ -31,23 +44,96 @@ class VolatilitySurface:
             strikes: Array of strike prices
             expiries: Array of time to expiries (years)
             ivs: Array of implied volatilities
-            method: Interpolation method ("rbf", "linear", "cubic")
+            method: Interpolation method ("rbf", "grid_cubic", "linear", "cubic").
+                "grid_cubic" needs quotes on a full strike x expiry grid and
+                falls back to "rbf" for scattered points.
         """
-        self.surface_data = pd.DataFrame({
+        # Quotes carry ~1e-4 vol resolution, so float32 storage loses nothing
+        strikes = np.ascontiguousarray(strikes, dtype=self.dtype)
+        expiries = np.ascontiguousarray(expiries, dtype=self.dtype)
+        ivs = np.ascontiguousarray(ivs, dtype=self.dtype)
+        
+        self.surface_data = {
             'strike': strikes,
             'expiry': expiries,
             'iv': ivs
-        })
+        }
         
         points = np.column_stack([strikes, expiries])
         
+        if method == "grid_cubic":
+            self.interpolator = self._grid_interpolator(strikes, expiries, ivs)
+            if self.interpolator is not None:
+                return
+            method = "rbf"
+        
         if method == "rbf":
-            self.interpolator = RBFInterpolator(points, ivs, kernel='thin_plate_spline')
+            # SciPy solves the thin-plate system in float64 whatever the input;
+            # that matrix is too ill-conditioned for float32 anyway
+            self.interpolator = RBFInterpolator(
+                points.astype(np.float64), ivs.astype(np.float64),
+                kernel='thin_plate_spline'
+            )
         else:
             self.interpolator = lambda x: griddata(
                 points, ivs, x, method=method, fill_value=np.nan
             )
     
+    def fit_chain(self, chain, method: str = "rbf") -> None:
+        """
+        Fit from an option chain in column layout (strategies.OptionChainSoA).
+        
+        Any object with strikes, expiries and ivs arrays works; expiries must
+        be time to expiry in years. Rows without an IV are skipped.
+        
+        Args:
+            chain: Option chain with strikes, expiries and ivs arrays
+            method: Interpolation method, as for fit()
+        """
+        ivs = np.asarray(chain.ivs, dtype=float)
+        valid = ~np.isnan(ivs)
+        self.fit(
+            np.asarray(chain.strikes, dtype=float)[valid],
+            np.asarray(chain.expiries, dtype=float)[valid],
+            ivs[valid],
+            method=method
+        )
+    
+    def to_frame(self) -> pd.DataFrame:
+        """Fitted quotes as a DataFrame with strike, expiry and iv columns."""
+        if self.surface_data is None:
+            raise ValueError("Surface not fitted. Call fit() first.")
+        return pd.DataFrame(self.surface_data)
+    
+    @staticmethod
+    def _grid_interpolator(
+        strikes: np.ndarray,
+        expiries: np.ndarray,
+        ivs: np.ndarray
+    ) -> Optional[RegularGridInterpolator]:
+        """
+        Build a tensor-grid spline when quotes cover every (strike, expiry) pair.
+        
+        Returns:
+            RegularGridInterpolator, or None if the points are not a full grid
+        """
+        unique_strikes, strike_idx = np.unique(strikes, return_inverse=True)
+        unique_expiries, expiry_idx = np.unique(expiries, return_inverse=True)
+        if len(unique_strikes) * len(unique_expiries) != len(ivs):
+            return None
+        
+        grid = np.full((len(unique_strikes), len(unique_expiries)), np.nan, dtype=ivs.dtype)
+        grid[strike_idx, expiry_idx] = ivs
+        if np.isnan(grid).any():
+            return None
+        
+        # Cubic splines need at least 4 knots per axis
+        grid_method = "cubic" if min(grid.shape) >= 4 else "linear"
+        return RegularGridInterpolator(
+            (unique_strikes, unique_expiries), grid,
+            method=grid_method, bounds_error=False, fill_value=None
+        )
+    
     def get_iv(self, strike: float, expiry: float) -> float:
         """
         Get implied volatility for a given strike and expiry.
@@ -59,11 +145,22 @@ class VolatilitySurface:
         Returns:
             Implied volatility
         """
+        return float(self.get_ivs(np.array([[strike, expiry]]))[0])
+    
+    def get_ivs(self, points: np.ndarray) -> np.ndarray:
+        """
+        Get implied volatilities for many (strike, expiry) points in one call.
+        
+        Args:
+            points: Array of shape (n, 2) with strike and expiry columns
+            
+        Returns:
+            Array of n implied volatilities
+        """
         if self.interpolator is None:
             raise ValueError("Surface not fitted. Call fit() first.")
         
-        point = np.array([[strike, expiry]])
-        return float(self.interpolator(point))
+        return np.asarray(self.interpolator(points))
     
     def get_atm_vol(self, spot: float, expiry: float) -> float:
         """Get at-the-money volatility for given expiry."""
@@ -81,14 +178,14 @@ class VolatilitySurface:
         Returns:
             Skew measure (put vol - call vol) / ATM vol
         """
-        atm_vol = self.get_iv(spot, expiry)
-        put_strike = spot * (1 - delta_k)
-        call_strike = spot * (1 + delta_k)
-        
-        put_vol = self.get_iv(put_strike, expiry)
-        call_vol = self.get_iv(call_strike, expiry)
+        points = np.array([
+            [spot, expiry],
+            [spot * (1 - delta_k), expiry],
+            [spot * (1 + delta_k), expiry],
+        ])
+        atm_vol, put_vol, call_vol = self.get_ivs(points)
         
-        return (put_vol - call_vol) / atm_vol
+        return float((put_vol - call_vol) / atm_vol)
 
 
 class SVIModel:
@@ -106,20 +203,210 @@ class SVIModel:
         """
         Fit SVI parameters to market data.
         
+        Quasi-explicit calibration (Zeliade): for fixed (m, σ) the slice is
+        linear in (a, d, c) = (a, ρbσ, bσ), so that inner problem is solved
+        exactly and Nelder-Mead only searches over (m, σ).
+        
         Args:
             log_moneyness: ln(K/S) array
             total_variance: σ^2 * T array
         """
-        # TODO: Implement parameter calibration
-        # This requires non-linear optimization with constraints
-        raise NotImplementedError("SVI calibration pending")
+        k = np.asarray(log_moneyness, dtype=float)
+        w = np.asarray(total_variance, dtype=float)
+        if k.size < 5:
+            raise ValueError("SVI calibration needs at least 5 points")
+        
+        w_max = float(w.max())
+        
+        def objective(x: np.ndarray) -> float:
+            m, sigma = x
+            return self._solve_linear(k, w, m, sigma, w_max)[1]
+        
+        x0 = np.array([k[np.argmin(w)], 0.1])
+        bounds = [(float(k.min()), float(k.max())), (1e-3, 2.0)]
+        result = minimize(objective, x0, method='Nelder-Mead', bounds=bounds)
+        
+        m, sigma = result.x
+        (a, d, c), _ = self._solve_linear(k, w, m, sigma, w_max)
+        b = c / sigma
+        rho = d / c if c > 0 else 0.0
+        self.params = (a, b, rho, m, sigma)
+    
+    @staticmethod
+    def _solve_linear(
+        k: np.ndarray,
+        w: np.ndarray,
+        m: float,
+        sigma: float,
+        w_max: float
+    ) -> Tuple[np.ndarray, float]:
+        """
+        Least-squares (a, d, c) for fixed (m, σ) under the SVI domain.
+        
+        Minimizes ||a + d*y + c*sqrt(y^2 + 1) - w||^2 with y = (k - m) / σ,
+        subject to |d| <= c, |d| <= 4σ - c and 0 <= a <= max(w), by trying
+        the unconstrained solution and then each active set of constraints.
+        
+        Returns:
+            Tuple of ((a, d, c), sum of squared residuals)
+        """
+        y = (k - m) / sigma
+        A = np.column_stack([np.ones_like(y), y, np.sqrt(y * y + 1)])
+        AtA = A.T @ A
+        Atw = A.T @ w
+        
+        # Constraints G @ (a, d, c) <= h
+        G = np.array([
+            [0.0, 1.0, -1.0],
+            [0.0, -1.0, -1.0],
+            [0.0, 1.0, 1.0],
+            [0.0, -1.0, 1.0],
+            [-1.0, 0.0, 0.0],
+            [1.0, 0.0, 0.0],
+        ])
+        h = np.array([0.0, 0.0, 4 * sigma, 4 * sigma, 0.0, w_max])
+        
+        best, best_sse = np.zeros(3), np.inf
+        for n_active in range(4):
+            for active in combinations(range(len(h)), n_active):
+                rows = list(active)
+                kkt = np.zeros((3 + n_active, 3 + n_active))
+                kkt[:3, :3] = AtA
+                kkt[:3, 3:] = G[rows].T
+                kkt[3:, :3] = G[rows]
+                try:
+                    sol = np.linalg.solve(kkt, np.concatenate([Atw, h[rows]]))
+                except np.linalg.LinAlgError:
+                    continue
+                
+                coeffs = sol[:3]
+                if np.any(G @ coeffs > h + 1e-12):
+                    continue
+                resid = A @ coeffs - w
+                sse = float(resid @ resid)
+                if sse < best_sse:
+                    best, best_sse = coeffs, sse
+            
+            # Unconstrained optimum is feasible: no active set can beat it
+            if n_active == 0 and np.isfinite(best_sse):
+                break
+        
+        return best, best_sse
     
     def predict(self, log_moneyness: np.ndarray) -> np.ndarray:
         """Predict total variance for given log-moneyness."""
         if self.params is None:
             raise ValueError("Model not fitted")
         
-        a, b, rho, m, sigma = self.params
         k = log_moneyness
+        if np.isscalar(k):
+            return self.predict_scalar(k)
+        
+        a, b, rho, m, sigma = self.params
+        
+        if svi_total_variance is not None and np.ndim(k) == 1:
+            k = np.ascontiguousarray(k, dtype=float)
+            out = np.empty_like(k)
+            svi_total_variance(k, a, b, rho, m, sigma, out)
+            return out
         
         return a + b * (rho * (k - m) + np.sqrt((k - m)**2 + sigma**2))
+    
+    def predict_scalar(self, log_moneyness: float) -> float:
+        """
+        Total variance at a single log-moneyness.
+        
+        Plain float arithmetic, for pricing one option at a time without
+        NumPy's per-call array overhead.
+        """
+        if self.params is None:
+            raise ValueError("Model not fitted")
+        
+        a, b, rho, m, sigma = self.params
+        d = log_moneyness - m
+        return a + b * (rho * d + math.sqrt(d * d + sigma * sigma))
+
+
+class SurfaceSVI:
+    """
+    Raw SVI slices for a set of maturities, evaluated together.
+    
+    Per-maturity parameters are stored as arrays so a whole
+    (log-moneyness x maturity) grid is computed in one broadcast pass.
+    """
+    
+    def __init__(self):
+        self.expiries = None
+        self.a = None
+        self.b = None
+        self.rho = None
+        self.m = None
+        self.sigma = None
+    
+    def fit(
+        self,
+        expiries: np.ndarray,
+        log_moneyness: List[np.ndarray],
+        total_variance: List[np.ndarray]
+    ) -> None:
+        """
+        Calibrate one SVIModel per maturity slice.
+        
+        Args:
+            expiries: Time to expiry of each slice (years)
+            log_moneyness: ln(K/S) array for each slice
+            total_variance: σ^2 * T array for each slice
+        """
+        params = []
+        for k, w in zip(log_moneyness, total_variance):
+            model = SVIModel()
+            model.fit(k, w)
+            params.append(model.params)
+        self.set_params(expiries, np.array(params, dtype=float))
+    
+    def set_params(self, expiries: np.ndarray, params: np.ndarray) -> None:
+        """
+        Set slice parameters directly.
+        
+        Args:
+            expiries: Time to expiry of each slice (years)
+            params: Array of shape (n_slices, 5) with (a, b, ρ, m, σ) rows
+        """
+        params = np.asarray(params, dtype=float)
+        self.expiries = np.asarray(expiries, dtype=float)
+        self.a, self.b, self.rho, self.m, self.sigma = (
+            np.ascontiguousarray(col) for col in params.T
+        )
+    
+    def predict_grid(
+        self,
+        log_moneyness: np.ndarray,
+        slice_idx: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Total variance for every (log-moneyness, maturity) pair.
+        
+        Args:
+            log_moneyness: Array of M log-moneyness values
+            slice_idx: Indices of the maturities to evaluate (default: all)
+            
+        Returns:
+            Array of shape (M, N) for the N selected maturities
+        """
+        if self.a is None:
+            raise ValueError("Model not fitted")
+        
+        k = np.ascontiguousarray(log_moneyness, dtype=float).ravel()
+        a, b, rho, m, sigma = self.a, self.b, self.rho, self.m, self.sigma
+        if slice_idx is not None:
+            a, b, rho, m, sigma = (
+                np.ascontiguousarray(p[slice_idx]) for p in (a, b, rho, m, sigma)
+            )
+        
+        if svi_total_variance_grid is not None:
+            out = np.empty((k.size, a.size))
+            svi_total_variance_grid(k, a, b, rho, m, sigma, out)
+            return out
+        
+        d = k[:, None] - m[None, :]
+        return a + b * (rho * d + np.sqrt(d * d + sigma**2))
@@ -0,0 +1,38 @@
+"""
+Numba-compiled drawdown kernel.
+
+Optional accelerator for RiskMetrics.max_drawdown; importing this module
+raises ImportError when numba is not installed.
+"""
+
+from numba import njit
+
+
+@njit
+def max_drawdown_fused(values):
+    """
+    Maximum drawdown of a value path in a single pass.
+
+    Tracks the running peak, the deepest drawdown and the peak it was
+    measured from together, instead of separate cummax/subtract/divide
+    passes.
+
+    Returns:
+        (max_drawdown, peak_pos, trough_pos)
+    """
+    peak = values[0]
+    peak_i = 0
+    dd_min = 0.0
+    trough_i = 0
+    dd_peak_i = 0
+    for i in range(values.shape[0]):
+        v = values[i]
+        if v > peak:
+            peak = v
+            peak_i = i
+        dd = (v - peak) / peak
+        if dd < dd_min:
+            dd_min = dd
+            trough_i = i
+            dd_peak_i = peak_i
+    return dd_min, dd_peak_i, trough_i
@@ -2,7 +2,9 @@
 Position limits and risk checks.
 """
 
-from typing import Dict, Optional
+import numpy as np
+import pandas as pd
+from typing import Dict, Optional, Tuple, Union
 from dataclasses import dataclass
 
 
@@ -18,51 +20,157 @@ class RiskLimits:
     min_liquidity_score: float = 0.3
 
 
+@dataclass
+class PortfolioState:
+    """Aggregate Greeks and value of the current portfolio."""
+    delta: float = 0.0
+    vega: float = 0.0
+    gamma: float = 0.0
+    total_value: float = 1.0
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'PortfolioState':
+        """Build from a dict with optional delta/vega/gamma/total_value keys."""
+        return cls(
+            delta=data.get('delta', 0),
+            vega=data.get('vega', 0),
+            gamma=data.get('gamma', 0),
+            total_value=data.get('total_value', 1)
+        )
+
+
+@dataclass
+class ProposedTrade:
+    """Greeks and notional a trade would add to the portfolio."""
+    delta: float = 0.0
+    vega: float = 0.0
+    gamma: float = 0.0
+    notional: float = 0.0
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'ProposedTrade':
+        """Build from a dict with optional delta/vega/gamma/notional keys."""
+        return cls(
+            delta=data.get('delta', 0),
+            vega=data.get('vega', 0),
+            gamma=data.get('gamma', 0),
+            notional=data.get('notional', 0)
+        )
+
+
 class RiskChecker:
     """Check trades against risk limits."""
     
+    # Reason codes from check_trades_batch, in the order checks are applied
+    REASON_OK = 0
+    REASON_POSITION_SIZE = 1
+    REASON_SINGLE_NOTIONAL = 2
+    REASON_DELTA_LIMIT = 3
+    REASON_VEGA_LIMIT = 4
+    
     def __init__(self, limits: RiskLimits):
         self.limits = limits
         
     def check_trade(
         self,
-        current_portfolio: Dict,
-        proposed_trade: Dict
+        current_portfolio: Union[PortfolioState, Dict],
+        proposed_trade: Union[ProposedTrade, Dict]
     ) -> tuple[bool, Optional[str]]:
         """
         Check if proposed trade violates risk limits.
         
+        Trade-only checks (size, notional) run before the portfolio Greek
+        checks, so the cheapest and most common rejections exit first.
+        
         Args:
-            current_portfolio: Current portfolio state
-            proposed_trade: Proposed trade details
+            current_portfolio: Current portfolio state (dicts are converted)
+            proposed_trade: Proposed trade details (dicts are converted)
             
         Returns:
             (approved, reason) - True if trade passes all checks
         """
-        # Check delta limit
-        new_delta = current_portfolio.get('delta', 0) + proposed_trade.get('delta', 0)
-        if abs(new_delta) > self.limits.max_portfolio_delta:
-            return False, f"Delta limit exceeded: {new_delta} > {self.limits.max_portfolio_delta}"
-        
-        # Check vega limit
-        new_vega = current_portfolio.get('vega', 0) + proposed_trade.get('vega', 0)
-        if abs(new_vega) > self.limits.max_portfolio_vega:
-            return False, f"Vega limit exceeded: {new_vega} > {self.limits.max_portfolio_vega}"
+        if isinstance(current_portfolio, dict):
+            current_portfolio = PortfolioState.from_dict(current_portfolio)
+        if isinstance(proposed_trade, dict):
+            proposed_trade = ProposedTrade.from_dict(proposed_trade)
+        limits = self.limits
         
         # Check position size
-        position_value = proposed_trade.get('notional', 0)
-        portfolio_value = current_portfolio.get('total_value', 1)
-        
-        if position_value / portfolio_value > self.limits.max_position_size:
+        position_value = proposed_trade.notional
+        if position_value / current_portfolio.total_value > limits.max_position_size:
             return False, "Position size too large relative to portfolio"
         
         # Check single option notional
-        if position_value > self.limits.max_single_option_notional:
+        if position_value > limits.max_single_option_notional:
             return False, f"Single option notional too large: ${position_value}"
         
+        # Check delta limit
+        new_delta = current_portfolio.delta + proposed_trade.delta
+        if abs(new_delta) > limits.max_portfolio_delta:
+            return False, f"Delta limit exceeded: {new_delta} > {limits.max_portfolio_delta}"
+        
+        # Check vega limit
+        new_vega = current_portfolio.vega + proposed_trade.vega
+        if abs(new_vega) > limits.max_portfolio_vega:
+            return False, f"Vega limit exceeded: {new_vega} > {limits.max_portfolio_vega}"
+        
         # All checks passed
         return True, None
     
+    def check_trades_batch(
+        self,
+        current_portfolio: Union[PortfolioState, Dict],
+        trades: pd.DataFrame
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Check many candidate trades against the current portfolio at once.
+        
+        Applies the same limits as check_trade with boolean masks, each trade
+        evaluated independently against current_portfolio.
+        
+        Args:
+            current_portfolio: Current portfolio state (dicts are converted)
+            trades: DataFrame with delta, vega and notional columns
+                (missing columns count as 0)
+            
+        Returns:
+            (approved, reason_code) - boolean array, and int8 array holding
+            the first violated REASON_* code (REASON_OK when approved)
+        """
+        if isinstance(current_portfolio, dict):
+            current_portfolio = PortfolioState.from_dict(current_portfolio)
+        limits = self.limits
+        
+        notional = self._trade_column(trades, 'notional')
+        new_delta = current_portfolio.delta + self._trade_column(trades, 'delta')
+        new_vega = current_portfolio.vega + self._trade_column(trades, 'vega')
+        
+        # np.select picks the first matching condition, i.e. check_trade's order
+        reason_code = np.select(
+            [
+                notional / current_portfolio.total_value > limits.max_position_size,
+                notional > limits.max_single_option_notional,
+                np.abs(new_delta) > limits.max_portfolio_delta,
+                np.abs(new_vega) > limits.max_portfolio_vega,
+            ],
+            [
+                self.REASON_POSITION_SIZE,
+                self.REASON_SINGLE_NOTIONAL,
+                self.REASON_DELTA_LIMIT,
+                self.REASON_VEGA_LIMIT,
+            ],
+            default=self.REASON_OK
+        ).astype(np.int8)
+        
+        return reason_code == self.REASON_OK, reason_code
+    
+    @staticmethod
+    def _trade_column(trades: pd.DataFrame, name: str) -> np.ndarray:
+        """Column as a float array, zeros when the column is missing."""
+        if name in trades:
+            return trades[name].to_numpy(dtype=float)
+        return np.zeros(len(trades))
+    
     def get_max_allowable_size(
         self,
         current_portfolio: Dict,
@@ -87,3 +195,39 @@ class RiskChecker:
             max_size = min(max_size, vega_room / abs(trade_greeks['vega']))
         
         return max(0, max_size)
+    
+    def get_max_allowable_sizes(
+        self,
+        current_portfolio: Union[PortfolioState, Dict],
+        trades: pd.DataFrame
+    ) -> np.ndarray:
+        """
+        Maximum allowable size for each candidate trade, without Python branches.
+        
+        Same delta/vega room rule as get_max_allowable_size; a zero greek
+        leaves that constraint unbounded.
+        
+        Args:
+            current_portfolio: Current portfolio state (dicts are converted)
+            trades: DataFrame with per-contract delta and vega columns
+                (missing columns count as 0)
+            
+        Returns:
+            Array of maximum contract counts (inf when unconstrained)
+        """
+        if isinstance(current_portfolio, dict):
+            current_portfolio = PortfolioState.from_dict(current_portfolio)
+        
+        greeks = np.abs(np.stack([
+            self._trade_column(trades, 'delta'),
+            self._trade_column(trades, 'vega'),
+        ]))
+        rooms = np.array([
+            self.limits.max_portfolio_delta - abs(current_portfolio.delta),
+            self.limits.max_portfolio_vega - abs(current_portfolio.vega),
+        ])[:, None]
+        
+        ratios = np.divide(
+            rooms, greeks, out=np.full_like(greeks, np.inf), where=greeks != 0
+        )
+        return np.maximum(ratios.min(axis=0), 0.0)
@@ -4,7 +4,12 @@ Risk metrics and calculations.
 
 import numpy as np
 import pandas as pd
-from typing import Dict, List
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    from ._drawdown_numba import max_drawdown_fused
+except ImportError:
+    max_drawdown_fused = None  # Fall back to the NumPy passes
 
 
 class RiskMetrics:
@@ -22,17 +27,75 @@ class RiskMetrics:
         Returns:
             VaR value (positive number representing potential loss)
         """
-        return -np.percentile(returns, (1 - confidence) * 100)
+        arr = np.asarray(returns, dtype=float)
+        arr = arr[~np.isnan(arr)]
+        if arr.size == 0:
+            return np.nan
+        
+        # np.percentile's linear interpolation, selecting just the two
+        # neighbouring order statistics with np.partition
+        pos = (1 - confidence) * (arr.size - 1)
+        lo = int(pos)
+        hi = min(lo + 1, arr.size - 1)
+        part = np.partition(arr, [lo, hi])
+        return -(part[lo] + (part[hi] - part[lo]) * (pos - lo))
     
     @staticmethod
     def conditional_var(returns: pd.Series, confidence: float = 0.95) -> float:
         """
         Calculate Conditional Value at Risk (CVaR / Expected Shortfall).
         
-        Average loss beyond VaR threshold.
+        Average loss beyond VaR threshold, taken as the mean of the worst
+        ceil((1 - confidence) * N) returns. np.partition selects them in
+        O(N) without sorting; this matches averaging the returns at or below
+        the empirical VaR quantile up to how the boundary observation is
+        counted.
+        """
+        arr = np.asarray(returns, dtype=float)
+        arr = arr[~np.isnan(arr)]
+        if arr.size == 0:
+            return np.nan
+        
+        k = max(1, int(np.ceil((1 - confidence) * arr.size - 1e-9)))  # Guard float noise
+        tail = np.partition(arr, k - 1)[:k]
+        return -tail.mean()
+    
+    @staticmethod
+    def _sample_std(values: np.ndarray) -> float:
+        """Sample standard deviation (ddof=1), NaN with fewer than 2 values."""
+        if values.size < 2:
+            return np.nan
+        return float(values.std(ddof=1))
+    
+    @staticmethod
+    def sharpe_sortino(returns: pd.Series, risk_free_rate: float = 0.0) -> Tuple[float, float]:
+        """
+        Calculate Sharpe and Sortino ratios together.
+        
+        Converts the returns to a NumPy array once and shares the mean
+        between both ratios; subtracting the risk-free rate does not change
+        the standard deviation, so no excess-return series is built.
+        
+        Args:
+            returns: Series of returns
+            risk_free_rate: Annual risk-free rate
+            
+        Returns:
+            Tuple of (sharpe, sortino)
         """
-        var = RiskMetrics.value_at_risk(returns, confidence)
-        return -returns[returns <= -var].mean()
+        r = np.asarray(returns, dtype=float)
+        r = r[~np.isnan(r)]
+        excess_mean = (r.mean() if r.size else np.nan) - risk_free_rate / 252  # Daily rf rate
+        
+        sharpe = np.sqrt(252) * excess_mean / RiskMetrics._sample_std(r)
+        
+        downside_std = RiskMetrics._sample_std(r[r < 0])
+        if downside_std == 0:
+            sortino = np.inf
+        else:
+            sortino = np.sqrt(252) * excess_mean / downside_std
+        
+        return sharpe, sortino
     
     @staticmethod
     def sharpe_ratio(returns: pd.Series, risk_free_rate: float = 0.0) -> float:
@@ -46,8 +109,7 @@ class RiskMetrics:
         Returns:
             Sharpe ratio
         """
-        excess_returns = returns - risk_free_rate / 252  # Daily rf rate
-        return np.sqrt(252) * excess_returns.mean() / excess_returns.std()
+        return RiskMetrics.sharpe_sortino(returns, risk_free_rate)[0]
     
     @staticmethod
     def sortino_ratio(returns: pd.Series, risk_free_rate: float = 0.0) -> float:
@@ -56,51 +118,131 @@ class RiskMetrics:
         
         Like Sharpe but only penalizes downside volatility.
         """
-        excess_returns = returns - risk_free_rate / 252
-        downside_std = returns[returns < 0].std()
-        
-        if downside_std == 0:
-            return np.inf
-        
-        return np.sqrt(252) * excess_returns.mean() / downside_std
+        return RiskMetrics.sharpe_sortino(returns, risk_free_rate)[1]
     
     @staticmethod
     def max_drawdown(cumulative_returns: pd.Series) -> Dict[str, float]:
         """
         Calculate maximum drawdown.
         
+        Uses a single fused pass from _drawdown_numba when numba is installed.
+        
         Returns:
             Dictionary with max_drawdown, peak, and trough dates
         """
-        cummax = cumulative_returns.cummax()
-        drawdown = (cumulative_returns - cummax) / cummax
-        
-        max_dd = drawdown.min()
-        max_dd_idx = drawdown.idxmin()
+        values = cumulative_returns.to_numpy(dtype=float)
         
-        # Find peak before max drawdown
-        peak_idx = cumulative_returns[:max_dd_idx].idxmax()
+        if max_drawdown_fused is not None and values.size > 0:
+            max_dd, peak_pos, trough_pos = max_drawdown_fused(values)
+        else:
+            cummax = np.maximum.accumulate(values)
+            drawdown = (values - cummax) / cummax
+            
+            trough_pos = int(np.argmin(drawdown))
+            max_dd = drawdown[trough_pos]
+            
+            # Find peak before max drawdown
+            peak_pos = int(np.argmax(values[:trough_pos + 1]))
         
+        index = cumulative_returns.index
         return {
             'max_drawdown': max_dd,
-            'peak_date': peak_idx,
-            'trough_date': max_dd_idx
+            'peak_date': index[peak_pos],
+            'trough_date': index[trough_pos]
         }
     
     @staticmethod
-    def calmar_ratio(returns: pd.Series, years: float = 1.0) -> float:
+    def calmar_ratio(
+        returns: Optional[pd.Series] = None,
+        years: float = 1.0,
+        *,
+        cumulative: Optional[pd.Series] = None,
+        max_dd: Optional[float] = None
+    ) -> float:
         """
         Calculate Calmar ratio (return / max drawdown).
         
+        Callers that already hold the cumulative series and/or its max
+        drawdown can pass them to skip recomputing; otherwise both come
+        from one NumPy pass over the returns.
+        
         Args:
-            returns: Series of returns
+            returns: Series of returns (not needed if cumulative is given)
             years: Number of years in the period
+            cumulative: Precomputed (1 + returns).cumprod()
+            max_dd: Precomputed max drawdown of cumulative
         """
-        cumulative = (1 + returns).cumprod()
-        annual_return = (cumulative.iloc[-1] ** (1/years)) - 1
-        max_dd = abs(RiskMetrics.max_drawdown(cumulative)['max_drawdown'])
+        if cumulative is not None:
+            values = np.asarray(cumulative, dtype=float)
+        elif returns is not None:
+            r = np.asarray(returns, dtype=float)
+            values = np.cumprod(1 + r[~np.isnan(r)])
+        else:
+            raise ValueError("Provide returns or cumulative")
+        values = values[~np.isnan(values)]
+        
+        annual_return = (values[-1] ** (1/years)) - 1
+        
+        if max_dd is None and max_drawdown_fused is not None:
+            max_dd = max_drawdown_fused(values)[0]
+        elif max_dd is None:
+            peak = np.maximum.accumulate(values)
+            max_dd = ((values - peak) / peak).min()
+        max_dd = abs(max_dd)
         
         if max_dd == 0:
             return np.inf
         
         return annual_return / max_dd
+
+
+class RollingDrawdown:
+    """
+    Maximum drawdown tracked one observation at a time.
+    
+    O(1) per update, for live monitoring where max_drawdown would otherwise
+    rescan the whole cumulative series on every bar.
+    """
+    
+    def __init__(self):
+        self.peak: Optional[float] = None
+        self.peak_date: Any = None
+        self.max_drawdown = 0.0
+        self.max_dd_peak_date: Any = None
+        self.trough_date: Any = None
+    
+    def update(self, value: float, timestamp: Any = None) -> float:
+        """
+        Add the next cumulative value.
+        
+        Args:
+            value: Cumulative portfolio value (e.g. (1 + returns).cumprod())
+            timestamp: Label for the observation
+            
+        Returns:
+            Current drawdown from the running peak
+        """
+        if self.peak is None:
+            self.peak = value
+            self.peak_date = self.max_dd_peak_date = self.trough_date = timestamp
+            return 0.0
+        
+        if value > self.peak:
+            self.peak = value
+            self.peak_date = timestamp
+            return 0.0
+        
+        drawdown = (value - self.peak) / self.peak
+        if drawdown < self.max_drawdown:
+            self.max_drawdown = drawdown
+            self.max_dd_peak_date = self.peak_date
+            self.trough_date = timestamp
+        return drawdown
+    
+    def as_dict(self) -> Dict[str, Any]:
+        """Same keys as RiskMetrics.max_drawdown."""
+        return {
+            'max_drawdown': self.max_drawdown,
+            'peak_date': self.max_dd_peak_date,
+            'trough_date': self.trough_date
+        }
@@ -3,6 +3,7 @@ Base strategy class and framework.
 """
 
 from abc import ABC, abstractmethod
+import numpy as np
 import pandas as pd
 from typing import Dict, List, Optional
 from dataclasses import dataclass
@@ -35,6 +36,68 @@ class Signal:
     reason: str
 
 
+@dataclass
+class OptionChainSoA:
+    """
+    Option chain stored column-wise (one array per field).
+    
+    Numeric columns are owned, contiguous float64 so filters run as NumPy masks;
+    symbols and expiries are only touched for the rows that survive.
+    """
+    symbols: np.ndarray  # object
+    option_type_code: np.ndarray  # int8: 0 = call, 1 = put
+    strikes: np.ndarray  # float64
+    expiries: np.ndarray  # As provided (datetimes, or years to expiry)
+    ivs: np.ndarray  # float64, NaN where no implied vol is available
+    # Original labels ('put', 'P', ...); None means plain 'call'/'put'
+    option_types: Optional[np.ndarray] = None
+    
+    CALL = 0
+    PUT = 1
+    
+    def __len__(self) -> int:
+        return len(self.strikes)
+    
+    @classmethod
+    def from_dataframe(cls, df: pd.DataFrame) -> 'OptionChainSoA':
+        """
+        Build from a DataFrame with symbol, option_type, strike, expiry and
+        implied_vol columns (implied_vol may be missing).
+        """
+        labels = df['option_type']
+        # 'put', 'Put', 'PUT' and Deribit's 'P' are all puts
+        is_put = labels.astype(str).str.lower().str[0].eq('p').to_numpy()
+        ivs = (
+            df['implied_vol'].to_numpy(dtype=float, copy=True)
+            if 'implied_vol' in df
+            else np.full(len(df), np.nan)
+        )
+        return cls(
+            symbols=df['symbol'].to_numpy(dtype=object, copy=True),
+            option_type_code=np.where(is_put, cls.PUT, cls.CALL).astype(np.int8),
+            strikes=df['strike'].to_numpy(dtype=float, copy=True),
+            expiries=df['expiry'].to_numpy(copy=True),
+            ivs=ivs,
+            option_types=labels.to_numpy(dtype=object, copy=True)
+        )
+    
+    def option_type_labels(self) -> np.ndarray:
+        """Option type labels as given, or 'call'/'put' built from the codes."""
+        if self.option_types is not None:
+            return self.option_types
+        return np.where(self.option_type_code == self.PUT, 'put', 'call')
+    
+    def to_dataframe(self) -> pd.DataFrame:
+        """Convert back to the row-oriented DataFrame layout."""
+        return pd.DataFrame({
+            'symbol': self.symbols,
+            'option_type': self.option_type_labels(),
+            'strike': self.strikes,
+            'expiry': self.expiries,
+            'implied_vol': self.ivs
+        })
+
+
 class BaseStrategy(ABC):
     """
     Abstract base class for trading strategies.
@@ -4,7 +4,8 @@ Delta-neutral trading strategies.
 
 import pandas as pd
 import numpy as np
-from typing import List, Dict
+from datetime import datetime
+from typing import List, Dict, Optional
 from .base import BaseStrategy, Signal, Position
 
 
@@ -20,9 +21,31 @@ class DeltaNeutralPortfolio(BaseStrategy):
         self.rebalance_threshold = rebalance_threshold
         self.target_delta = 0.0
         
+        # Portfolio delta computed once per decision cycle; None when stale
+        self._cached_delta: Optional[float] = None
+        
+    def add_position(self, position: Position) -> None:
+        """Add a new position and invalidate the cached delta."""
+        super().add_position(position)
+        self._cached_delta = None
+    
+    def close_position(self, position: Position, exit_price: float, exit_time: datetime) -> float:
+        """Close a position and invalidate the cached delta."""
+        pnl = super().close_position(position, exit_price, exit_time)
+        self._cached_delta = None
+        return pnl
+    
+    def _current_delta(self) -> float:
+        """Portfolio delta, aggregated at most once until positions change."""
+        if self._cached_delta is None:
+            self._cached_delta = self.get_portfolio_delta()
+        return self._cached_delta
+    
     def generate_signals(self, market_data: pd.DataFrame) -> List[Signal]:
         """Generate hedging signals to maintain delta neutrality."""
-        current_delta = self.get_portfolio_delta()
+        # Start of a decision cycle: greeks may have moved with the market
+        self._cached_delta = None
+        current_delta = self._current_delta()
         
         signals = []
         
@@ -35,8 +58,8 @@ class DeltaNeutralPortfolio(BaseStrategy):
     
     def calculate_position_size(self, signal: Signal, portfolio_value: float) -> float:
         """Calculate hedge size to neutralize delta."""
-        # Size based on current delta imbalance
-        return abs(self.get_portfolio_delta())
+        # Size based on current delta imbalance (reuses this cycle's delta)
+        return abs(self._current_delta())
     
     def calculate_hedge_ratio(self, option_delta: float, spot_position: float) -> float:
         """
@@ -4,8 +4,9 @@ Volatility-based trading strategies.
 
 import pandas as pd
 import numpy as np
-from typing import List
-from .base import BaseStrategy, Signal
+from collections import deque
+from typing import Deque, List, Optional
+from .base import BaseStrategy, OptionChainSoA, Signal
 from datetime import datetime
 
 
@@ -27,57 +28,155 @@ class VolatilityArbitrage(BaseStrategy):
         self.entry_threshold = entry_threshold
         self.exit_threshold = exit_threshold
         
+        # Rolling-window return statistics, updated only with bars not seen yet
+        self._rv_window: Deque[float] = deque()
+        self._rv_mean = 0.0
+        self._rv_m2 = 0.0
+        self._rv_last_index = None
+        self._rv_last_close = np.nan
+        
     def calculate_realized_vol(self, returns: pd.Series) -> float:
         """Calculate realized volatility from returns."""
         return returns.std() * np.sqrt(252)  # Annualized
     
-    def generate_signals(self, market_data: pd.DataFrame) -> List[Signal]:
+    def _reset_realized_vol(self):
+        """Forget the rolling return window."""
+        self._rv_window.clear()
+        self._rv_mean = 0.0
+        self._rv_m2 = 0.0
+        self._rv_last_index = None
+        self._rv_last_close = np.nan
+    
+    def _push_return(self, ret: float):
+        """Add a return to the window (Welford), evicting the oldest when full."""
+        window = self._rv_window
+        if len(window) == self.lookback_window:
+            old = window.popleft()
+            n = len(window)
+            if n == 0:
+                self._rv_mean = 0.0
+                self._rv_m2 = 0.0
+            else:
+                delta = old - self._rv_mean
+                self._rv_mean -= delta / n
+                self._rv_m2 -= delta * (old - self._rv_mean)
+        
+        window.append(ret)
+        delta = ret - self._rv_mean
+        self._rv_mean += delta / len(window)
+        self._rv_m2 += delta * (ret - self._rv_mean)
+    
+    def update_realized_vol(self, closes: pd.Series) -> float:
+        """
+        Annualized realized volatility over the last lookback_window returns.
+        
+        Only bars after the last one seen are processed, so repeated calls
+        on a growing price series cost O(new bars). The window is rebuilt
+        from the tail when the index no longer contains the last bar seen,
+        or when the close at that label differs from the one seen (e.g. a
+        new frame reusing a RangeIndex).
+        
+        Args:
+            closes: Close prices, oldest first
+            
+        Returns:
+            Annualized realized volatility (NaN with fewer than 2 returns)
+        """
+        index = closes.index
+        all_prices = closes.to_numpy(dtype=float)
+        start = -1
+        if self._rv_last_index is not None and index.is_unique:
+            start = index.get_indexer([self._rv_last_index])[0]
+            if start >= 0:
+                # Same label must also carry the same close, or this is other data
+                close = all_prices[start]
+                last = self._rv_last_close
+                if not (close == last or (np.isnan(close) and np.isnan(last))):
+                    start = -1
+        if start < 0:
+            self._reset_realized_vol()
+            start = max(len(closes) - self.lookback_window - 1, 0)
+        
+        prices = all_prices[start:]
+        returns = prices[1:] / prices[:-1] - 1
+        for ret in returns[np.isfinite(returns)]:
+            self._push_return(float(ret))
+        if len(index):
+            self._rv_last_index = index[-1]
+            self._rv_last_close = all_prices[-1]
+        
+        n = len(self._rv_window)
+        if n < 2:
+            return np.nan
+        return np.sqrt(max(self._rv_m2, 0.0) / (n - 1)) * np.sqrt(252)  # Annualized
+    
+    def generate_signals(
+        self,
+        market_data: pd.DataFrame,
+        chain: Optional[OptionChainSoA] = None
+    ) -> List[Signal]:
         """
         Generate signals based on IV vs RV spread.
         
         Buy options when IV < RV (vol underpriced)
         Sell options when IV > RV (vol overpriced)
+        
+        Args:
+            market_data: Frame with a 'close' column (and, when chain is not
+                given, the option rows with their implied_vol)
+            chain: Option chain already in column layout
         """
         signals = []
         
-        # Calculate realized volatility
-        returns = market_data['close'].pct_change()
-        rv = self.calculate_realized_vol(returns.tail(self.lookback_window))
-        
-        # Compare with implied volatility for each option
-        for _, row in market_data.iterrows():
-            if pd.isna(row.get('implied_vol')):
-                continue
-                
-            iv = row['implied_vol']
-            spread = (iv - rv) / rv  # Normalized spread
+        # Calculate realized volatility (incrementally across calls)
+        rv = self.update_realized_vol(market_data['close'])
+        
+        if chain is None:
+            if 'implied_vol' not in market_data:
+                return signals
+            chain = OptionChainSoA.from_dataframe(market_data)
+        
+        # Compare with implied volatility for all options at once
+        ivs = chain.ivs
+        spreads = (ivs - rv) / rv  # Normalized spread
+        selected = np.flatnonzero(np.abs(spreads) > self.entry_threshold)  # NaN IVs never pass
+        if len(selected) == 0:
+            return signals
+        
+        timestamp = datetime.now()
+        # Labels are passed through unchanged, as the row-wise version did
+        option_types = chain.option_type_labels()[selected]
+        
+        for idx, symbol, option_type, strike, expiry in zip(
+            selected,
+            chain.symbols[selected],
+            option_types,
+            chain.strikes[selected],
+            chain.expiries[selected]
+        ):
+            iv = ivs[idx]
+            spread = spreads[idx]
             
-            if spread < -self.entry_threshold:
+            if spread < 0:
                 # IV is low relative to RV - buy volatility
-                signals.append(Signal(
-                    timestamp=datetime.now(),
-                    action="buy",
-                    symbol=row['symbol'],
-                    option_type=row['option_type'],
-                    strike=row['strike'],
-                    expiry=row['expiry'],
-                    quantity=1.0,
-                    confidence=min(abs(spread), 1.0),
-                    reason=f"IV ({iv:.2%}) < RV ({rv:.2%})"
-                ))
-            elif spread > self.entry_threshold:
+                action = "buy"
+                reason = f"IV ({iv:.2%}) < RV ({rv:.2%})"
+            else:
                 # IV is high relative to RV - sell volatility
-                signals.append(Signal(
-                    timestamp=datetime.now(),
-                    action="sell",
-                    symbol=row['symbol'],
-                    option_type=row['option_type'],
-                    strike=row['strike'],
-                    expiry=row['expiry'],
-                    quantity=1.0,
-                    confidence=min(abs(spread), 1.0),
-                    reason=f"IV ({iv:.2%}) > RV ({rv:.2%})"
-                ))
+                action = "sell"
+                reason = f"IV ({iv:.2%}) > RV ({rv:.2%})"
+            
+            signals.append(Signal(
+                timestamp=timestamp,
+                action=action,
+                symbol=symbol,
+                option_type=option_type,
+                strike=strike,
+                expiry=expiry,
+                quantity=1.0,
+                confidence=min(abs(spread), 1.0),
+                reason=reason
+            ))
         
         return signals
     
@@ -9,7 +9,9 @@ try:
         CCXTProCollector,
         StreamConfig,
         OrderbookSnapshot,
+        CompactHistory,
         MultiExchangeCollector,
+        run,
     )
     CCXT_PRO_AVAILABLE = True
 except ImportError as e:
@@ -20,7 +22,9 @@ __all__ = [
     'CCXTProCollector',
     'StreamConfig',
     'OrderbookSnapshot',
+    'CompactHistory',
     'MultiExchangeCollector',
+    'run',
     'CCXT_PRO_AVAILABLE',
 ]
 
@@ -6,10 +6,18 @@ using CCXT Pro's websocket functionality.
 """
 
 import asyncio
+import os
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Set, Callable, Any
-from datetime import datetime
-from collections import defaultdict
+from typing import Deque, Dict, List, Optional, Set, Callable, Any, Tuple, Union
+from datetime import datetime, timezone
+from collections import defaultdict, deque
+from collections.abc import Mapping
+from itertools import islice
+from types import MappingProxyType
+import numpy as np
 import pandas as pd
 from dataclasses import dataclass, field
 import logging
@@ -22,8 +30,12 @@ except ImportError:
         "Install with: pip install ccxt[pro]"
     )
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+try:
+    import uvloop
+except ImportError:
+    uvloop = None  # Fall back to the default asyncio event loop
+
+# Library module: handlers and levels are left to the application
 logger = logging.getLogger(__name__)
 
 # Import schema definitions
@@ -39,45 +51,258 @@ except ImportError:
     deribit_options_schema = None
 
 
+def run(main, use_uvloop: bool = True):
+    """
+    Run a collector coroutine to completion, on uvloop when it is installed.
+    
+    The event loop implementation has to be chosen before the loop starts,
+    so CCXTProCollector.start() cannot switch it; use this in place of
+    asyncio.run(). uvloop's libuv selector cuts per-message dispatch
+    overhead on busy websocket streams.
+    
+    Args:
+        main: Coroutine to run
+        use_uvloop: Set False to force the default asyncio loop
+        
+    Returns:
+        The coroutine's result
+    """
+    if use_uvloop and uvloop is not None:
+        return uvloop.run(main)
+    return asyncio.run(main)
+
+
+# Flattened level columns in to_dict() order: bid1, bidamt1, ask1, askamt1, bid2, ...
+_LEVEL_COLUMNS = [
+    f'{name}{i+1}' for i in range(10) for name in ('bid', 'bidamt', 'ask', 'askamt')
+]
+
+
+def _levels_array(levels: List[List[float]], dtype=np.float64) -> np.ndarray:
+    """Convert CCXT [[price, size, ...], ...] levels to a (n, 2) array of dtype."""
+    arr = np.asarray(levels, dtype=dtype)
+    if arr.ndim != 2 or arr.shape[0] == 0:
+        return np.empty((0, 2), dtype=dtype)
+    return arr[:, :2]
+
+
+def _parse_option_market(symbol: str, market: Dict) -> Tuple[str, str, str, str]:
+    """
+    Split an option market into (base, symbol expiry, exchange-id expiry, 'C'/'P').
+    
+    Unified symbols end in -YYMMDD-STRIKE-TYPE (BTC/USD:BTC-241227-50000-C);
+    exchange ids carry the exchange's own date (BTC-27DEC24-50000-C). Parts
+    that can't be read are left empty so they never match a filter.
+    """
+    parts = symbol.rsplit('-', 3)
+    symbol_expiry = parts[1] if len(parts) == 4 else ''
+    option_type = parts[3] if len(parts) == 4 else ''
+    id_parts = str(market.get('id') or '').rsplit('-', 3)
+    id_expiry = id_parts[1] if len(id_parts) == 4 else ''
+    base = market.get('base') or parts[0].split('/')[0]
+    return base, symbol_expiry, id_expiry, option_type
+
+
+def _snapshots_frame(
+    snapshots: List['OrderbookSnapshot'],
+    exchanges: List[str],
+    dtype=np.float64
+) -> pd.DataFrame:
+    """
+    Build one row per snapshot: symbol, timestamp (UTC), exchange, 10 levels.
+    
+    Levels are copied straight from each snapshot's arrays into a single
+    preallocated block; missing levels are NaN.
+    """
+    n = len(snapshots)
+    
+    # (snapshot, level, [bid, bidamt, ask, askamt]) flattens to to_dict()'s column order
+    levels = np.full((n, 10, 4), np.nan, dtype=dtype)
+    for i, ob in enumerate(snapshots):
+        bids = ob.bids[:10]
+        asks = ob.asks[:10]
+        levels[i, :len(bids), 0:2] = bids
+        levels[i, :len(asks), 2:4] = asks
+    
+    df = pd.DataFrame(levels.reshape(n, -1), columns=_LEVEL_COLUMNS)
+    df.insert(0, 'symbol', [ob.symbol for ob in snapshots])
+    timestamps = np.fromiter((ob.timestamp for ob in snapshots), dtype=np.int64, count=n)
+    df.insert(1, 'timestamp', pd.to_datetime(timestamps, unit='ms', utc=True))
+    df.insert(2, 'exchange', exchanges)
+    return df
+
+
 @dataclass
 class OrderbookSnapshot:
-    """Represents a snapshot of an orderbook at a point in time."""
+    """
+    Represents a snapshot of an orderbook at a point in time.
+    
+    Top-of-book price and size are read once at construction and served
+    from plain float attributes; bids/asks keep the full depth.
+    """
+    
+    __slots__ = (
+        'symbol', 'timestamp', 'bids', 'asks', 'exchange',
+        '_best_bid', '_best_bid_size', '_best_ask', '_best_ask_size',
+    )
     
     symbol: str
-    timestamp: datetime
-    bids: List[List[float]]  # [[price, size], ...]
-    asks: List[List[float]]  # [[price, size], ...]
+    timestamp: int  # Epoch milliseconds
+    bids: np.ndarray  # shape (levels, 2): [[price, size], ...]
+    asks: np.ndarray  # shape (levels, 2): [[price, size], ...]
     exchange: str
     
+    def __post_init__(self):
+        if isinstance(self.timestamp, datetime):
+            self.timestamp = int(self.timestamp.timestamp() * 1000)
+        
+        # Accept CCXT-style lists of levels; store each side as one array
+        if not isinstance(self.bids, np.ndarray):
+            self.bids = _levels_array(self.bids)
+        if not isinstance(self.asks, np.ndarray):
+            self.asks = _levels_array(self.asks)
+        
+        # Top of book read once; the sides are not meant to change afterwards
+        if len(self.bids):
+            self._best_bid, self._best_bid_size = self.bids[0].tolist()
+        else:
+            self._best_bid = self._best_bid_size = None
+        if len(self.asks):
+            self._best_ask, self._best_ask_size = self.asks[0].tolist()
+        else:
+            self._best_ask = self._best_ask_size = None
+    
+    def __eq__(self, other):
+        # The generated __eq__ compares the level arrays inside a tuple,
+        # which raises for arrays with more than one element
+        if not isinstance(other, OrderbookSnapshot):
+            return NotImplemented
+        return (
+            self.symbol == other.symbol
+            and self.timestamp == other.timestamp
+            and self.exchange == other.exchange
+            and np.array_equal(self.bids, other.bids)
+            and np.array_equal(self.asks, other.asks)
+        )
+    
+    @property
+    def timestamp_dt(self) -> datetime:
+        """Timestamp as a UTC-aware datetime."""
+        return datetime.fromtimestamp(self.timestamp / 1000, tz=timezone.utc)
+    
+    @property
+    def best_bid(self) -> Optional[float]:
+        """Best (highest) bid price, or None if the bid side is empty."""
+        return self._best_bid
+    
+    @property
+    def best_bid_size(self) -> Optional[float]:
+        """Size at the best bid, or None if the bid side is empty."""
+        return self._best_bid_size
+    
+    @property
+    def best_ask(self) -> Optional[float]:
+        """Best (lowest) ask price, or None if the ask side is empty."""
+        return self._best_ask
+    
+    @property
+    def best_ask_size(self) -> Optional[float]:
+        """Size at the best ask, or None if the ask side is empty."""
+        return self._best_ask_size
+    
+    @property
+    def mid_price(self) -> Optional[float]:
+        """Midpoint of best bid and ask, or None if either side is empty."""
+        if self._best_bid is None or self._best_ask is None:
+            return None
+        return (self._best_bid + self._best_ask) / 2
+    
+    @property
+    def spread(self) -> Optional[float]:
+        """Best ask minus best bid, or None if either side is empty."""
+        if self._best_bid is None or self._best_ask is None:
+            return None
+        return self._best_ask - self._best_bid
 
     def to_dict(self) -> Dict[str, Any]:
         """
         Convert to dictionary format with flattened orderbook levels (10 levels).
         
         Returns:
-            Dictionary with symbol, timestamp, exchange, and flattened bid/ask data.
+            Dictionary with symbol, timestamp (UTC datetime), exchange, and flattened bid/ask data.
             Format: bid1, bidamt1, ask1, askamt1, bid2, bidamt2, ask2, askamt2, ...
         """
         result = {
             'symbol': self.symbol,
-            'timestamp': self.timestamp,
+            'timestamp': self.timestamp_dt,
             'exchange': self.exchange
         }
         
-        # Add 10 levels of bid/ask data
-        for i in range(10):
-            result[f'bid{i+1}'] = self.bids[i][0] if i < len(self.bids) else None
-            result[f'bidamt{i+1}'] = self.bids[i][1] if i < len(self.bids) else None
-            result[f'ask{i+1}'] = self.asks[i][0] if i < len(self.asks) else None
-            result[f'askamt{i+1}'] = self.asks[i][1] if i < len(self.asks) else None
+        # Fill the 40 level values by stride (tolist() yields plain Python floats);
+        # levels a side doesn't have stay None
+        bids = self.bids[:10]
+        asks = self.asks[:10]
+        row: List[Optional[float]] = [None] * len(_LEVEL_COLUMNS)
+        row[0:4 * len(bids):4] = bids[:, 0].tolist()
+        row[1:4 * len(bids):4] = bids[:, 1].tolist()
+        row[2:4 * len(asks):4] = asks[:, 0].tolist()
+        row[3:4 * len(asks):4] = asks[:, 1].tolist()
+        result.update(zip(_LEVEL_COLUMNS, row))
         
         return result
 
 
+class CompactHistory:
+    """
+    Fixed-size ring of top-of-book records for one symbol.
+    
+    Stores (ts, bb, ba) = (epoch ms, best bid, best ask) in a preallocated
+    structured array instead of whole OrderbookSnapshot objects.
+    """
+    
+    DTYPE = np.dtype([('ts', 'i8'), ('bb', 'f8'), ('ba', 'f8')])
+    
+    def __init__(self, size: int):
+        self.buffer = np.zeros(size, dtype=self.DTYPE)
+        self._next = 0
+        self._count = 0
+    
+    def __len__(self) -> int:
+        return self._count
+    
+    def append(self, ts: int, best_bid: Optional[float], best_ask: Optional[float]):
+        """Record one update, overwriting the oldest when full."""
+        size = self.buffer.shape[0]
+        if size == 0:
+            return
+        self.buffer[self._next] = (
+            ts,
+            np.nan if best_bid is None else best_bid,
+            np.nan if best_ask is None else best_ask,
+        )
+        self._next = (self._next + 1) % size
+        self._count = min(self._count + 1, size)
+    
+    def to_array(self, limit: Optional[int] = None) -> np.ndarray:
+        """
+        Records oldest first, optionally only the most recent limit.
+        
+        Returns a view of the buffer unless the requested range wraps
+        around the end of the ring.
+        """
+        n = self._count if limit is None else max(0, min(limit, self._count))
+        start = (self._next - n) % self.buffer.shape[0] if n else 0
+        if start + n <= self.buffer.shape[0]:
+            return self.buffer[start:start + n]
+        return np.concatenate([self.buffer[start:], self.buffer[:self._next]])
+
+
 @dataclass
 class TickerSnapshot:
     """Represents a snapshot of ticker data at a point in time."""
     
+    __slots__ = ('symbol', 'timestamp', 'exchange', 'instrument_type', 'data')
+    
     symbol: str
     timestamp: datetime
     exchange: str
@@ -113,24 +338,50 @@ class TickerSnapshot:
         if exchange == 'deribit':
             if self.instrument_type == 'future':
                 if deribit_futures_schema:
-                    required = deribit_futures_schema.REQUIRED_FIELDS
+                    schema = deribit_futures_schema
                 else:
                     return True, []  # Skip validation if schema not available
             elif self.instrument_type == 'option':
                 if deribit_options_schema:
-                    required = deribit_options_schema.REQUIRED_FIELDS
+                    schema = deribit_options_schema
                 else:
                     return True, []
             else:
                 return True, []  # Unknown type, skip validation
             
-            # Check for missing required fields
-            missing = [f for f in required if f not in self.data]
-            return len(missing) == 0, missing
+            # Common case in one C-level call; list missing fields in schema order otherwise
+            if schema.REQUIRED_SET.issubset(self.data):
+                return True, []
+            missing = [f for f in schema.REQUIRED_FIELDS if f not in self.data]
+            return False, missing
         
         return True, []  # Unknown exchange, skip validation
 
 
+class SubscribedOrderbooks(Mapping):
+    """
+    Read-only live view of the orderbooks for one set of subscribed symbols.
+    
+    Nothing is copied; lookups go through to the collector's orderbooks.
+    """
+    
+    def __init__(self, orderbooks: Dict[str, 'OrderbookSnapshot'], symbols: Set[str]):
+        self._orderbooks = orderbooks
+        self._symbols = symbols
+    
+    def __getitem__(self, symbol: str) -> 'OrderbookSnapshot':
+        if symbol not in self._symbols:
+            raise KeyError(symbol)
+        return self._orderbooks[symbol]
+    
+    def __iter__(self):
+        orderbooks = self._orderbooks
+        return (symbol for symbol in list(self._symbols) if symbol in orderbooks)
+    
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+
 @dataclass
 class StreamConfig:
     """Configuration for the streaming data collector."""
@@ -140,13 +391,29 @@ class StreamConfig:
     api_secret: Optional[str] = None
     testnet: bool = False
     orderbook_limit: int = 20  # Number of orderbook levels to fetch
-    reconnect_delay: int = 5  # Seconds to wait before reconnecting
+    reconnect_delay: int = 5  # Seconds to wait before the first reconnect; doubles per attempt
+    max_reconnect_delay: int = 60  # Cap for the doubled reconnect delay
     max_reconnect_attempts: int = 10
     rate_limit: bool = True
+    ws_compression: bool = False  # Offer permessage-deflate on the websocket
+    store_snapshots: bool = True  # Keep recent snapshots per symbol
+    max_snapshots_per_symbol: int = 1000
+    history_compact: bool = False  # Keep only (ts, best bid, best ask) per update
+    callback_queue_size: int = 0  # >0: run on_orderbook_update from a bounded queue (drops oldest)
+    skip_unchanged_books: bool = False  # Drop updates whose levels equal the previous snapshot's
+    # Run sync on_orderbook_update in a thread pool (must be thread-safe)
+    offload_callback: bool = False
+    batch_window_ms: int = 10  # How long on_orderbook_batch collects updates per call
+    orderbook_dtype: type = np.float64  # np.float32 halves level storage (~7 significant digits)
+    # Result of an earlier load_markets(); skips the REST fetch in start()
+    markets: Optional[Dict] = None
+    # Exchange params for load_markets(), e.g. {'currency': 'BTC'} on Deribit
+    markets_params: Optional[Dict] = None
     
-    # Callback settings
+    # Callback settings (plain functions or coroutine functions)
     on_orderbook_update: Optional[Callable] = None
-    on_error: Optional[Callable] = None
+    on_orderbook_batch: Optional[Callable] = None  # Receives List[OrderbookSnapshot]
+    on_error: Optional[Callable] = None  # Called as on_error(symbol, exception)
 
 
 class CCXTProCollector:
@@ -193,21 +460,60 @@ class CCXTProCollector:
         self.subscribed_futures: Set[str] = set()
         self.subscribed_options: Set[str] = set()
         
-        # Store latest orderbook snapshots
+        # Store latest orderbook snapshots (plus read-only views handed to callers)
         self.orderbooks: Dict[str, OrderbookSnapshot] = {}
+        self._orderbooks_view = MappingProxyType(self.orderbooks)
+        self._futures_view = SubscribedOrderbooks(self.orderbooks, self.subscribed_futures)
+        self._options_view = SubscribedOrderbooks(self.orderbooks, self.subscribed_options)
+        
+        # Recent snapshots per symbol; bounded deques drop the oldest in O(1).
+        # With history_compact, a CompactHistory ring of top-of-book records.
+        self.snapshot_history: Dict[
+            str, Union[Deque[OrderbookSnapshot], CompactHistory]
+        ] = defaultdict(
+            (lambda: CompactHistory(self.config.max_snapshots_per_symbol))
+            if self.config.history_compact
+            else (lambda: deque(maxlen=self.config.max_snapshots_per_symbol))
+        )
         
-        # Track running tasks
-        self.tasks: List[asyncio.Task] = []
+        # Track running tasks (finished tasks remove themselves)
+        self.tasks: Set[asyncio.Task] = set()
         self.is_running: bool = False
         
+        # One stream task watches every subscribed symbol; it restarts the
+        # exchange watch whenever this event signals a changed symbol set
+        # (created in start(), inside the loop that waits on it)
+        self._stream_task: Optional[asyncio.Task] = None
+        self._symbols_changed: Optional[asyncio.Event] = None
+        
+        # Optional decoupling of the user callback from the websocket reads
+        self._cb_queue: Optional[asyncio.Queue] = None
+        self.dropped_updates: int = 0
+        self.unchanged_updates: int = 0  # Skipped by skip_unchanged_books
+        self._thread_pool: Optional[ThreadPoolExecutor] = None
+        
+        # Snapshots waiting for the next on_orderbook_batch call; the events
+        # are created in start() with the flusher task
+        self._pending_batch: List[OrderbookSnapshot] = []
+        self._batch_ready: Optional[asyncio.Event] = None
+        self._batch_stopping: Optional[asyncio.Event] = None
+        self._batch_task: Optional[asyncio.Task] = None
+        
         # Market metadata cache
         self._futures_markets: Dict[str, Dict] = {}
         self._options_markets: Dict[str, Dict] = {}
         self._markets_loaded: bool = False
+        
+        # Sorted symbol lists and filter results, rebuilt when markets load
+        self._futures_sorted: List[str] = []
+        self._options_sorted: List[str] = []
+        self._options_parsed: Dict[str, Tuple[str, str, str, str]] = {}
+        self._options_by_base: Dict[str, List[str]] = {}  # Sorted symbols per base currency
+        self._symbol_query_cache: Dict[tuple, List[str]] = {}
     
     async def start(self):
         """Initialize the exchange connection and load markets."""
-        logger.info(f"Initializing {self.config.exchange_id} connection...")
+        logger.info("Initializing %s connection...", self.config.exchange_id)
         
         # Initialize exchange
         exchange_class = getattr(ccxtpro, self.config.exchange_id)
@@ -223,32 +529,76 @@ class CCXTProCollector:
         if self.config.testnet:
             exchange_config['options'] = {'defaultType': 'test'}
         
+        if not self.config.ws_compression:
+            # Orderbook frames are small JSON; inflating each one costs more CPU than it saves
+            exchange_config.setdefault('options', {})['ws'] = {'compress': 0}
+        
         self.exchange = exchange_class(exchange_config)
+        if self.config.markets:
+            # load_markets() returns these instead of refetching the instruments
+            self.exchange.set_markets(self.config.markets)
         
         # Load markets
         await self._load_markets()
         
         self.is_running = True
-        logger.info(f"Connected to {self.config.exchange_id}")
+        self._symbols_changed = asyncio.Event()
+        
+        if self.config.offload_callback:
+            self._thread_pool = ThreadPoolExecutor(
+                max_workers=min(32, (os.cpu_count() or 1) * 4),
+                thread_name_prefix='orderbook-callback'
+            )
+        
+        if self.config.callback_queue_size > 0:
+            self._cb_queue = asyncio.Queue(maxsize=self.config.callback_queue_size)
+            worker = asyncio.create_task(self._callback_worker())
+            self.tasks.add(worker)
+            worker.add_done_callback(self.tasks.discard)
+        
+        if self.config.on_orderbook_batch:
+            self._batch_ready = asyncio.Event()
+            self._batch_stopping = asyncio.Event()
+            self._batch_task = asyncio.create_task(self._batch_flusher())
+            self.tasks.add(self._batch_task)
+            self._batch_task.add_done_callback(self.tasks.discard)
+        
+        logger.info("Connected to %s", self.config.exchange_id)
     
     async def stop(self):
         """Stop all streaming tasks and close exchange connection."""
         logger.info("Stopping data collector...")
         self.is_running = False
         
-        # Cancel all running tasks
-        for task in self.tasks:
+        # Cancel all running tasks; the batch flusher is left to drain below
+        tasks = [task for task in self.tasks if task is not self._batch_task]
+        for task in tasks:
             if not task.done():
                 task.cancel()
         
         # Wait for all tasks to complete
-        if self.tasks:
-            await asyncio.gather(*self.tasks, return_exceptions=True)
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        
+        # No more snapshots can arrive: hand the pending batch to
+        # on_orderbook_batch, after which the flusher exits
+        if self._batch_task is not None:
+            self._batch_stopping.set()
+            self._batch_ready.set()
+            await asyncio.gather(self._batch_task, return_exceptions=True)
+            self._batch_task = None
+            self._batch_ready = self._batch_stopping = None
+        
+        if self._thread_pool is not None:
+            self._thread_pool.shutdown(wait=False, cancel_futures=True)
+            self._thread_pool = None
         
         # Close exchange connection
         if self.exchange:
             await self.exchange.close()
         
+        if self.dropped_updates:
+            logger.warning("Callback queue dropped %d updates in total", self.dropped_updates)
         logger.info("Data collector stopped")
     
     async def _load_markets(self):
@@ -257,19 +607,39 @@ class CCXTProCollector:
             raise RuntimeError("Exchange not initialized. Call start() first.")
         
         logger.info("Loading markets...")
-        markets = await self.exchange.load_markets()
+        # Params filter the instrument download at the exchange
+        markets = await self.exchange.load_markets(params=self.config.markets_params or {})
         
-        # Separate futures and options markets
+        # Separate futures and options markets in one pass, reading the type once;
+        # fresh dicts so a reload drops delisted instruments
+        futures: Dict[str, Dict] = {}
+        options: Dict[str, Dict] = {}
         for symbol, market in markets.items():
-            if market.get('type') == 'future' or market.get('future'):
-                self._futures_markets[symbol] = market
-            elif market.get('type') == 'option' or market.get('option'):
-                self._options_markets[symbol] = market
+            market_type = market.get('type')
+            if market_type == 'future' or market.get('future'):
+                futures[symbol] = market
+            elif market_type == 'option' or market.get('option'):
+                options[symbol] = market
+        self._futures_markets = futures
+        self._options_markets = options
+        
+        self._futures_sorted = sorted(self._futures_markets)
+        self._options_sorted = sorted(self._options_markets)
+        self._options_parsed = {
+            symbol: _parse_option_market(symbol, market)
+            for symbol, market in self._options_markets.items()
+        }
+        # Base-filtered queries start from their own slice, not every option
+        options_by_base: Dict[str, List[str]] = defaultdict(list)
+        for symbol in self._options_sorted:
+            options_by_base[self._options_parsed[symbol][0]].append(symbol)
+        self._options_by_base = dict(options_by_base)
+        self._symbol_query_cache.clear()
         
         self._markets_loaded = True
         logger.info(
-            f"Loaded {len(self._futures_markets)} futures "
-            f"and {len(self._options_markets)} options markets"
+            "Loaded %d futures and %d options markets",
+            len(self._futures_markets), len(self._options_markets)
         )
     
     def get_available_futures(self, base_currency: Optional[str] = None) -> List[str]:
@@ -285,12 +655,18 @@ class CCXTProCollector:
         if not self._markets_loaded:
             raise RuntimeError("Markets not loaded. Call start() first.")
         
-        symbols = list(self._futures_markets.keys())
-        
-        if base_currency:
-            symbols = [s for s in symbols if s.startswith(base_currency)]
+        # Markets are fixed once loaded, so each filter combination is scanned once
+        key = ('future', base_currency)
+        symbols = self._symbol_query_cache.get(key)
+        if symbols is None:
+            symbols = self._futures_sorted
+            
+            if base_currency:
+                symbols = [s for s in symbols if s.startswith(base_currency)]
+            
+            self._symbol_query_cache[key] = symbols
         
-        return sorted(symbols)
+        return list(symbols)
     
     def get_available_options(
         self,
@@ -304,7 +680,8 @@ class CCXTProCollector:
         Args:
             base_currency: Filter by base currency (e.g., 'BTC', 'ETH')
             option_type: Filter by 'C' (call) or 'P' (put)
-            expiry: Filter by expiry date string (e.g., '30DEC24')
+            expiry: Filter by expiry: the symbol's YYMMDD date (e.g., '241230')
+                or all or part of the exchange's date (e.g., '30DEC24', 'DEC24')
             
         Returns:
             List of options symbol strings
@@ -312,18 +689,30 @@ class CCXTProCollector:
         if not self._markets_loaded:
             raise RuntimeError("Markets not loaded. Call start() first.")
         
-        symbols = list(self._options_markets.keys())
-        
-        if base_currency:
-            symbols = [s for s in symbols if s.startswith(base_currency)]
-        
-        if option_type:
-            symbols = [s for s in symbols if f'-{option_type}' in s]
-        
-        if expiry:
-            symbols = [s for s in symbols if expiry in s]
+        key = ('option', base_currency, option_type, expiry)
+        symbols = self._symbol_query_cache.get(key)
+        if symbols is None:
+            # Filtering the presorted list keeps the result sorted; fields were
+            # parsed once at load, so strikes never collide with the filters
+            parsed = self._options_parsed
+            
+            if base_currency:
+                symbols = self._options_by_base.get(base_currency, [])
+            else:
+                symbols = self._options_sorted
+            
+            if option_type:
+                symbols = [s for s in symbols if parsed[s][3] == option_type]
+            
+            if expiry:
+                symbols = [
+                    s for s in symbols
+                    if parsed[s][1] == expiry or (parsed[s][2] and expiry in parsed[s][2])
+                ]
+            
+            self._symbol_query_cache[key] = symbols
         
-        return sorted(symbols)
+        return list(symbols)
     
     async def subscribe_futures(self, symbols: List[str]):
         """
@@ -335,13 +724,14 @@ class CCXTProCollector:
         if not self.is_running:
             raise RuntimeError("Collector not running. Call start() first.")
         
-        for symbol in symbols:
-            if symbol not in self.subscribed_futures:
-                self.subscribed_futures.add(symbol)
-                # Create a task for each symbol
-                task = asyncio.create_task(self._stream_orderbook(symbol, 'future'))
-                self.tasks.append(task)
-                logger.info(f"Subscribed to futures orderbook: {symbol}")
+        new_symbols = set(symbols) - self.subscribed_futures
+        if not new_symbols:
+            return
+        
+        self.subscribed_futures |= new_symbols
+        self._on_symbols_changed()
+        for symbol in sorted(new_symbols):
+            logger.info("Subscribed to futures orderbook: %s", symbol)
     
     async def subscribe_options(self, symbols: List[str]):
         """
@@ -353,13 +743,14 @@ class CCXTProCollector:
         if not self.is_running:
             raise RuntimeError("Collector not running. Call start() first.")
         
-        for symbol in symbols:
-            if symbol not in self.subscribed_options:
-                self.subscribed_options.add(symbol)
-                # Create a task for each symbol
-                task = asyncio.create_task(self._stream_orderbook(symbol, 'option'))
-                self.tasks.append(task)
-                logger.info(f"Subscribed to options orderbook: {symbol}")
+        new_symbols = set(symbols) - self.subscribed_options
+        if not new_symbols:
+            return
+        
+        self.subscribed_options |= new_symbols
+        self._on_symbols_changed()
+        for symbol in sorted(new_symbols):
+            logger.info("Subscribed to options orderbook: %s", symbol)
     
     async def subscribe_all_futures(self, base_currency: Optional[str] = None):
         """
@@ -397,71 +788,247 @@ class CCXTProCollector:
         """
         self.subscribed_futures.discard(symbol)
         self.subscribed_options.discard(symbol)
-        logger.info(f"Unsubscribed from: {symbol}")
+        if self._symbols_changed is not None:
+            self._symbols_changed.set()
+        logger.info("Unsubscribed from: %s", symbol)
+    
+    def _on_symbols_changed(self):
+        """Signal the stream task to pick up the new symbol set, starting it if needed."""
+        self._symbols_changed.set()
+        if self._stream_task is None or self._stream_task.done():
+            self._stream_task = asyncio.create_task(self._stream_loop())
+            self.tasks.add(self._stream_task)
+            self._stream_task.add_done_callback(self.tasks.discard)
     
-    async def _stream_orderbook(self, symbol: str, market_type: str):
+    async def _stream_loop(self):
         """
-        Stream orderbook updates for a specific symbol.
+        Stream orderbooks for all subscribed symbols from a single task.
         
-        Args:
-            symbol: Symbol to stream
-            market_type: 'future' or 'option'
+        Each symbol set gets one batched watch; when subscriptions change
+        the watch is cancelled and restarted with the new set.
+        """
+        while self.is_running:
+            symbols = sorted(self.subscribed_futures | self.subscribed_options)
+            self._symbols_changed.clear()
+            if not symbols:
+                await self._symbols_changed.wait()
+                continue
+            
+            watcher = asyncio.create_task(self._watch_symbols(symbols))
+            changed = asyncio.create_task(self._symbols_changed.wait())
+            try:
+                done, _ = await asyncio.wait(
+                    {watcher, changed}, return_when=asyncio.FIRST_COMPLETED
+                )
+            finally:
+                watcher.cancel()
+                changed.cancel()
+                await asyncio.gather(watcher, changed, return_exceptions=True)
+            
+            if changed not in done:
+                # Watcher gave up after max reconnect attempts; resume on the
+                # next subscription change
+                await self._symbols_changed.wait()
+    
+    async def _watch_symbols(self, symbols: List[str]):
         """
+        Watch a fixed set of symbols until cancelled or out of reconnect attempts.
+        
+        Uses watch_order_book_for_symbols where the exchange supports it, and
+        otherwise one watch_order_book loop per symbol inside this task.
+        """
+        if len(symbols) > 1 and not self.exchange.has.get('watchOrderBookForSymbols'):
+            await asyncio.gather(*(self._watch_symbols([symbol]) for symbol in symbols))
+            return
+        
+        label = symbols[0] if len(symbols) == 1 else ','.join(symbols)
         reconnect_attempts = 0
         
-        while self.is_running and (
-            symbol in self.subscribed_futures or symbol in self.subscribed_options
-        ):
+        while self.is_running:
             try:
                 # Watch orderbook updates
-                orderbook = await self.exchange.watch_order_book(
-                    symbol,
-                    limit=self.config.orderbook_limit
-                )
+                if len(symbols) == 1:
+                    orderbook = await self.exchange.watch_order_book(
+                        symbols[0],
+                        limit=self.config.orderbook_limit
+                    )
+                else:
+                    orderbook = await self.exchange.watch_order_book_for_symbols(
+                        symbols,
+                        limit=self.config.orderbook_limit
+                    )
                 
                 # Reset reconnect counter on successful connection
                 reconnect_attempts = 0
                 
-                # Create snapshot
-                snapshot = OrderbookSnapshot(
-                    symbol=symbol,
-                    timestamp=datetime.fromtimestamp(orderbook['timestamp'] / 1000)
-                    if orderbook.get('timestamp')
-                    else datetime.now(),
-                    bids=orderbook['bids'],
-                    asks=orderbook['asks'],
-                    exchange=self.config.exchange_id
-                )
-                
-                # Store latest snapshot
-                self.orderbooks[symbol] = snapshot
-                
-                # Call user callback if provided
-                if self.config.on_orderbook_update:
-                    try:
-                        await self.config.on_orderbook_update(snapshot)
-                    except Exception as e:
-                        logger.error(f"Error in orderbook callback: {e}")
+                await self._handle_orderbook(orderbook.get('symbol') or symbols[0], orderbook)
                 
             except Exception as e:
-                logger.error(f"Error streaming {symbol}: {e}")
+                logger.error("Error streaming %s: %s", label, e)
                 reconnect_attempts += 1
                 
                 if reconnect_attempts >= self.config.max_reconnect_attempts:
                     logger.error(
-                        f"Max reconnect attempts reached for {symbol}. Giving up."
+                        "Max reconnect attempts reached for %s. Giving up.", label
                     )
                     break
                 
-                # Call error callback if provided
+                # Call error callback if provided, once per symbol of the failed watch
                 if self.config.on_error:
-                    try:
-                        await self.config.on_error(symbol, e)
-                    except Exception as callback_error:
-                        logger.error(f"Error in error callback: {callback_error}")
+                    for symbol in symbols:
+                        try:
+                            result = self.config.on_error(symbol, e)
+                            if asyncio.iscoroutine(result):
+                                await result
+                        except Exception as callback_error:
+                            logger.error("Error in error callback: %s", callback_error)
                 
-                # Wait before reconnecting
-                await asyncio.sleep(self.config.reconnect_delay)
+                # Exponential backoff with jitter, so per-symbol watchers that
+                # failed together don't all reconnect at the same instant
+                base = self.config.reconnect_delay
+                delay = min(self.config.max_reconnect_delay, base * 2 ** (reconnect_attempts - 1))
+                await asyncio.sleep(delay + random.uniform(0, base))
+    
+    async def _handle_orderbook(self, symbol: str, orderbook: Dict):
+        """
+        Store an orderbook update and pass it to the user callback.
+        
+        Args:
+            symbol: Symbol the update belongs to
+            orderbook: Orderbook dict as returned by CCXT Pro
+        """
+        # Create snapshot
+        dtype = self.config.orderbook_dtype
+        snapshot = OrderbookSnapshot(
+            symbol=symbol,
+            timestamp=orderbook.get('timestamp') or int(time.time() * 1000),
+            bids=_levels_array(orderbook['bids'], dtype),
+            asks=_levels_array(orderbook['asks'], dtype),
+            exchange=self.config.exchange_id
+        )
+        
+        if self.config.skip_unchanged_books:
+            # Exact comparison of the level arrays; no hashing, no collisions
+            previous = self.orderbooks.get(symbol)
+            if (
+                previous is not None
+                and np.array_equal(previous.bids, snapshot.bids)
+                and np.array_equal(previous.asks, snapshot.asks)
+            ):
+                self.unchanged_updates += 1
+                return
+        
+        # Store latest snapshot
+        self.orderbooks[symbol] = snapshot
+        if self.config.store_snapshots:
+            if self.config.history_compact:
+                self.snapshot_history[symbol].append(
+                    snapshot.timestamp,
+                    snapshot.best_bid,
+                    snapshot.best_ask
+                )
+            else:
+                self.snapshot_history[symbol].append(snapshot)
+        
+        # Set up by start() when on_orderbook_batch was configured
+        if self._batch_ready is not None:
+            self._pending_batch.append(snapshot)
+            self._batch_ready.set()
+        
+        # Call user callback if provided
+        callback = self.config.on_orderbook_update
+        if callback:
+            if self._cb_queue is not None:
+                self._enqueue_callback(snapshot)
+                return
+            if self._offloads(callback):
+                # Fire and forget so the next read is not held up by the callback
+                future = asyncio.get_running_loop().run_in_executor(
+                    self._thread_pool, callback, snapshot
+                )
+                future.add_done_callback(self._log_callback_error)
+                return
+            try:
+                # Sync callbacks skip a coroutine allocation per message
+                result = callback(snapshot)
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception as e:
+                logger.error("Error in orderbook callback: %s", e)
+    
+    def _offloads(self, callback: Callable) -> bool:
+        """Whether callback runs in the thread pool (coroutine functions stay on the loop)."""
+        return self._thread_pool is not None and not asyncio.iscoroutinefunction(callback)
+    
+    @staticmethod
+    def _log_callback_error(future: asyncio.Future):
+        """Log an exception raised by an offloaded callback."""
+        if not future.cancelled() and future.exception() is not None:
+            logger.error("Error in orderbook callback: %s", future.exception())
+    
+    def _enqueue_callback(self, snapshot: OrderbookSnapshot):
+        """Queue a snapshot for the callback worker, evicting the oldest when full."""
+        queue = self._cb_queue
+        if queue.full():
+            queue.get_nowait()
+            queue.task_done()
+            self.dropped_updates += 1
+            if self.dropped_updates == 1 or self.dropped_updates % 1000 == 0:
+                logger.warning(
+                    "Callback queue full; dropped %d updates so far", self.dropped_updates
+                )
+        queue.put_nowait(snapshot)
+    
+    async def _callback_worker(self):
+        """Run on_orderbook_update for queued snapshots, in arrival order."""
+        queue = self._cb_queue
+        while True:
+            snapshot = await queue.get()
+            try:
+                callback = self.config.on_orderbook_update
+                if callback:
+                    if self._offloads(callback):
+                        # Awaited here, so queued callbacks keep their order
+                        await asyncio.get_running_loop().run_in_executor(
+                            self._thread_pool, callback, snapshot
+                        )
+                    else:
+                        result = callback(snapshot)
+                        if asyncio.iscoroutine(result):
+                            await result
+            except Exception as e:
+                logger.error("Error in orderbook callback: %s", e)
+            finally:
+                queue.task_done()
+    
+    async def _batch_flusher(self):
+        """
+        Deliver accumulated snapshots to on_orderbook_batch once per batch window.
+        
+        When stop() signals, the window in progress is cut short, the
+        remaining snapshots are delivered and the flusher returns.
+        """
+        window = self.config.batch_window_ms / 1000
+        stopping = self._batch_stopping
+        while True:
+            # Wait out a window only while updates are pending; an idle stream costs nothing
+            await self._batch_ready.wait()
+            if not stopping.is_set():
+                try:
+                    await asyncio.wait_for(stopping.wait(), window)
+                except asyncio.TimeoutError:
+                    pass
+            batch, self._pending_batch = self._pending_batch, []
+            self._batch_ready.clear()
+            if batch:
+                try:
+                    result = self.config.on_orderbook_batch(batch)
+                    if asyncio.iscoroutine(result):
+                        await result
+                except Exception as e:
+                    logger.error("Error in orderbook batch callback: %s", e)
+            if stopping.is_set() and not self._pending_batch:
+                return
     
     def get_latest_orderbook(self, symbol: str) -> Optional[OrderbookSnapshot]:
         """
@@ -475,43 +1042,84 @@ class CCXTProCollector:
         """
         return self.orderbooks.get(symbol)
     
-    def get_all_orderbooks(self) -> Dict[str, OrderbookSnapshot]:
+    def get_snapshot_history(
+        self,
+        symbol: str,
+        limit: Optional[int] = None
+    ) -> Union[List[OrderbookSnapshot], np.ndarray]:
+        """
+        Get stored snapshots for a symbol, oldest first.
+        
+        Args:
+            symbol: Symbol to retrieve
+            limit: Return only the most recent limit snapshots
+            
+        Returns:
+            List of OrderbookSnapshot (empty if none stored), or with
+            history_compact a CompactHistory.DTYPE structured array
+        """
+        history = self.snapshot_history.get(symbol)
+        if isinstance(history, CompactHistory):
+            return history.to_array(limit)
+        if not history:
+            if self.config.history_compact:
+                return np.empty(0, dtype=CompactHistory.DTYPE)
+            return []
+        if limit is None:
+            return list(history)
+        return list(islice(history, max(0, len(history) - limit), len(history)))
+    
+    def get_all_orderbooks(self, copy: bool = False) -> Mapping[str, OrderbookSnapshot]:
         """
         Get all latest orderbook snapshots.
         
+        Args:
+            copy: Return a point-in-time dict instead of the live view
+            
         Returns:
-            Dictionary mapping symbols to their latest OrderbookSnapshot
+            Read-only live mapping of symbols to their latest OrderbookSnapshot,
+            or a new dict when copy is True
         """
-        return self.orderbooks.copy()
+        if copy:
+            return self.orderbooks.copy()
+        return self._orderbooks_view
     
     def get_orderbooks_as_dataframe(self) -> pd.DataFrame:
         """
         Convert current orderbook snapshots to a pandas DataFrame.
         
+        Runs on the calling thread; from a coroutine this blocks the event
+        loop, so prefer get_orderbooks_as_dataframe_async() there.
+        
         Returns:
             DataFrame with orderbook data for all subscribed symbols
         """
         if not self.orderbooks:
             return pd.DataFrame()
         
-        data = [ob.to_dict() for ob in self.orderbooks.values()]
-        return pd.DataFrame(data)
+        snapshots = list(self.orderbooks.values())
+        return _snapshots_frame(
+            snapshots, [ob.exchange for ob in snapshots], self.config.orderbook_dtype
+        )
     
-    def get_futures_orderbooks(self) -> Dict[str, OrderbookSnapshot]:
-        """Get orderbooks for all subscribed futures."""
-        return {
-            symbol: ob
-            for symbol, ob in self.orderbooks.items()
-            if symbol in self.subscribed_futures
-        }
+    async def get_orderbooks_as_dataframe_async(self) -> pd.DataFrame:
+        """
+        Build get_orderbooks_as_dataframe() in a worker thread.
+        
+        Websocket reads keep running while the frame is built.
+        
+        Returns:
+            DataFrame with orderbook data for all subscribed symbols
+        """
+        return await asyncio.to_thread(self.get_orderbooks_as_dataframe)
     
-    def get_options_orderbooks(self) -> Dict[str, OrderbookSnapshot]:
-        """Get orderbooks for all subscribed options."""
-        return {
-            symbol: ob
-            for symbol, ob in self.orderbooks.items()
-            if symbol in self.subscribed_options
-        }
+    def get_futures_orderbooks(self) -> Mapping[str, OrderbookSnapshot]:
+        """Get orderbooks for all subscribed futures (read-only live view)."""
+        return self._futures_view
+    
+    def get_options_orderbooks(self) -> Mapping[str, OrderbookSnapshot]:
+        """Get orderbooks for all subscribed options (read-only live view)."""
+        return self._options_view
     
     async def get_market_info(self, symbol: str) -> Optional[Dict]:
         """
@@ -592,14 +1200,16 @@ class CCXTProCollector:
         """
         if self.config.exchange_id == 'deribit':
             if instrument_type == 'future' and deribit_futures_schema:
-                required = deribit_futures_schema.REQUIRED_FIELDS
+                schema = deribit_futures_schema
             elif instrument_type == 'option' and deribit_options_schema:
-                required = deribit_options_schema.REQUIRED_FIELDS
+                schema = deribit_options_schema
             else:
                 return True, []  # No schema available
             
-            missing = [f for f in required if f not in data]
-            return len(missing) == 0, missing
+            if schema.REQUIRED_SET.issubset(data):
+                return True, []
+            missing = [f for f in schema.REQUIRED_FIELDS if f not in data]
+            return False, missing
         
         return True, []  # Unknown exchange
 
@@ -624,13 +1234,13 @@ class MultiExchangeCollector:
             config: StreamConfig for the exchange
         """
         if config.exchange_id in self.collectors:
-            logger.warning(f"Exchange {config.exchange_id} already added")
+            logger.warning("Exchange %s already added", config.exchange_id)
             return
         
         collector = CCXTProCollector(config)
         await collector.start()
         self.collectors[config.exchange_id] = collector
-        logger.info(f"Added exchange: {config.exchange_id}")
+        logger.info("Added exchange: %s", config.exchange_id)
     
     async def stop_all(self):
         """Stop all exchange collectors."""
@@ -664,12 +1274,12 @@ class MultiExchangeCollector:
         Returns:
             DataFrame with comparison data
         """
-        data = []
+        snapshots = []
+        exchanges = []
         for exchange_id, collector in self.collectors.items():
             ob = collector.get_latest_orderbook(symbol)
             if ob:
-                row = ob.to_dict()
-                row['exchange'] = exchange_id
-                data.append(row)
+                snapshots.append(ob)
+                exchanges.append(exchange_id)
         
-        return pd.DataFrame(data) if data else pd.DataFrame()
+        return _snapshots_frame(snapshots, exchanges) if snapshots else pd.DataFrame()
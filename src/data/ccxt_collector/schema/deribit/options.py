@@ -35,4 +35,7 @@ OPTIONAL_FIELDS = [
     "open_interest",          # Current open interest
 ]
 
-ALL_FIELDS = REQUIRED_FIELDS + OPTIONAL_FIELDS
\ No newline at end of file
+ALL_FIELDS = REQUIRED_FIELDS + OPTIONAL_FIELDS
+
+# For O(1) membership and one-call subset checks during validation
+REQUIRED_SET = frozenset(REQUIRED_FIELDS)
\ No newline at end of file
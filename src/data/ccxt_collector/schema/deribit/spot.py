@@ -31,3 +31,6 @@ OPTIONAL_FIELDS = [
 ]
 
 ALL_FIELDS = REQUIRED_FIELDS + OPTIONAL_FIELDS
+
+# For O(1) membership and one-call subset checks during validation
+REQUIRED_SET = frozenset(REQUIRED_FIELDS)
@@ -10,6 +10,7 @@ from .logger import (
     get_logger,
     setup_logging,
     configure_logger,
+    stop_queue_listener,
     LogLevel,
 )
 
@@ -17,5 +18,6 @@ __all__ = [
     "get_logger",
     "setup_logging",
     "configure_logger",
+    "stop_queue_listener",
     "LogLevel",
 ]
@@ -18,13 +18,20 @@ Example usage:
     >>> logger.error("An error occurred", exc_info=True)
 """
 
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Optional, Union
 from enum import Enum
 
 
+# Background listener used when setup_logging(use_queue=True)
+_queue_listener: Optional[QueueListener] = None
+
+
 class LogLevel(str, Enum):
     """Enumeration of available log levels."""
     DEBUG = "DEBUG"
@@ -34,6 +41,17 @@ class LogLevel(str, Enum):
     CRITICAL = "CRITICAL"
 
 
+# LogLevel -> numeric logging level, resolved once at import
+_LEVELS = {level: getattr(logging, level.value) for level in LogLevel}
+
+
+def _level_to_int(level: Union[str, LogLevel]) -> int:
+    """Convert a level name or LogLevel to its numeric logging level."""
+    if isinstance(level, str) and not isinstance(level, LogLevel):
+        level = LogLevel(level.upper())
+    return _LEVELS[level]
+
+
 class ColoredFormatter(logging.Formatter):
     """Custom formatter with color support for console output."""
     
@@ -47,15 +65,26 @@ class ColoredFormatter(logging.Formatter):
         'RESET': '\033[0m'        # Reset
     }
     
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        reset = self.COLORS['RESET']
+        # Colored level names are built once, not per record
+        self._colored = {
+            name: f"{color}{name}{reset}"
+            for name, color in self.COLORS.items()
+            if name != 'RESET'
+        }
+
     def format(self, record):
         """Format log record with color if outputting to console."""
-        log_color = self.COLORS.get(record.levelname, self.COLORS['RESET'])
-        reset_color = self.COLORS['RESET']
-        
-        # Add color to level name
-        record.levelname = f"{log_color}{record.levelname}{reset_color}"
-        
-        return super().format(record)
+        # The record is shared with every other handler (e.g. the file
+        # handler), so the plain level name is restored afterwards
+        levelname = record.levelname
+        record.levelname = self._colored.get(levelname, levelname)
+        try:
+            return super().format(record)
+        finally:
+            record.levelname = levelname
 
 
 def setup_logging(
@@ -66,6 +95,7 @@ def setup_logging(
     colored: bool = True,
     format_string: Optional[str] = None,
     date_format: Optional[str] = None,
+    use_queue: bool = False,
 ) -> None:
     """
     Configure global logging settings for the application.
@@ -83,6 +113,9 @@ def setup_logging(
         colored: Whether to use colored output for console (default: True)
         format_string: Custom format string for log messages
         date_format: Custom date format string
+        use_queue: Route records through a QueueHandler so formatting and I/O
+                  run on a background QueueListener thread instead of the
+                  caller (useful inside asyncio event loops)
     
     Example:
         >>> setup_logging(
@@ -92,16 +125,18 @@ def setup_logging(
         ...     colored=True
         ... )
     """
-    # Convert string to LogLevel if needed
-    if isinstance(level, str):
-        level = LogLevel(level.upper())
+    global _queue_listener
+    
+    log_level = _level_to_int(level)
     
     # Get root logger
     root_logger = logging.getLogger()
-    root_logger.setLevel(getattr(logging, level.value))
+    root_logger.setLevel(log_level)
     
     # Remove existing handlers
+    stop_queue_listener()
     root_logger.handlers.clear()
+    handlers = []
     
     # Default format strings
     if format_string is None:
@@ -113,7 +148,7 @@ def setup_logging(
     # Console handler
     if console:
         console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(getattr(logging, level.value))
+        console_handler.setLevel(log_level)
         
         if colored and sys.stdout.isatty():
             console_formatter = ColoredFormatter(format_string, datefmt=date_format)
@@ -121,7 +156,7 @@ def setup_logging(
             console_formatter = logging.Formatter(format_string, datefmt=date_format)
         
         console_handler.setFormatter(console_formatter)
-        root_logger.addHandler(console_handler)
+        handlers.append(console_handler)
     
     # File handler
     if log_file is not None:
@@ -135,16 +170,42 @@ def setup_logging(
         log_path.parent.mkdir(parents=True, exist_ok=True)
         
         file_handler = logging.FileHandler(log_path, mode='a', encoding='utf-8')
-        file_handler.setLevel(getattr(logging, level.value))
+        file_handler.setLevel(log_level)
         
         # File logs should not be colored
         file_formatter = logging.Formatter(format_string, datefmt=date_format)
         file_handler.setFormatter(file_formatter)
-        root_logger.addHandler(file_handler)
-        
+        handlers.append(file_handler)
+    
+    if use_queue and handlers:
+        log_queue = queue.SimpleQueue()
+        _queue_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _queue_listener.start()
+        root_logger.addHandler(QueueHandler(log_queue))
+    else:
+        for handler in handlers:
+            root_logger.addHandler(handler)
+    
+    if log_file is not None:
         root_logger.info(f"Logging to file: {log_path}")
 
 
+def stop_queue_listener() -> None:
+    """
+    Stop the background log listener started by setup_logging(use_queue=True).
+    
+    Pending records are flushed to their handlers before returning. Called
+    automatically at interpreter exit; safe to call when no listener is running.
+    """
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+atexit.register(stop_queue_listener)
+
+
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger instance for the specified module.
@@ -197,9 +258,7 @@ def configure_logger(
     logger = logging.getLogger(name)
     
     if level is not None:
-        if isinstance(level, str):
-            level = LogLevel(level.upper())
-        logger.setLevel(getattr(logging, level.value))
+        logger.setLevel(_level_to_int(level))
     
     if handlers is not None:
         # Clear existing handlers for this logger
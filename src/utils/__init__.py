@@ -10,4 +10,22 @@ This package includes:
 
 from .math_utils import *
 from .date_utils import *
-from .plotting import *
+
+# plotting imports matplotlib, which is slow to load; import it on first use
+_PLOTTING_NAMES = frozenset({
+    'plot_volatility_surface',
+    'plot_volatility_smile',
+    'plot_pnl_distribution',
+    'plot_greeks_profile',
+})
+
+
+def __getattr__(name):
+    if name in _PLOTTING_NAMES:
+        from . import plotting
+        return getattr(plotting, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | _PLOTTING_NAMES)
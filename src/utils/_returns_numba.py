@@ -0,0 +1,89 @@
+"""
+Numba-compiled return and volatility kernels.
+
+Optional accelerators for math_utils; importing this module raises
+ImportError when numba is not installed.
+"""
+
+import math
+
+from numba import njit, prange
+
+
+@njit(fastmath=True, error_model='numpy')
+def population_std(x):
+    """
+    Population standard deviation (ddof=0, as np.std) without temporaries.
+
+    Two vectorizable passes: the mean, then the sum of squared deviations,
+    where np.std also materializes the deviation array.
+    """
+    n = x.shape[0]
+    total = 0.0
+    for i in range(n):
+        total += x[i]
+    mean = total / n
+    m2 = 0.0
+    for i in range(n):
+        d = x[i] - mean
+        m2 += d * d
+    return math.sqrt(m2 / n)
+
+
+@njit(fastmath=True, error_model='numpy')
+def log_return_std(prices):
+    """
+    Population standard deviation of log returns, straight from prices.
+
+    The mean log return telescopes to (log p[-1] - log p[0]) / n, so a
+    single pass with one log per price gives the deviations; no log,
+    diff or returns array is built.
+    """
+    n = prices.shape[0] - 1
+    prev = math.log(prices[0])
+    mean = (math.log(prices[n]) - prev) / n
+    m2 = 0.0
+    for i in range(1, n + 1):
+        cur = math.log(prices[i])
+        d = cur - prev - mean
+        m2 += d * d
+        prev = cur
+    return math.sqrt(m2 / n)
+
+
+@njit(parallel=True, fastmath=True)
+def rolling_std_into(x, window, out):
+    """
+    Population standard deviation of every length-window slice of x, into out.
+
+    Outputs are split into blocks run in parallel. Within a block each
+    window slides from the previous one with the add-one/remove-one
+    Welford update of mean and M2, and every window-th position is
+    recomputed directly so rounding can't drift. Total work is about
+    3 * len(x) rather than len(x) * window.
+    """
+    n_out = out.shape[0]
+    block = 4096
+    n_blocks = (n_out + block - 1) // block
+    for b in prange(n_blocks):
+        start = b * block
+        stop = min(start + block, n_out)
+        mean = 0.0
+        m2 = 0.0
+        for j in range(start, stop):
+            if (j - start) % window == 0:
+                mean = 0.0
+                for i in range(j, j + window):
+                    mean += x[i]
+                mean /= window
+                m2 = 0.0
+                for i in range(j, j + window):
+                    d = x[i] - mean
+                    m2 += d * d
+            else:
+                enter = x[j + window - 1]
+                leave = x[j - 1]
+                new_mean = mean + (enter - leave) / window
+                m2 += (enter - leave) * (enter - new_mean + leave - mean)
+                mean = new_mean
+            out[j] = math.sqrt(m2 / window) if m2 > 0.0 else 0.0
@@ -2,6 +2,7 @@
 Date and time utility functions for options trading.
 """
 
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
 from typing import List
@@ -14,7 +15,13 @@ def business_days_between(start: datetime, end: datetime) -> int:
     Note: Crypto markets trade 24/7, but this is useful for comparing
     to traditional markets.
     """
-    return len(pd.bdate_range(start, end)) - 1
+    # Business days in [start, end], minus one, counted without building
+    # a date index
+    first = np.datetime64(start.date(), 'D')
+    last = np.datetime64(end.date(), 'D')
+    if last < first:
+        return -1
+    return int(np.busday_count(first, last + 1)) - 1
 
 
 def calendar_days_between(start: datetime, end: datetime) -> int:
@@ -60,12 +67,13 @@ def get_expiry_dates(
         # Fridays (common for crypto options)
         dates = pd.date_range(start, end, freq='W-FRI')
     elif frequency == 'monthly':
-        # Last Friday of month
+        # Last Friday of month: the Friday a week later is in another month
         dates = pd.date_range(start, end, freq='W-FRI')
-        dates = dates[dates.to_series().dt.is_month_end]
+        dates = dates[(dates + pd.Timedelta(days=7)).month != dates.month]
     elif frequency == 'quarterly':
-        # Quarterly expirations
-        dates = pd.date_range(start, end, freq='Q')
+        # Calendar quarter ends. The offset object is used because the 'Q'
+        # alias became 'QE' in pandas 2.2 and was removed in pandas 3
+        dates = pd.date_range(start, end, freq=pd.offsets.QuarterEnd())
     else:
         raise ValueError(f"Unknown frequency: {frequency}")
     
@@ -0,0 +1,32 @@
+"""
+Shared pytest configuration.
+
+Puts the repository root on sys.path so tests can import the src and
+references packages without installing them, and provides the kernels
+fixture for code with an optional numba fast path.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+@pytest.fixture(params=["kernel", "numpy"])
+def kernels(request, monkeypatch):
+    """
+    Run a test with the numba kernels and again on the NumPy fallback.
+
+    The test module lists the kernels in KERNELS as (module, attribute)
+    pairs; the fallback run sets each of them to None. The kernel run is
+    skipped when numba is not installed.
+    """
+    targets = request.module.KERNELS
+    if request.param == "numpy":
+        for module, name in targets:
+            monkeypatch.setattr(module, name, None)
+    elif any(getattr(module, name) is None for module, name in targets):
+        pytest.skip("numba not installed")
+    return request.param
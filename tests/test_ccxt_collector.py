@@ -0,0 +1,316 @@
+"""
+Tests for src.data.ccxt_collector.
+"""
+
+import asyncio
+from collections import deque
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data.ccxt_collector import ccxt_collector
+from src.data.ccxt_collector.ccxt_collector import (
+    CCXTProCollector,
+    CompactHistory,
+    MultiExchangeCollector,
+    OrderbookSnapshot,
+    StreamConfig,
+)
+
+FUTURES = ['BTC-PERPETUAL', 'ETH-PERPETUAL', 'SOL-PERPETUAL']
+
+
+def _book(symbol: str, bid: float = 100.0) -> dict:
+    """Orderbook dict shaped like ccxt.pro's."""
+    return {
+        'symbol': symbol,
+        'timestamp': 1700000000000,
+        'bids': [[bid, 1.0], [bid - 1, 2.0]],
+        'asks': [[bid + 1, 1.5], [bid + 2, 3.0]],
+    }
+
+
+class FakeExchange:
+    """Stands in for a ccxt.pro exchange with a batched orderbook watch."""
+
+    has = {'watchOrderBookForSymbols': True}
+
+    def __init__(self, config: dict):
+        self.config = config
+        self.watched = []  # Symbol list of every watch call
+        self.error = None  # Raised by the watch when set
+        self.closed = False
+
+    async def load_markets(self, params=None):
+        return {symbol: {'type': 'future'} for symbol in FUTURES}
+
+    async def watch_order_book_for_symbols(self, symbols, limit=None):
+        self.watched.append(list(symbols))
+        await asyncio.sleep(0.001)
+        if self.error is not None:
+            raise self.error
+        return _book(symbols[len(self.watched) % len(symbols)])
+
+    async def watch_order_book(self, symbol, limit=None):
+        return await self.watch_order_book_for_symbols([symbol], limit)
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def fake_exchange(monkeypatch):
+    """Route exchange_id='fake' to FakeExchange."""
+    monkeypatch.setattr(ccxt_collector, 'ccxtpro', SimpleNamespace(fake=FakeExchange))
+
+
+def _collector(**config) -> CCXTProCollector:
+    return CCXTProCollector(StreamConfig(exchange_id='fake', reconnect_delay=0, **config))
+
+
+def _snapshot(symbol: str = 'BTC-PERPETUAL', timestamp: int = 1700000000000, bid: float = 100.0):
+    return OrderbookSnapshot(
+        symbol=symbol,
+        timestamp=timestamp,
+        bids=[[bid, 1.0], [bid - 1, 2.0]],
+        asks=[[bid + 1, 1.5], [bid + 2, 3.0]],
+        exchange='deribit',
+    )
+
+
+def test_orderbook_snapshot_equality_compares_levels():
+    snapshot = _snapshot()
+
+    assert snapshot == _snapshot()
+    assert snapshot != _snapshot(bid=101.0)
+    assert snapshot != _snapshot(timestamp=1700000000001)
+    assert snapshot != _snapshot(symbol='ETH-PERPETUAL')
+
+
+def test_orderbook_snapshot_works_in_containers():
+    history = deque([_snapshot(timestamp=ts) for ts in range(3)])
+
+    assert _snapshot(timestamp=1) in history
+    assert _snapshot(timestamp=5) not in history
+
+    history.remove(_snapshot(timestamp=1))
+    assert [s.timestamp for s in history] == [0, 2]
+
+
+def test_on_error_is_called_once_per_symbol_of_a_failed_watch(fake_exchange):
+    errors = []
+    collector = _collector(
+        max_reconnect_attempts=2, on_error=lambda symbol, e: errors.append((symbol, str(e)))
+    )
+
+    async def main():
+        await collector.start()
+        collector.exchange.error = RuntimeError("boom")
+        await collector.subscribe_futures(FUTURES[:2])
+        await asyncio.sleep(0.05)
+        await collector.stop()
+
+    asyncio.run(main())
+
+    # The second failure exhausts max_reconnect_attempts before calling on_error
+    assert errors == [(FUTURES[0], "boom"), (FUTURES[1], "boom")]
+
+
+def test_collector_restarts_under_a_new_event_loop(fake_exchange):
+    updates = []
+    collector = _collector(on_orderbook_update=updates.append)
+
+    async def session():
+        updates.clear()
+        await collector.start()
+        await collector.subscribe_futures(FUTURES[:1])
+        await asyncio.sleep(0.05)
+        await collector.unsubscribe(FUTURES[0])
+        await collector.stop()
+        return len(updates)
+
+    # Each asyncio.run has its own loop. An event made in __init__ stays bound
+    # to the first; waiting on it from the second fails, and the stream loop
+    # keeps restarting the watch before any update arrives.
+    assert asyncio.run(session()) > 0
+    assert asyncio.run(session()) > 0
+
+
+def test_batch_callback_survives_a_restart_under_a_new_event_loop(fake_exchange):
+    batches = []
+    collector = _collector(on_orderbook_batch=batches.append, batch_window_ms=5)
+
+    async def session():
+        batches.clear()
+        await collector.start()
+        await collector.subscribe_futures(FUTURES[:2])
+        await asyncio.sleep(0.05)
+        await collector.unsubscribe(FUTURES[0])
+        await collector.unsubscribe(FUTURES[1])
+        await collector.stop()
+        return sum(len(batch) for batch in batches)
+
+    assert asyncio.run(session()) > 0
+    assert asyncio.run(session()) > 0
+
+
+def test_stream_loop_restarts_the_watch_when_subscriptions_change(fake_exchange):
+    collector = _collector()
+
+    async def main():
+        await collector.start()
+        await collector.subscribe_futures(FUTURES[:2])
+        await asyncio.sleep(0.02)
+        await collector.subscribe_futures(FUTURES[2:])
+        await asyncio.sleep(0.02)
+        await collector.unsubscribe(FUTURES[0])
+        await asyncio.sleep(0.02)
+        await collector.stop()
+
+    asyncio.run(main())
+
+    # One batched watch per symbol set, in subscription order
+    symbol_sets = []
+    for symbols in collector.exchange.watched:
+        if not symbol_sets or symbol_sets[-1] != symbols:
+            symbol_sets.append(symbols)
+    assert symbol_sets == [sorted(FUTURES[:2]), sorted(FUTURES), sorted(FUTURES[1:])]
+    assert collector.exchange.closed
+
+
+def test_stop_delivers_the_pending_batch(fake_exchange):
+    batches = []
+    # A window far longer than the test: only stop() can flush the batch
+    collector = _collector(on_orderbook_batch=batches.append, batch_window_ms=60_000)
+
+    async def main():
+        await collector.start()
+        for bid in (100.0, 101.0, 102.0):
+            await collector._handle_orderbook(FUTURES[0], _book(FUTURES[0], bid))
+        await asyncio.sleep(0.01)
+        assert batches == []
+        await collector.stop()
+
+    asyncio.run(main())
+
+    assert [[s.best_bid for s in batch] for batch in batches] == [[100.0, 101.0, 102.0]]
+    assert collector._batch_task is None
+
+
+@pytest.mark.parametrize("size", [1, 5])
+@pytest.mark.parametrize("appends", [0, 3, 5, 7, 12])
+@pytest.mark.parametrize("limit", [None, 0, 1, 4, 9])
+def test_compact_history_matches_a_bounded_deque(size, appends, limit):
+    history = CompactHistory(size)
+    reference = deque(maxlen=size)
+    for ts in range(appends):
+        best_ask = None if ts % 4 == 0 else ts + 0.5
+        history.append(ts, float(ts), best_ask)
+        reference.append((ts, float(ts), np.nan if best_ask is None else best_ask))
+
+    records = history.to_array(limit)
+
+    expected = list(reference)
+    if limit is not None:
+        expected = expected[len(expected) - min(limit, len(expected)):]
+    assert len(history) == len(reference)
+    assert records.dtype == CompactHistory.DTYPE
+    assert records['ts'].tolist() == [ts for ts, _, _ in expected]
+    np.testing.assert_array_equal(records['bb'], [bb for _, bb, _ in expected])
+    np.testing.assert_array_equal(records['ba'], [ba for _, _, ba in expected])
+
+
+def test_compact_history_returned_by_get_snapshot_history():
+    collector = _collector(history_compact=True, max_snapshots_per_symbol=3)
+
+    async def main():
+        for bid in (100.0, 101.0, 102.0, 103.0, 104.0):
+            await collector._handle_orderbook(FUTURES[0], _book(FUTURES[0], bid))
+
+    asyncio.run(main())
+
+    assert collector.get_snapshot_history(FUTURES[0])['bb'].tolist() == [102.0, 103.0, 104.0]
+    assert collector.get_snapshot_history(FUTURES[0], limit=2)['ba'].tolist() == [104.0, 105.0]
+    assert collector.get_snapshot_history(FUTURES[1]).shape == (0,)
+
+
+def test_full_callback_queue_drops_the_oldest_updates(fake_exchange):
+    received = []
+    collector = _collector(
+        callback_queue_size=2, on_orderbook_update=lambda s: received.append(s.best_bid)
+    )
+
+    async def main():
+        await collector.start()
+        # No await suspends in between, so the worker sees only what is left queued
+        for bid in (100.0, 101.0, 102.0, 103.0, 104.0):
+            await collector._handle_orderbook(FUTURES[0], _book(FUTURES[0], bid))
+        # task_done() was called for the dropped entries too, so join() returns
+        await asyncio.wait_for(collector._cb_queue.join(), timeout=1)
+        await collector.stop()
+
+    asyncio.run(main())
+
+    assert received == [103.0, 104.0]
+    assert collector.dropped_updates == 3
+    assert collector.get_latest_orderbook(FUTURES[0]).best_bid == 104.0
+
+
+def _to_dict_frame(rows: list) -> pd.DataFrame:
+    """Frame built the way it was before the level-block version: one to_dict() per row."""
+    df = pd.DataFrame(rows)
+    df['timestamp'] = pd.to_datetime(df['timestamp'], utc=True)
+    # A level missing from every row was an all-None object column; NaN now
+    levels = df.columns[3:]
+    df[levels] = df[levels].astype(float)
+    return df
+
+
+def _levels(n: int, start: float, step: float) -> list:
+    return [[start + step * i, 1.0 + i] for i in range(n)]
+
+
+def _feed_depths(collector: CCXTProCollector, bid: float):
+    """One symbol per depth: empty side, partial book, exactly 10 and more than 10 levels."""
+    async def main():
+        for i, depth in enumerate((0, 3, 10, 14)):
+            book = _book(FUTURES[0], bid)
+            book['symbol'] = f'{FUTURES[0]}-{depth}'
+            book['timestamp'] += i
+            book['bids'] = _levels(depth, bid, -0.5)
+            book['asks'] = _levels(max(depth, 1), bid + 1, 0.5)
+            await collector._handle_orderbook(book['symbol'], book)
+
+    asyncio.run(main())
+
+
+def test_orderbooks_frame_matches_to_dict_rows():
+    collector = _collector()
+    _feed_depths(collector, 100.0)
+
+    got = collector.get_orderbooks_as_dataframe()
+
+    expected = _to_dict_frame([ob.to_dict() for ob in collector.orderbooks.values()])
+    pd.testing.assert_frame_equal(got, expected, check_dtype=False)
+    assert got['exchange'].tolist() == ['fake'] * 4
+
+
+def test_compare_orderbooks_matches_to_dict_rows():
+    multi = MultiExchangeCollector()
+    for exchange_id, bid in (('deribit', 100.0), ('okx', 100.5), ('bybit', 99.5)):
+        collector = _collector()
+        _feed_depths(collector, bid)
+        multi.collectors[exchange_id] = collector
+    symbol = f'{FUTURES[0]}-3'
+
+    got = multi.compare_orderbooks(symbol)
+
+    rows = []
+    for exchange_id, collector in multi.collectors.items():
+        row = collector.get_latest_orderbook(symbol).to_dict()
+        row['exchange'] = exchange_id
+        rows.append(row)
+    pd.testing.assert_frame_equal(got, _to_dict_frame(rows), check_dtype=False)
+    assert multi.compare_orderbooks('missing').empty
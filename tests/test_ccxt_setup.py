@@ -6,15 +6,75 @@ This script checks:
 2. Connection to exchange
 3. Market data availability
 4. Basic streaming functionality
+
+Pass --json to also print the results, with per-test durations, as a
+single JSON line at the end.
 """
 
+import argparse
 import asyncio
+import importlib.machinery
+import importlib.util
+import json
 import sys
+import time
+from collections import deque
 from pathlib import Path
+from typing import List, Tuple
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None  # Fall back to the default asyncio event loop
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+# Imported up front so loading ccxt.pro's exchange classes is paid at
+# startup, not inside whichever test runs first
+try:
+    from src.data.ccxt_collector import CCXTProCollector, StreamConfig
+except ImportError:
+    CCXTProCollector = StreamConfig = None  # Reported by check_dependencies
+
+async def _timed(test):
+    """
+    Run a test coroutine and time it.
+    
+    Returns:
+        (result, duration in milliseconds)
+    """
+    start = time.perf_counter()
+    result = await test
+    return result, (time.perf_counter() - start) * 1000
+
+
+def _print_json(results):
+    """Write the results as one JSON line for CI and other tooling."""
+    records = [
+        {'test': name, 'passed': passed, 'duration_ms': duration_ms}
+        for name, passed, duration_ms in results
+    ]
+    sys.stdout.write(json.dumps(records) + "\n")
+
+
+def _module_available(module: str) -> bool:
+    """
+    Whether a module can be imported, without importing it.
+    
+    Submodules are looked up on the parent's search path directly, since
+    find_spec('ccxt.pro') would first import all of ccxt.
+    """
+    parent, _, child = module.rpartition('.')
+    if not parent:
+        return importlib.util.find_spec(module) is not None
+    parent_spec = importlib.util.find_spec(parent)
+    if parent_spec is None or parent_spec.submodule_search_locations is None:
+        return False
+    return importlib.machinery.PathFinder.find_spec(
+        child, parent_spec.submodule_search_locations
+    ) is not None
+
 
 def check_dependencies():
     """Check if required dependencies are installed."""
@@ -30,13 +90,23 @@ def check_dependencies():
     missing = []
     
     for module, name in dependencies.items():
-        try:
-            __import__(module)
+        if _module_available(module):
             print(f"  ✓ {name}")
-        except ImportError:
+        else:
             print(f"  ✗ {name} - MISSING")
             missing.append(module)
     
+    # Optional speedups: reported, but not required to pass
+    optional = {
+        'uvloop': 'default asyncio loop',
+        'orjson': 'stdlib json for websocket frames',
+    }
+    for module, fallback in optional.items():
+        if _module_available(module):
+            print(f"  ✓ {module} (optional)")
+        else:
+            print(f"  - {module} (optional) - not installed, using {fallback}")
+    
     if missing:
         print("\n❌ Missing dependencies detected!")
         print("\nTo install:")
@@ -50,147 +120,229 @@ def check_dependencies():
     return True
 
 
-async def test_connection(exchange_id='deribit'):
-    """Test connection to exchange."""
-    print(f"Testing connection to {exchange_id}...")
+async def start_collector(exchange_id='deribit'):
+    """
+    Start the collector shared by the discovery and streaming tests.
+    
+    One collector means one markets download and one websocket
+    connection per run. Returns None if the exchange can't be reached.
+    """
+    print(f"Connecting to {exchange_id}...")
     
     try:
-        import ccxt.pro as ccxtpro
-        
-        exchange_class = getattr(ccxtpro, exchange_id)
-        exchange = exchange_class({'enableRateLimit': True})
+        if CCXTProCollector is None:
+            raise ImportError("src.data.ccxt_collector could not be imported (is ccxt installed?)")
         
-        # Load markets
-        markets = await exchange.load_markets()
-        print(f"  ✓ Connected to {exchange_id}")
-        print(f"  ✓ Loaded {len(markets)} markets")
+        config = StreamConfig(
+            exchange_id=exchange_id,
+            # Both tests only use BTC instruments; skip the others' download
+            markets_params={'currency': 'BTC'},
+            orderbook_limit=1,  # Tests only read the top of book
+            # One long-lived worker drains a bounded queue (drops oldest)
+            # instead of awaiting the callback inside the stream loop
+            callback_queue_size=1024
+        )
+        collector = CCXTProCollector(config)
         
-        await exchange.close()
-        return True
+        # start() loads the markets
+        await collector.start()
+        return collector
         
     except Exception as e:
         print(f"  ✗ Connection failed: {e}")
-        return False
+        import traceback
+        traceback.print_exc()
+        return None
 
 
-async def test_market_discovery():
-    """Test market discovery functionality."""
-    print("Testing market discovery...")
+async def check_market_discovery(collector) -> Tuple[bool, List[str]]:
+    """
+    Test connection to the exchange and market discovery functionality.
+    
+    Returns:
+        (passed, report lines to print)
+    """
+    exchange_id = collector.config.exchange_id
+    report = [f"Testing connection to {exchange_id} and market discovery..."]
     
     try:
-        from src.data.ccxt_collector import CCXTProCollector, StreamConfig
-        
-        config = StreamConfig(exchange_id='deribit')
-        collector = CCXTProCollector(config)
-        
-        await collector.start()
+        markets = collector.exchange.markets
+        if not markets:
+            report.append(f"  ✗ Connection failed: no markets loaded from {exchange_id}")
+            return False, report
+        report.append(f"  ✓ Connected to {exchange_id}")
+        report.append(f"  ✓ Loaded {len(markets)} BTC markets")
         
         # Test futures discovery
         futures = collector.get_available_futures()
-        print(f"  ✓ Found {len(futures)} futures markets")
+        report.append(f"  ✓ Found {len(futures)} futures markets")
         
         btc_futures = collector.get_available_futures(base_currency='BTC')
-        print(f"  ✓ Found {len(btc_futures)} BTC futures")
+        report.append(f"  ✓ Found {len(btc_futures)} BTC futures")
         
         # Test options discovery
         options = collector.get_available_options()
-        print(f"  ✓ Found {len(options)} options markets")
+        report.append(f"  ✓ Found {len(options)} options markets")
         
         btc_calls = collector.get_available_options(base_currency='BTC', option_type='C')
-        print(f"  ✓ Found {len(btc_calls)} BTC call options")
+        report.append(f"  ✓ Found {len(btc_calls)} BTC call options")
         
-        await collector.stop()
-        return True
+        return True, report
         
     except Exception as e:
-        print(f"  ✗ Market discovery failed: {e}")
+        report.append(f"  ✗ Market discovery failed: {e}")
         import traceback
         traceback.print_exc()
-        return False
+        return False, report
 
 
-async def test_streaming():
-    """Test basic streaming functionality."""
-    print("Testing orderbook streaming...")
+# Median exchange-to-callback latency above which a warning is printed
+LATENCY_WARN_P50_MS = 100
+
+
+async def check_streaming(collector) -> Tuple[bool, List[str]]:
+    """
+    Test basic streaming functionality.
+    
+    Also reports ingestion latency (callback time minus the exchange's
+    orderbook timestamp) as p50/p90/p99, a baseline for judging changes
+    to the streaming path.
+    
+    Returns:
+        (passed, report lines to print)
+    """
+    report = ["Testing orderbook streaming..."]
     
     try:
-        from src.data.ccxt_collector import CCXTProCollector, StreamConfig
-        
-        received_updates = []
-        
-        async def on_update(orderbook):
-            received_updates.append(orderbook)
-            if len(received_updates) <= 3:
-                print(f"  ✓ Received update #{len(received_updates)}: "
-                      f"{orderbook.symbol} @ ${orderbook.mid_price:.2f}")
+        # Only the count is needed; snapshots are not kept alive
+        received = 0
+        target_updates = 10
+        enough_updates = asyncio.Event()
+        # The callback runs on the collector's worker task and stays free
+        # of I/O and formatting: sample updates are reported after the wait
+        samples = []
+        latencies_ms = deque(maxlen=10000)
         
-        config = StreamConfig(
-            exchange_id='deribit',
-            orderbook_limit=5,
-            on_orderbook_update=on_update
-        )
+        def on_update(orderbook):
+            nonlocal received
+            received += 1
+            latencies_ms.append(time.time() * 1000 - orderbook.timestamp)
+            if received <= 3:
+                samples.append((orderbook.symbol, orderbook.mid_price))
+            if received >= target_updates:
+                enough_updates.set()
         
-        collector = CCXTProCollector(config)
-        await collector.start()
+        # The collector reads the callback per update, so it can be set now
+        collector.config.on_orderbook_update = on_update
         
         # Subscribe to BTC perpetual
         await collector.subscribe_futures(['BTC/USD:BTC'])
         
-        # Wait for a few updates
-        print("  Waiting for orderbook updates (10 seconds)...")
-        await asyncio.sleep(10)
+        # Wait for a few updates, stopping early once enough have arrived
+        report.append(f"  Waiting for {target_updates} orderbook updates (up to 10 seconds)...")
+        try:
+            await asyncio.wait_for(enough_updates.wait(), timeout=10)
+        except asyncio.TimeoutError:
+            pass
+        
+        for number, (symbol, mid_price) in enumerate(samples, 1):
+            report.append(f"  ✓ Received update #{number}: {symbol} @ ${mid_price:.2f}")
         
-        await collector.stop()
+        if latencies_ms:
+            import numpy as np
+            
+            p50, p90, p99 = np.percentile(np.fromiter(latencies_ms, float), [50, 90, 99])
+            report.append(
+                f"  ✓ Ingestion latency: p50 {p50:.1f} ms, p90 {p90:.1f} ms, p99 {p99:.1f} ms"
+            )
+            if p50 > LATENCY_WARN_P50_MS:
+                report.append(
+                    f"  ⚠️  Median latency above {LATENCY_WARN_P50_MS} ms "
+                    "(check the network path and the local clock's sync)"
+                )
         
-        if len(received_updates) > 0:
-            print(f"  ✓ Streaming successful! Received {len(received_updates)} updates")
-            return True
+        if received > 0:
+            report.append(f"  ✓ Streaming successful! Received {received} updates")
+            return True, report
         else:
-            print("  ✗ No updates received")
-            return False
+            report.append("  ✗ No updates received")
+            return False, report
         
     except Exception as e:
-        print(f"  ✗ Streaming test failed: {e}")
+        report.append(f"  ✗ Streaming test failed: {e}")
         import traceback
         traceback.print_exc()
-        return False
+        return False, report
 
 
-async def run_all_tests():
-    """Run all tests."""
+async def run_all_tests(json_output: bool = False):
+    """
+    Run all tests.
+    
+    Args:
+        json_output: Also write the results, with durations, as a JSON line
+    """
     print("=" * 60)
     print("CCXT Pro Collector - Setup Verification")
     print("=" * 60)
     print()
     
+    # (name, passed, duration in milliseconds)
     results = []
     
     # Check dependencies
-    results.append(('Dependencies', check_dependencies()))
+    start = time.perf_counter()
+    deps_ok = check_dependencies()
+    results.append(('Dependencies', deps_ok, (time.perf_counter() - start) * 1000))
     print()
     
-    if not results[0][1]:
+    if not deps_ok:
         print("⚠️  Please install missing dependencies before continuing")
+        if json_output:
+            _print_json(results)
         return
     
-    # Test connection
-    results.append(('Connection', await test_connection()))
+    names = ('Connection+Discovery', 'Streaming')
+    collector = await start_collector()
     print()
     
-    # Test market discovery
-    results.append(('Market Discovery', await test_market_discovery()))
-    print()
+    if collector is None:
+        outcomes = [(None, None)] * len(names)
+    else:
+        # Network tests are independent, so run them concurrently on the
+        # shared collector; each returns its report, printed in test order
+        tests = (check_market_discovery(collector), check_streaming(collector))
+        try:
+            if sys.version_info >= (3, 11):
+                # Tests report their own failures; anything they raise
+                # cancels the other and propagates
+                async with asyncio.TaskGroup() as group:
+                    tasks = [group.create_task(_timed(test)) for test in tests]
+                outcomes = [task.result() for task in tasks]
+            else:
+                outcomes = await asyncio.gather(
+                    *(_timed(test) for test in tests), return_exceptions=True
+                )
+        finally:
+            await collector.stop()
     
-    # Test streaming
-    results.append(('Streaming', await test_streaming()))
-    print()
+    for name, outcome in zip(names, outcomes):
+        if isinstance(outcome, BaseException):
+            outcome = (None, None)
+        result, duration_ms = outcome
+        passed = False
+        if result is not None:
+            passed, report = result
+            print("\n".join(report))
+            print()
+        results.append((name, passed is True, duration_ms))
     
     # Summary
     print("=" * 60)
     print("Test Summary")
     print("=" * 60)
     
-    for test_name, passed in results:
+    for test_name, passed, _ in results:
         status = "✓ PASS" if passed else "✗ FAIL"
         print(f"{test_name:20s} {status}")
     
@@ -204,12 +356,31 @@ async def run_all_tests():
         print("  3. Start building your trading strategies!")
     else:
         print("⚠️  Some tests failed. Please check the errors above.")
+    
+    if json_output:
+        _print_json(results)
+
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description='Verify the CCXT Pro collector setup')
+    parser.add_argument(
+        '--json',
+        action='store_true',
+        help='Also print the results as a single JSON line at the end'
+    )
+    return parser.parse_args()
 
 
 def main():
     """Entry point."""
+    args = parse_args()
     try:
-        asyncio.run(run_all_tests())
+        if uvloop is not None:
+            # libuv event loop: cheaper dispatch per websocket frame
+            uvloop.run(run_all_tests(json_output=args.json))
+        else:
+            asyncio.run(run_all_tests(json_output=args.json))
     except KeyboardInterrupt:
         print("\n\nTests interrupted by user")
     except Exception as e:
@@ -0,0 +1,231 @@
+"""
+Tests for references.models.
+"""
+
+import numpy as np
+import pytest
+from scipy.optimize import minimize
+from scipy.stats import norm
+
+from references.models import pricing, volatility
+from references.models.greeks import GreeksCalculator, all_greeks
+from references.models.pricing import BlackScholes
+from references.models.volatility import SVIModel
+
+# Optional numba kernels, switched off for the NumPy run of the kernels fixture
+KERNELS = [
+    (pricing, '_price_chain_kernel'),
+    (pricing, '_iv_newton_kernel'),
+    (volatility, 'svi_total_variance'),
+]
+
+
+# Scalar implementations as they were before vectorization, used as references
+
+def _baseline_price(S, K, T, r, sigma, option_type="call"):
+    if T <= 0:
+        return max(S - K, 0) if option_type == "call" else max(K - S, 0)
+    d1 = (np.log(S / K) + (r + 0.5 * sigma**2) * T) / (sigma * np.sqrt(T))
+    d2 = d1 - sigma * np.sqrt(T)
+    if option_type == "call":
+        return S * norm.cdf(d1) - K * np.exp(-r * T) * norm.cdf(d2)
+    return K * np.exp(-r * T) * norm.cdf(-d2) - S * norm.cdf(-d1)
+
+
+def _baseline_vega(S, K, T, r, sigma):
+    d1 = (np.log(S / K) + (r + 0.5 * sigma**2) * T) / (sigma * np.sqrt(T))
+    return S * norm.pdf(d1) * np.sqrt(T)
+
+
+def _baseline_implied_volatility(price, S, K, T, r, option_type="call",
+                                 max_iterations=100, tolerance=1e-6):
+    sigma = np.sqrt(2 * np.pi / T) * (price / S)
+    for _ in range(max_iterations):
+        diff = _baseline_price(S, K, T, r, sigma, option_type) - price
+        if abs(diff) < tolerance:
+            return sigma
+        vega = _baseline_vega(S, K, T, r, sigma)
+        if vega < 1e-10:
+            break
+        sigma = max(sigma - diff / vega, 1e-6)
+    return sigma
+
+
+def _baseline_greeks(S, K, T, r, sigma, option_type="call"):
+    sqrt_T = np.sqrt(T)
+    d1 = (np.log(S / K) + (r + 0.5 * sigma**2) * T) / (sigma * sqrt_T)
+    d2 = d1 - sigma * sqrt_T
+    decay = -S * norm.pdf(d1) * sigma / (2 * sqrt_T)
+    if option_type == "call":
+        delta = norm.cdf(d1)
+        theta = decay - r * K * np.exp(-r * T) * norm.cdf(d2)
+        rho = K * T * np.exp(-r * T) * norm.cdf(d2) / 100
+    else:
+        delta = norm.cdf(d1) - 1
+        theta = decay + r * K * np.exp(-r * T) * norm.cdf(-d2)
+        rho = -K * T * np.exp(-r * T) * norm.cdf(-d2) / 100
+    return {
+        'delta': delta,
+        'gamma': norm.pdf(d1) / (S * sigma * sqrt_T),
+        'vega': S * norm.pdf(d1) * sqrt_T / 100,
+        'theta': theta / 365,
+        'rho': rho,
+    }
+
+
+def _chain(seed: int, n: int = 300):
+    """Random (S, K, T, r, sigma, is_call) for n BTC-sized options."""
+    rng = np.random.default_rng(seed)
+    return (
+        rng.uniform(20000, 80000, n),
+        rng.uniform(15000, 100000, n),
+        rng.uniform(0.01, 2.0, n),
+        0.03,
+        rng.uniform(0.2, 1.5, n),
+        rng.random(n) < 0.5,
+    )
+
+
+def _option_types(is_call):
+    return ["call" if c else "put" for c in is_call]
+
+
+def test_price_chain_matches_scalar_baseline(kernels):
+    S, K, T, r, sigma, is_call = _chain(0)
+
+    prices = BlackScholes.price_chain(S, K, T, r, sigma, is_call)
+
+    expected = [
+        _baseline_price(s, k, t, r, v, o)
+        for s, k, t, v, o in zip(S, K, T, sigma, _option_types(is_call))
+    ]
+    np.testing.assert_allclose(prices, expected, rtol=1e-10, atol=1e-8)
+
+
+def test_implied_volatility_vec_matches_scalar_baseline(kernels):
+    S, K, T, r, sigma, is_call = _chain(1)
+    types = _option_types(is_call)
+    prices = np.array([
+        _baseline_price(s, k, t, r, v, o) for s, k, t, v, o in zip(S, K, T, sigma, types)
+    ])
+
+    ivs = BlackScholes.implied_volatility_vec(prices, S, K, T, r, is_call)
+
+    # Includes the options where the Newton iteration itself does not converge
+    expected = [
+        _baseline_implied_volatility(p, s, k, t, r, o)
+        for p, s, k, t, o in zip(prices, S, K, T, types)
+    ]
+    np.testing.assert_allclose(ivs, expected, rtol=1e-8, atol=1e-12)
+
+
+def test_implied_volatility_scalar_wrapper_matches_baseline():
+    price = _baseline_price(50000.0, 55000.0, 0.25, 0.03, 0.7, "put")
+
+    got = BlackScholes.implied_volatility(price, 50000.0, 55000.0, 0.25, 0.03, "PUT")
+
+    expected = _baseline_implied_volatility(price, 50000.0, 55000.0, 0.25, 0.03, "put")
+    assert got == pytest.approx(expected, rel=1e-10)
+    assert got == pytest.approx(0.7, rel=1e-6)
+
+
+def test_all_greeks_matches_scalar_baseline():
+    S, K, T, r, sigma, is_call = _chain(2)
+
+    got = all_greeks(S, K, T, r, sigma, is_call)
+
+    for i in range(len(S)):
+        expected = _baseline_greeks(S[i], K[i], T[i], r, sigma[i], _option_types(is_call)[i])
+        for name, value in expected.items():
+            assert got[name][i] == pytest.approx(value, rel=1e-9, abs=1e-12), name
+
+
+def test_greeks_calculator_all_greeks_matches_scalar_baseline():
+    for option_type in ("call", "put"):
+        expected = _baseline_greeks(50000.0, 55000.0, 0.25, 0.03, 0.7, option_type)
+        got = GreeksCalculator.all_greeks(50000.0, 55000.0, 0.25, 0.03, 0.7, option_type)
+        assert got == pytest.approx(expected, rel=1e-9)
+
+
+def _svi_slice(params, k):
+    a, b, rho, m, sigma = params
+    return a + b * (rho * (k - m) + np.sqrt((k - m)**2 + sigma**2))
+
+
+def test_svi_predict_matches_formula(kernels):
+    model = SVIModel()
+    model.params = (0.04, 0.3, -0.4, 0.05, 0.15)
+    k = np.linspace(-0.8, 0.8, 41)
+
+    np.testing.assert_allclose(model.predict(k), _svi_slice(model.params, k), rtol=1e-12)
+    # 2-D input always takes the NumPy expression
+    grid = k.reshape(-1, 1)
+    np.testing.assert_allclose(model.predict(grid), _svi_slice(model.params, grid), rtol=1e-12)
+
+
+def _reference_solve_linear(k, w, m, sigma, w_max):
+    """Same constrained least squares as SVIModel._solve_linear, by SLSQP."""
+    y = (k - m) / sigma
+    A = np.column_stack([np.ones_like(y), y, np.sqrt(y * y + 1)])
+    constraints = [
+        {'type': 'ineq', 'fun': lambda x: x[2] - x[1]},
+        {'type': 'ineq', 'fun': lambda x: x[2] + x[1]},
+        {'type': 'ineq', 'fun': lambda x: 4 * sigma - x[2] - x[1]},
+        {'type': 'ineq', 'fun': lambda x: 4 * sigma - x[2] + x[1]},
+        {'type': 'ineq', 'fun': lambda x: x[0]},
+        {'type': 'ineq', 'fun': lambda x: w_max - x[0]},
+    ]
+    result = minimize(
+        lambda x: np.sum((A @ x - w) ** 2), np.array([w_max / 2, 0.0, sigma]),
+        method='SLSQP', constraints=constraints, options={'ftol': 1e-15, 'maxiter': 500}
+    )
+    return result.x, result.fun
+
+
+def test_svi_solve_linear_unconstrained_matches_lstsq():
+    k = np.linspace(-0.5, 0.5, 25)
+    w = _svi_slice((0.04, 0.2, -0.3, 0.05, 0.2), k)
+    m, sigma = 0.05, 0.2
+
+    coeffs, sse = SVIModel._solve_linear(k, w, m, sigma, float(w.max()))
+
+    y = (k - m) / sigma
+    A = np.column_stack([np.ones_like(y), y, np.sqrt(y * y + 1)])
+    expected = np.linalg.lstsq(A, w, rcond=None)[0]
+    np.testing.assert_allclose(coeffs, expected, rtol=1e-9, atol=1e-12)
+    assert sse == pytest.approx(0.0, abs=1e-20)
+
+
+@pytest.mark.parametrize("m, sigma", [(0.3, 0.05), (-0.4, 0.5), (0.0, 1.5)])
+def test_svi_solve_linear_constrained_matches_slsqp(m, sigma):
+    rng = np.random.default_rng(5)
+    k = np.linspace(-1.0, 1.0, 30)
+    w = _svi_slice((0.02, 0.4, -0.6, 0.1, 0.3), k) + rng.normal(0, 0.005, k.size)
+    w_max = float(w.max())
+
+    coeffs, sse = SVIModel._solve_linear(k, w, m, sigma, w_max)
+
+    _, reference_sse = _reference_solve_linear(k, w, m, sigma, w_max)
+    a, d, c = coeffs
+    assert abs(d) <= c + 1e-12 and abs(d) <= 4 * sigma - c + 1e-12
+    assert -1e-12 <= a <= w_max + 1e-12
+    assert sse == pytest.approx(reference_sse, rel=1e-6, abs=1e-12)
+
+
+def test_svi_fit_recovers_slice_parameters():
+    params = (0.04, 0.3, -0.4, 0.05, 0.15)
+    k = np.linspace(-0.8, 0.8, 41)
+    model = SVIModel()
+
+    model.fit(k, _svi_slice(params, k))
+
+    np.testing.assert_allclose(model.params, params, rtol=1e-3, atol=1e-4)
+
+
+def test_svi_predict_scalar_matches_formula():
+    model = SVIModel()
+    model.params = (0.04, 0.3, -0.4, 0.05, 0.15)
+
+    for k in (-0.8, 0.05, 0.2, 1.5):
+        assert model.predict_scalar(k) == pytest.approx(_svi_slice(model.params, k), rel=1e-12)
+    assert model.predict(0.2) == model.predict_scalar(0.2)
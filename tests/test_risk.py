@@ -0,0 +1,154 @@
+"""
+Tests for references.risk.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from references.risk import metrics
+from references.risk.limits import PortfolioState, RiskChecker, RiskLimits
+from references.risk.metrics import RiskMetrics, RollingDrawdown
+
+# Optional numba kernels, switched off for the NumPy run of the kernels fixture
+KERNELS = [
+    (metrics, 'max_drawdown_fused'),
+]
+
+
+def _baseline_max_drawdown(cumulative_returns: pd.Series) -> dict:
+    """max_drawdown as computed with pandas before the NumPy/numba passes."""
+    cummax = cumulative_returns.cummax()
+    drawdown = (cumulative_returns - cummax) / cummax
+    max_dd_idx = drawdown.idxmin()
+    return {
+        'max_drawdown': drawdown.min(),
+        'peak_date': cumulative_returns[:max_dd_idx].idxmax(),
+        'trough_date': max_dd_idx,
+    }
+
+
+def _baseline_check_trade(limits: RiskLimits, portfolio: dict, trade: dict) -> bool:
+    """Approval from the dict-based check_trade before the batch version."""
+    if abs(portfolio.get('delta', 0) + trade.get('delta', 0)) > limits.max_portfolio_delta:
+        return False
+    if abs(portfolio.get('vega', 0) + trade.get('vega', 0)) > limits.max_portfolio_vega:
+        return False
+    notional = trade.get('notional', 0)
+    if notional / portfolio.get('total_value', 1) > limits.max_position_size:
+        return False
+    return notional <= limits.max_single_option_notional
+
+
+def _baseline_max_allowable_size(limits: RiskLimits, portfolio: dict, trade_greeks: dict) -> float:
+    max_size = float('inf')
+    if trade_greeks.get('delta', 0) != 0:
+        delta_room = limits.max_portfolio_delta - abs(portfolio.get('delta', 0))
+        max_size = min(max_size, delta_room / abs(trade_greeks['delta']))
+    if trade_greeks.get('vega', 0) != 0:
+        vega_room = limits.max_portfolio_vega - abs(portfolio.get('vega', 0))
+        max_size = min(max_size, vega_room / abs(trade_greeks['vega']))
+    return max(0, max_size)
+
+
+def _cumulative(seed: int, n: int = 500) -> pd.Series:
+    rng = np.random.default_rng(seed)
+    index = pd.date_range('2024-01-01', periods=n, freq='D')
+    return pd.Series(np.cumprod(1 + rng.normal(0.0005, 0.02, n)), index=index)
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_max_drawdown_matches_pandas_baseline(kernels, seed):
+    cumulative = _cumulative(seed)
+
+    got = RiskMetrics.max_drawdown(cumulative)
+
+    expected = _baseline_max_drawdown(cumulative)
+    assert got['max_drawdown'] == pytest.approx(expected['max_drawdown'], rel=1e-12)
+    assert got['peak_date'] == expected['peak_date']
+    assert got['trough_date'] == expected['trough_date']
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_rolling_drawdown_matches_max_drawdown_at_every_step(seed):
+    cumulative = _cumulative(seed, n=200)
+    tracker = RollingDrawdown()
+
+    for n, (timestamp, value) in enumerate(cumulative.items(), start=1):
+        drawdown = tracker.update(value, timestamp)
+        peak = cumulative.iloc[:n].max()
+        assert drawdown == pytest.approx((value - peak) / peak, abs=1e-15)
+
+        if n % 20 == 0:
+            expected = _baseline_max_drawdown(cumulative.iloc[:n])
+            got = tracker.as_dict()
+            assert got['max_drawdown'] == pytest.approx(expected['max_drawdown'], rel=1e-12)
+            if expected['max_drawdown'] < 0:
+                assert got['peak_date'] == expected['peak_date']
+                assert got['trough_date'] == expected['trough_date']
+
+
+def _candidate_trades(seed: int, n: int = 400) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    trades = pd.DataFrame({
+        'delta': rng.normal(0, 400, n),
+        'vega': rng.normal(0, 2000, n),
+        'notional': rng.uniform(0, 80000, n),
+    })
+    # Zero greeks leave that size constraint unbounded
+    trades.loc[::7, 'delta'] = 0.0
+    trades.loc[::11, 'vega'] = 0.0
+    return trades
+
+
+def test_check_trades_batch_matches_scalar_checks():
+    limits = RiskLimits()
+    checker = RiskChecker(limits)
+    portfolio = {'delta': 600.0, 'vega': -3000.0, 'total_value': 1_000_000.0}
+    trades = _candidate_trades(0)
+
+    approved, reason_code = checker.check_trades_batch(portfolio, trades)
+
+    messages = {
+        RiskChecker.REASON_POSITION_SIZE: "Position size",
+        RiskChecker.REASON_SINGLE_NOTIONAL: "Single option notional",
+        RiskChecker.REASON_DELTA_LIMIT: "Delta limit",
+        RiskChecker.REASON_VEGA_LIMIT: "Vega limit",
+    }
+    assert 0 < approved.sum() < len(trades)
+    for i, trade in enumerate(trades.to_dict('records')):
+        assert approved[i] == _baseline_check_trade(limits, portfolio, trade)
+
+        ok, reason = checker.check_trade(portfolio, trade)
+        assert ok == approved[i]
+        if ok:
+            assert reason_code[i] == RiskChecker.REASON_OK
+        else:
+            assert reason.startswith(messages[reason_code[i]])
+
+
+def test_check_trades_batch_treats_missing_columns_as_zero():
+    checker = RiskChecker(RiskLimits())
+    trades = pd.DataFrame({'notional': [1000.0, 90000.0]})
+
+    approved, reason_code = checker.check_trades_batch(PortfolioState(total_value=1e6), trades)
+
+    assert approved.tolist() == [True, False]
+    assert reason_code.tolist() == [RiskChecker.REASON_OK, RiskChecker.REASON_POSITION_SIZE]
+
+
+def test_get_max_allowable_sizes_matches_scalar_version():
+    limits = RiskLimits()
+    checker = RiskChecker(limits)
+    portfolio = {'delta': -250.0, 'vega': 4500.0}
+    trades = _candidate_trades(1)
+    trades.loc[::13, ['delta', 'vega']] = 0.0
+
+    sizes = checker.get_max_allowable_sizes(portfolio, trades)
+
+    expected = [
+        _baseline_max_allowable_size(limits, portfolio, trade)
+        for trade in trades[['delta', 'vega']].to_dict('records')
+    ]
+    np.testing.assert_allclose(sizes, expected, rtol=1e-15)
+    assert np.isinf(sizes[::13]).all()
@@ -0,0 +1,99 @@
+"""
+Tests for references.strategies.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from references.strategies.base import OptionChainSoA
+from references.strategies.volatility import VolatilityArbitrage
+
+
+def _baseline_realized_vol(closes: pd.Series, lookback: int) -> float:
+    """Realized vol as generate_signals computed it before the incremental update."""
+    return closes.pct_change().tail(lookback).std() * np.sqrt(252)
+
+
+def _prices(seed: int, n: int, vol: float) -> pd.Series:
+    rng = np.random.default_rng(seed)
+    return pd.Series(100 * np.exp(np.cumsum(rng.normal(0, vol, n))))
+
+
+def test_update_realized_vol_matches_full_recompute_on_growing_series():
+    strategy = VolatilityArbitrage(lookback_window=30)
+    closes = _prices(0, 300, 0.02)
+
+    for n in range(3, len(closes), 7):
+        expected = _baseline_realized_vol(closes[:n], 30)
+        assert strategy.update_realized_vol(closes[:n]) == pytest.approx(expected, rel=1e-12)
+
+
+def test_update_realized_vol_recomputes_for_new_frame_with_same_range_index():
+    strategy = VolatilityArbitrage(lookback_window=30)
+    calm = _prices(1, 100, 0.01)
+    wild = _prices(2, 100, 0.07)
+
+    strategy.update_realized_vol(calm)
+
+    # Same RangeIndex labels, different data: the cached window must not be reused
+    expected = _baseline_realized_vol(wild, 30)
+    assert strategy.update_realized_vol(wild) == pytest.approx(expected, rel=1e-12)
+
+
+def _baseline_signals(strategy: VolatilityArbitrage, market_data: pd.DataFrame) -> list:
+    """(action, symbol, option_type, strike, confidence) per signal, row-wise as before the SoA layout."""
+    rv = _baseline_realized_vol(market_data['close'], strategy.lookback_window)
+    signals = []
+    for _, row in market_data.iterrows():
+        if pd.isna(row.get('implied_vol')):
+            continue
+        spread = (row['implied_vol'] - rv) / rv
+        if spread < -strategy.entry_threshold:
+            action = "buy"
+        elif spread > strategy.entry_threshold:
+            action = "sell"
+        else:
+            continue
+        signals.append(
+            (action, row['symbol'], row['option_type'], row['strike'], min(abs(spread), 1.0))
+        )
+    return signals
+
+
+def test_generate_signals_matches_row_wise_version_and_keeps_labels():
+    rng = np.random.default_rng(3)
+    n = 60
+    labels = ['call', 'put', 'C', 'P', 'Put', 'PUT', 'Call']
+    market_data = pd.DataFrame({
+        'close': _prices(4, n, 0.03).to_numpy(),
+        'symbol': [f"BTC-{i}" for i in range(n)],
+        'option_type': [labels[i % len(labels)] for i in range(n)],
+        'strike': rng.uniform(20000, 80000, n),
+        'expiry': pd.Timestamp('2025-03-28'),
+        'implied_vol': np.where(rng.random(n) < 0.1, np.nan, rng.uniform(0.1, 1.5, n)),
+    })
+    strategy = VolatilityArbitrage(lookback_window=30)
+
+    signals = strategy.generate_signals(market_data)
+    got = [(s.action, s.symbol, s.option_type, s.strike, s.confidence) for s in signals]
+
+    expected = _baseline_signals(strategy, market_data)
+    assert len(got) == len(expected) > 0
+    for g, e in zip(got, expected):
+        assert g[:4] == e[:4]
+        assert g[4] == pytest.approx(e[4], rel=1e-12)
+
+
+def test_option_chain_soa_codes_puts_case_insensitively():
+    df = pd.DataFrame({
+        'symbol': ['a', 'b', 'c', 'd', 'e'],
+        'option_type': ['put', 'P', 'PUT', 'call', 'C'],
+        'strike': [1.0, 2.0, 3.0, 4.0, 5.0],
+        'expiry': pd.Timestamp('2025-03-28'),
+        'implied_vol': [0.5] * 5,
+    })
+    chain = OptionChainSoA.from_dataframe(df)
+
+    assert chain.option_type_code.tolist() == [1, 1, 1, 0, 0]
+    assert chain.to_dataframe()['option_type'].tolist() == df['option_type'].tolist()
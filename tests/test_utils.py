@@ -0,0 +1,59 @@
+"""
+Tests for src.utils.
+"""
+
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from src.utils import math_utils
+from src.utils.date_utils import get_expiry_dates
+from src.utils.math_utils import rolling_std
+
+# Optional numba kernels, switched off for the NumPy run of the kernels fixture
+KERNELS = [
+    (math_utils, 'rolling_std_into'),
+]
+
+
+def test_get_expiry_dates_quarterly_gives_calendar_quarter_ends():
+    dates = get_expiry_dates(datetime(2024, 1, 1), datetime(2025, 1, 15), 'quarterly')
+
+    assert dates == [
+        datetime(2024, 3, 31),
+        datetime(2024, 6, 30),
+        datetime(2024, 9, 30),
+        datetime(2024, 12, 31),
+    ]
+
+
+def test_get_expiry_dates_monthly_gives_last_friday_of_each_month():
+    dates = get_expiry_dates(datetime(2024, 1, 1), datetime(2024, 6, 30), 'monthly')
+
+    assert dates == [
+        datetime(2024, 1, 26),
+        datetime(2024, 2, 23),
+        datetime(2024, 3, 29),
+        datetime(2024, 4, 26),
+        datetime(2024, 5, 31),
+        datetime(2024, 6, 28),
+    ]
+
+
+# 10_000 points span several of the kernel's 4096-output parallel blocks
+@pytest.mark.parametrize("n, window", [(50, 1), (50, 50), (1000, 30), (10_000, 252)])
+def test_rolling_std_matches_np_std_per_window(kernels, n, window):
+    rng = np.random.default_rng(n + window)
+    data = 100 + np.cumsum(rng.normal(0, 1, n))
+
+    got = rolling_std(data, window)
+
+    expected = [np.std(data[i:i + window]) for i in range(n - window + 1)]
+    np.testing.assert_allclose(got, expected, rtol=1e-9, atol=1e-12)
+
+
+@pytest.mark.parametrize("window", [0, 51])
+def test_rolling_std_rejects_out_of_range_window(window):
+    with pytest.raises(ValueError):
+        rolling_std(np.arange(50.0), window)